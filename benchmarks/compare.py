@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+"""
+Compare two benchmark result files produced by benchmarks/run.py.
+
+Example:
+    python -m benchmarks.compare baseline.json candidate.json
+"""
+import argparse
+import json
+from typing import Any, Dict, Optional, Tuple
+
+
+def result_key(result: Dict[str, Any]) -> Tuple:
+    return (result["benchmark"],) + tuple(sorted(result["params"].items()))
+
+
+def metrics(result: Dict[str, Any]) -> Dict[str, float]:
+    """Flatten the comparable numbers of one benchmark result."""
+    flat = {
+        "per_minute": result["per_minute"],
+        "latency.p50": result["latency"]["p50"],
+        "latency.p95": result["latency"]["p95"],
+        "latency.p99": result["latency"]["p99"],
+        "errors": result["errors"],
+        "peak_rss_mb": result["peak_rss_mb"],
+    }
+    for key in ("bytes_sent", "bytes_received"):
+        if key in result:
+            flat[key] = result[key]
+    for stage, summary in result.get("stages", {}).items():
+        flat[f"{stage}.p50"] = summary["p50"]
+        flat[f"{stage}.p95"] = summary["p95"]
+    return flat
+
+
+def change(old: float, new: float) -> Optional[float]:
+    return (new - old) / old * 100 if old else None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare two Debate Duel benchmark result files")
+    parser.add_argument("baseline", help="Baseline results JSON")
+    parser.add_argument("candidate", help="Candidate results JSON")
+    args = parser.parse_args()
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    print(f"baseline:  {baseline['meta']['git_commit']}  candidate: {candidate['meta']['git_commit']}")
+    baseline_results = {result_key(result): result for result in baseline["results"]}
+
+    for result in candidate["results"]:
+        key = result_key(result)
+        print(f"\n{result['benchmark']} {dict(result['params'])}")
+        if key not in baseline_results:
+            print("  (no baseline)")
+            continue
+        old_metrics = metrics(baseline_results[key])
+        for name, new in metrics(result).items():
+            if name not in old_metrics:
+                continue
+            old = old_metrics[name]
+            delta = change(old, new)
+            delta_text = f"{delta:+.1f}%" if delta is not None else "n/a"
+            print(f"  {name:<24} {old:>14.3f} -> {new:>14.3f}  {delta_text}")
+
+
+if __name__ == "__main__":
+    main()
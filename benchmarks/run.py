@@ -0,0 +1,335 @@
+#!/usr/bin/env python
+"""
+End-to-end throughput and latency benchmarks for Debate Duel.
+
+Starts the stand-in LLM server (debate_duel.fakellm) and runs two sweeps
+in-process against it:
+
+- argument: DebateAgentManager.generate_argument_async over concurrency x
+  history length, reporting per-stage (plan/research/strategy/write/verify)
+  percentiles for the selected pipeline mode
+- debate: DebateOrchestrator.run_debate over concurrency x num_turns, with the
+  swarm and judge services mounted in-process, reporting debates/min, bytes
+  exchanged with the services and per-stage percentiles including the judge
+
+Results are written as JSON that benchmarks/compare.py can diff between versions.
+
+Example:
+    python -m benchmarks.run --profile fast --concurrency 1,4,16 --turns 1,3 --history 0,2,5 --output bench.json
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import httpx
+
+FAKE_LLM_PORT = 8010
+
+
+def parse_ints(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item.strip()]
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MiB (ru_maxrss is KiB on Linux)."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def start_fake_llm(profile: str, completion_tokens: int, port: int) -> subprocess.Popen:
+    """Start the stand-in LLM server and wait until it answers."""
+    env = os.environ.copy()
+    env["PORT"] = str(port)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "debate_duel.fakellm", "--profile", profile,
+         "--completion-tokens", str(completion_tokens), "--seed", "0"],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://localhost:{port}/", timeout=1.0).raise_for_status()
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("Fake LLM server did not start")
+
+
+def synthetic_history(length: int):
+    """Debate history of the given number of rounds with realistic argument sizes."""
+    from debate_duel.shared.schemas import Turn, JudgeResponse, Winner
+
+    paragraph = (
+        "The evidence from comparable policies shows measurable benefits for the public, "
+        "and the risks raised by the opposition are either overstated or manageable. "
+    ) * 12
+    return [
+        Turn(
+            pro_argument=f"Round {i + 1} pro. {paragraph}",
+            con_argument=f"Round {i + 1} con. {paragraph}",
+            judge_decision=JudgeResponse(
+                winner=Winner.PRO if i % 2 == 0 else Winner.CON,
+                justification="The winning side engaged more directly with the opposing evidence. " * 3
+            )
+        )
+        for i in range(length)
+    ]
+
+
+async def run_concurrently(
+    count: int,
+    concurrency: int,
+    job: Callable[[int], Awaitable[Any]]
+) -> Dict[str, Any]:
+    """Run count jobs with at most concurrency in flight, timing each one."""
+    from debate_duel.shared.metrics import percentile
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    errors = 0
+
+    async def timed(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await job(index)
+            except Exception:
+                errors += 1
+                return
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(i) for i in range(count)))
+    wall = time.perf_counter() - start
+
+    values = sorted(latencies)
+    return {
+        "wall_seconds": wall,
+        "completed": len(values),
+        "errors": errors,
+        "per_minute": len(values) / wall * 60 if wall else 0.0,
+        "latency": {
+            "mean": sum(values) / len(values) if values else 0.0,
+            "p50": percentile(values, 50),
+            "p95": percentile(values, 95),
+            "p99": percentile(values, 99),
+        },
+    }
+
+
+async def bench_arguments(args) -> List[Dict[str, Any]]:
+    from debate_duel.agents.team_debater.manager import DebateAgentManager
+    from debate_duel.shared.metrics import STAGE_METRICS, TOKEN_USAGE
+    from debate_duel.shared.schemas import ArgumentRequest, PipelineMode, Stance
+
+    manager = DebateAgentManager(fused_planning=args.fused_planning)
+    results = []
+    for history_length in args.history:
+        history = synthetic_history(history_length)
+        for concurrency in args.concurrency:
+            STAGE_METRICS.reset()
+            TOKEN_USAGE.reset()
+
+            async def job(index: int):
+                stance = Stance.PRO if index % 2 == 0 else Stance.CON
+                request = ArgumentRequest(
+                    topic=f"{args.topic} #{index}",
+                    stance=stance,
+                    history=history,
+                    pipeline_mode=PipelineMode(args.pipeline_mode)
+                )
+                return await manager.generate_argument_async(request)
+
+            count = max(args.requests, concurrency)
+            stats = await run_concurrently(count, concurrency, job)
+            results.append({
+                "benchmark": "argument",
+                "params": {"concurrency": concurrency, "history": history_length, "requests": count},
+                **stats,
+                "stages": STAGE_METRICS.summary(),
+                "token_usage": TOKEN_USAGE.summary(),
+                "peak_rss_mb": peak_rss_mb(),
+            })
+            print(f"argument history={history_length} concurrency={concurrency}: "
+                  f"{stats['per_minute']:.1f}/min p50={stats['latency']['p50']:.2f}s", file=sys.stderr)
+    return results
+
+
+class WireCounter:
+    """httpx event hooks that count request and response body bytes."""
+
+    def __init__(self):
+        self.sent = 0
+        self.received = 0
+
+    async def on_request(self, request: httpx.Request) -> None:
+        self.sent += len(request.content)
+
+    async def on_response(self, response: httpx.Response) -> None:
+        await response.aread()
+        self.received += len(response.content)
+
+
+async def bench_debates(args) -> List[Dict[str, Any]]:
+    from debate_duel.agents.judge_api import app as judge_app
+    from debate_duel.agents.swarm_api import app as swarm_app
+    from debate_duel.arena.orchestrator import DebateOrchestrator
+    from debate_duel.settings.constants import SERVICE_URLS
+    from debate_duel.shared.metrics import STAGE_METRICS, TOKEN_USAGE
+    from debate_duel.shared.schemas import TopicRequest
+
+    results = []
+    for num_turns in args.turns:
+        for concurrency in args.concurrency:
+            STAGE_METRICS.reset()
+            TOKEN_USAGE.reset()
+            wire = WireCounter()
+            client = httpx.AsyncClient(
+                timeout=None,
+                mounts={
+                    SERVICE_URLS["swarm_a"]: httpx.ASGITransport(app=swarm_app),
+                    SERVICE_URLS["swarm_b"]: httpx.ASGITransport(app=swarm_app),
+                    SERVICE_URLS["judge"]: httpx.ASGITransport(app=judge_app),
+                },
+                event_hooks={"request": [wire.on_request], "response": [wire.on_response]}
+            )
+            orchestrator = DebateOrchestrator(client=client)
+
+            async def job(index: int):
+                return await orchestrator.run_debate(
+                    TopicRequest(
+                        topic=f"{args.topic} #{index}",
+                        num_turns=num_turns,
+                        speculative=args.speculative,
+                        deadline_seconds=args.deadline
+                    )
+                )
+
+            count = max(args.debates, concurrency)
+            try:
+                stats = await run_concurrently(count, concurrency, job)
+            finally:
+                await orchestrator.close()
+
+            results.append({
+                "benchmark": "debate",
+                "params": {"concurrency": concurrency, "num_turns": num_turns, "debates": count},
+                **stats,
+                "bytes_sent": wire.sent,
+                "bytes_received": wire.received,
+                "stages": STAGE_METRICS.summary(),
+                "token_usage": TOKEN_USAGE.summary(),
+                "peak_rss_mb": peak_rss_mb(),
+            })
+            print(f"debate turns={num_turns} concurrency={concurrency}: "
+                  f"{stats['per_minute']:.1f}/min p50={stats['latency']['p50']:.2f}s", file=sys.stderr)
+    return results
+
+
+async def run_benchmarks(args) -> Dict[str, Any]:
+    results = []
+    if args.suite in ("argument", "all"):
+        results.extend(await bench_arguments(args))
+    if args.suite in ("debate", "all"):
+        results.extend(await bench_debates(args))
+    return {
+        "meta": {
+            "git_commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "profile": args.profile,
+            "completion_tokens": args.completion_tokens,
+            "swarm_agent": args.swarm_agent,
+            "pipeline_mode": args.pipeline_mode,
+            "fused_planning": args.fused_planning,
+            "cache": args.cache,
+            "speculative": args.speculative,
+            "deadline": args.deadline,
+        },
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Debate Duel against the stand-in LLM server")
+    parser.add_argument("--suite", choices=["argument", "debate", "all"], default="all",
+                        help="Which benchmarks to run")
+    parser.add_argument("--profile", default="fast",
+                        help="Fake LLM latency profile (instant, fast, realistic, slow)")
+    parser.add_argument("--completion-tokens", type=int, default=300,
+                        help="Mean completion length returned by the fake LLM")
+    parser.add_argument("--concurrency", type=parse_ints, default=[1, 4, 16],
+                        help="Comma-separated concurrency levels")
+    parser.add_argument("--turns", type=parse_ints, default=[1, 3],
+                        help="Comma-separated num_turns values for the debate benchmark")
+    parser.add_argument("--history", type=parse_ints, default=[0, 2, 5],
+                        help="Comma-separated history lengths for the argument benchmark")
+    parser.add_argument("--requests", type=int, default=16,
+                        help="Arguments generated per argument configuration")
+    parser.add_argument("--debates", type=int, default=8,
+                        help="Debates run per debate configuration")
+    parser.add_argument("--swarm-agent", choices=["single", "team"], default="team",
+                        help="Agent behind the swarm services in the debate benchmark")
+    parser.add_argument("--pipeline-mode", choices=["fast", "balanced", "full"], default="full",
+                        help="Stages the team pipeline runs")
+    parser.add_argument("--fused-planning", action="store_true",
+                        help="Plan and strategize in one fused call instead of two stages")
+    parser.add_argument("--cache", action="store_true",
+                        help="Keep the LLM response cache enabled (disabled by default)")
+    parser.add_argument("--speculative", action="store_true",
+                        help="Prepare each debate's next turn while the judge runs")
+    parser.add_argument("--deadline", type=float,
+                        help="Seconds each debate may take in the debate benchmark")
+    parser.add_argument("--topic", default="Should open-source AI models be regulated?",
+                        help="Base debate topic")
+    parser.add_argument("--port", type=int, default=FAKE_LLM_PORT,
+                        help="Port for the fake LLM server")
+    parser.add_argument("--output", help="Write JSON results to this file instead of stdout")
+    args = parser.parse_args()
+
+    server = start_fake_llm(args.profile, args.completion_tokens, args.port)
+    try:
+        # Settings are read when debate_duel is first imported, so configure them first
+        os.environ["FAKE_LLM_URL"] = f"http://localhost:{args.port}/v1"
+        os.environ["SWARM_AGENT"] = args.swarm_agent
+        os.environ["SWARM_PIPELINE_MODE"] = args.pipeline_mode
+        os.environ["SWARM_FUSED_PLANNING"] = "true" if args.fused_planning else "false"
+        os.environ.setdefault("LLM_MAX_CONCURRENCY", "1024")
+        if not args.cache:
+            os.environ["LLM_CACHE_AGENTS"] = ""
+
+        report = asyncio.run(run_benchmarks(args))
+    finally:
+        server.terminate()
+        server.wait()
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+        print(f"Results saved to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
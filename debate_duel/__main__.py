@@ -1,3 +1,4 @@
+import argparse
 import subprocess
 import sys
 import os
@@ -24,6 +25,11 @@ def main():
     This is for development purposes only.
     In production, each service should be deployed as a separate container.
     """
+    parser = argparse.ArgumentParser(description="Start all Debate Duel services")
+    parser.add_argument("--fake-llm", action="store_true",
+                        help="Also start the stand-in LLM server and point every agent at it")
+    args = parser.parse_args()
+    
     # Register cleanup handler
     atexit.register(kill_processes)
     
@@ -38,9 +44,14 @@ def main():
         {"name": "Judge", "module": "debate_duel.agents.judge", "port": 8003},
     ]
     
+    base_env = os.environ.copy()
+    if args.fake_llm:
+        services.insert(0, {"name": "Fake LLM", "module": "debate_duel.fakellm", "port": 8010})
+        base_env["FAKE_LLM_URL"] = "http://localhost:8010/v1"
+    
     for service in services:
         cmd = [python, "-m", service["module"]]
-        env = os.environ.copy()
+        env = base_env.copy()
         env["PORT"] = str(service["port"])
         
         print(f"Starting {service['name']} on port {service['port']}...")
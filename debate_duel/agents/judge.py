@@ -1,22 +1,63 @@
-from openai import OpenAI
+import asyncio
+import json
+from typing import List, Optional, Union
 
-from debate_duel.settings.constants import OPENAI_MODEL
+from debate_duel.settings.constants import (
+    OPENAI_MODEL,
+    OPENAI_ASYNC_CLIENT,
+    JUDGE_BATCH_MODE,
+    JUDGE_PANEL_SIZE,
+    JUDGE_PANEL_TEMPERATURE
+)
+from debate_duel.shared.deadlines import DEGRADATIONS, DeadlineExceeded, budget, within_deadline
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.metrics import STAGE_METRICS
+from debate_duel.shared.prompts import PromptBuilder
 from debate_duel.shared.schemas import JudgeRequest, JudgeResponse, Winner
 
 
 class JudgeAgent:
     def __init__(self):
-        self.client = OpenAI()
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("judge")
     
     def judge_debate(self, request: JudgeRequest) -> JudgeResponse:
+        """
+        Synchronous wrapper around judge_debate_async.
+        """
+        return run_sync(self.judge_debate_async(request))
+    
+    async def judge_debate_async(self, request: JudgeRequest) -> JudgeResponse:
         """
         Judge a debate round based on the pro and con arguments.
         
+        With a panel size above one (request.panel_size, or JUDGE_PANEL_SIZE),
+        the round is judged by a panel instead of a single judge.
+        
         Args:
             request: The request containing the topic and arguments
             
         Returns:
             A judgment with winner and justification
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before any verdict is in
+        """
+        panel_size = request.panel_size or JUDGE_PANEL_SIZE
+        if panel_size > 1:
+            return await self._judge_panel(request, panel_size)
+        async with within_deadline():
+            return await self._judge_once(request)
+    
+    async def _judge_once(
+        self,
+        request: JudgeRequest,
+        temperature: float = 0.2,
+        seed: Optional[int] = None
+    ) -> JudgeResponse:
+        """
+        Judge a round with a single LLM call.
         """
         topic = request.topic
         pro_argument = request.pro_argument
@@ -25,16 +66,24 @@ class JudgeAgent:
         # Construct the prompt
         prompt = self._build_prompt(topic, pro_argument, con_argument)
         
+        # Panel seats pass a seed, which also keeps their cache entries apart
+        extra = {"seed": seed} if seed is not None else {}
+        
         # Call the OpenAI API
-        response = self.client.chat.completions.create(
-            model=OPENAI_MODEL,
-            messages=[
-                {"role": "system", "content": self._get_system_prompt()},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.2,
-            max_tokens=1024
-        )
+        with STAGE_METRICS.time("judge"):
+            response = await create_chat_completion(
+                self.client,
+                cache=self.cache,
+                agent="judge",
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=temperature,
+                max_tokens=1024,
+                **extra
+            )
         
         content = response.choices[0].message.content
         
@@ -46,6 +95,168 @@ class JudgeAgent:
             justification=justification
         )
     
+    async def _judge_panel(self, request: JudgeRequest, panel_size: int) -> JudgeResponse:
+        """
+        Judge a round with a panel of independent judges voting on the winner.
+        
+        All judges start at once, and the outstanding ones are cancelled as soon
+        as the remaining votes can no longer change the outcome, or when the
+        deadline comes, in which case the votes cast so far decide. A panel
+        that ends level between its top choices declares a tie.
+        
+        Args:
+            request: The request containing the topic and arguments
+            panel_size: Number of judges on the panel
+            
+        Returns:
+            The panel's judgment, with the vote split and the share of the
+            votes cast for the declared outcome as confidence; for a tie
+            declared on a split vote that is the share of explicit tie votes
+        """
+        votes = {winner: 0 for winner in Winner}
+        justifications = {}
+        remaining = panel_size
+        
+        tasks = [
+            asyncio.create_task(self._judge_once(request, temperature=JUDGE_PANEL_TEMPERATURE, seed=seat))
+            for seat in range(panel_size)
+        ]
+        timeout = asyncio.timeout(budget(1.0, 1.0))
+        try:
+            async with timeout:
+                with STAGE_METRICS.time("judge_panel"):
+                    for next_done in asyncio.as_completed(tasks):
+                        remaining -= 1
+                        try:
+                            verdict = await next_done
+                        except Exception:
+                            # A failed judge abstains
+                            verdict = None
+                        if verdict is not None:
+                            votes[verdict.winner] += 1
+                            justifications.setdefault(verdict.winner, verdict.justification)
+                        
+                        ranked = sorted(votes.values(), reverse=True)
+                        if ranked[0] > ranked[1] + remaining:
+                            break
+        except TimeoutError:
+            if not timeout.expired():
+                raise
+            DEGRADATIONS["judge_panel_cut_short"] += 1
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        cast = sum(votes.values())
+        if cast == 0:
+            if timeout.expired():
+                raise DeadlineExceeded("The deadline passed before any judge on the panel voted")
+            raise RuntimeError("Every judge on the panel failed")
+        
+        top = max(votes.values())
+        leaders = [winner for winner, count in votes.items() if count == top]
+        if len(leaders) == 1:
+            winner = leaders[0]
+            justification = justifications[winner]
+        else:
+            winner = Winner.TIE
+            justification = "The panel was split. " + " ".join(
+                f"{leader.value.upper()}: {justifications[leader]}" for leader in leaders
+            )
+        
+        return JudgeResponse(
+            winner=winner,
+            justification=justification,
+            confidence=votes[winner] / cast,
+            votes={winner.value: count for winner, count in votes.items()}
+        )
+    
+    async def judge_batch_async(
+        self,
+        requests: List[JudgeRequest],
+        combined: bool = JUDGE_BATCH_MODE == "combined"
+    ) -> List[Union[JudgeResponse, Exception]]:
+        """
+        Judge several debate rounds at once.
+        
+        Args:
+            requests: The rounds to judge
+            combined: Judge all rounds in one multi-verdict call instead of one
+                concurrent call per round
+            
+        Returns:
+            A JudgeResponse, or the exception that prevented one, per request in order
+        """
+        # Rounds judged by a panel are never combined
+        single = [index for index, request in enumerate(requests) if (request.panel_size or JUDGE_PANEL_SIZE) == 1]
+        if not combined or len(single) < 2:
+            return await asyncio.gather(
+                *(self.judge_debate_async(request) for request in requests), return_exceptions=True
+            )
+        
+        try:
+            combined_verdicts = await self._judge_combined([requests[index] for index in single])
+            verdicts = {single[index]: verdict for index, verdict in combined_verdicts.items()}
+        except Exception:
+            verdicts = {}
+        
+        # Rounds the combined call did not return a usable verdict for are judged on their own
+        missing = [index for index in range(len(requests)) if index not in verdicts]
+        fallback = await asyncio.gather(
+            *(self.judge_debate_async(requests[index]) for index in missing), return_exceptions=True
+        )
+        verdicts.update(zip(missing, fallback))
+        return [verdicts[index] for index in range(len(requests))]
+    
+    async def _judge_combined(self, requests: List[JudgeRequest]) -> dict:
+        """
+        Judge all requests in a single JSON call, returning verdicts by request index.
+        """
+        prompt = "".join(
+            f"### Round {index + 1}\n" + self._build_round(request.topic, request.pro_argument, request.con_argument)
+            for index, request in enumerate(requests)
+        )
+        
+        with STAGE_METRICS.time("judge_batch"):
+            response = await create_chat_completion(
+                self.client,
+                cache=self.cache,
+                agent="judge",
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt() + " " + self._get_batch_instructions()},
+                    {"role": "user", "content": prompt}
+                ],
+                response_format={"type": "json_object"},
+                temperature=0.2,
+                max_tokens=512 * len(requests)
+            )
+        
+        verdicts = {}
+        for verdict in json.loads(response.choices[0].message.content).get("verdicts", []):
+            try:
+                index = int(verdict["round"]) - 1
+                winner = Winner(str(verdict["winner"]).strip().lower())
+            except (KeyError, TypeError, ValueError):
+                continue
+            if 0 <= index < len(requests):
+                verdicts[index] = JudgeResponse(
+                    winner=winner,
+                    justification=str(verdict.get("justification") or "No justification provided.")
+                )
+        return verdicts
+    
+    def _get_batch_instructions(self) -> str:
+        """
+        Output format for judging several rounds in one call.
+        """
+        return (
+            "You will be given several independent debate rounds, each under a \"### Round N\" heading. "
+            "Judge each round on its own merits. Respond with a JSON object of the form "
+            "{\"verdicts\": [{\"round\": N, \"winner\": \"pro|con|tie\", \"justification\": \"...\"}]} "
+            "with exactly one verdict per round."
+        )
+    
     def _get_system_prompt(self) -> str:
         """
         Get the system prompt for the judge.
@@ -61,17 +272,25 @@ class JudgeAgent:
         """
         Build the prompt for the LLM.
         """
-        prompt = f"Topic: {topic}\n\n"
-        prompt += "Pro Argument:\n" + pro_argument + "\n\n"
-        prompt += "Con Argument:\n" + con_argument + "\n\n"
-        prompt += (
+        prompt = PromptBuilder(topic)
+        prompt.volatile(self._format_arguments(pro_argument, con_argument))
+        prompt.volatile(
             "Please evaluate both arguments and determine which side made the stronger case.\n"
             "Your response must follow this format exactly:\n\n"
             "Winner: [pro|con|tie]\n"
             "Justification: [Your detailed justification for the decision]"
         )
         
-        return prompt
+        return prompt.build()
+    
+    def _build_round(self, topic: str, pro_argument: str, con_argument: str) -> str:
+        """
+        Render one round of a combined judging prompt.
+        """
+        return f"Topic: {topic}\n\n" + self._format_arguments(pro_argument, con_argument)
+    
+    def _format_arguments(self, pro_argument: str, con_argument: str) -> str:
+        return "Pro Argument:\n" + pro_argument + "\n\n" + "Con Argument:\n" + con_argument + "\n\n"
     
     def _parse_response(self, content: str) -> tuple[Winner, str]:
         """
@@ -1,22 +1,97 @@
+from typing import Union
+
 from fastapi import FastAPI, HTTPException
 
-from debate_duel.shared.schemas import JudgeRequest, JudgeResponse
+from debate_duel.settings.constants import JUDGE_BATCH_MAX_SIZE, JUDGE_BATCH_WINDOW_MS
+from debate_duel.shared.batching import MicroBatcher
+from debate_duel.shared.deadlines import (
+    DEGRADATIONS,
+    DeadlineExceeded,
+    deadline_middleware,
+    deadline_scope,
+    within_deadline
+)
+from debate_duel.shared.llm import RATE_LIMITER
+from debate_duel.shared.llm_cache import RESPONSE_CACHE
+from debate_duel.shared.metrics import STAGE_METRICS, TOKEN_USAGE
+from debate_duel.shared.schemas import (
+    JudgeRequest,
+    JudgeResponse,
+    JudgeBatchRequest,
+    JudgeBatchItem,
+    JudgeBatchResponse
+)
 from debate_duel.agents.judge import JudgeAgent
 
 
 app = FastAPI()
+app.middleware("http")(deadline_middleware)
 judge_agent = JudgeAgent()
 
+# Groups /judge requests from concurrent debates when JUDGE_BATCH_WINDOW_MS is set
+judge_batcher = MicroBatcher(
+    judge_agent.judge_batch_async,
+    max_batch_size=JUDGE_BATCH_MAX_SIZE,
+    max_wait=JUDGE_BATCH_WINDOW_MS / 1000
+) if JUDGE_BATCH_WINDOW_MS > 0 else None
+
 
 @app.post("/judge", response_model=JudgeResponse)
 async def judge_debate(request: JudgeRequest) -> JudgeResponse:
     """
     Judge a debate round based on the provided topic and arguments.
     
+    An X-Debate-Deadline header bounds the time spent; a panel is then cut
+    short at the deadline and decided by the votes cast so far. When nothing
+    can be decided in time the response is a 504.
+    
     Returns:
         A JudgeResponse with the winner and justification.
     """
     try:
-        return judge_agent.judge_debate(request)
+        if judge_batcher is not None:
+            # A batch serves several debates, so only this request's wait is
+            # bounded by its deadline
+            async with within_deadline():
+                with deadline_scope(None):
+                    return await judge_batcher.submit(request)
+        return await judge_agent.judge_debate_async(request)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=f"Error judging debate: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error judging debate: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error judging debate: {str(e)}") 
+
+
+@app.post("/judge/batch", response_model=JudgeBatchResponse)
+async def judge_batch(batch: JudgeBatchRequest) -> JudgeBatchResponse:
+    """
+    Judge several debate rounds in one request.
+    
+    Returns:
+        A JudgeBatchResponse with a result per request, in order; a round that
+        could not be judged carries an error instead of failing the batch.
+    """
+    results = await judge_agent.judge_batch_async(batch.requests)
+    return JudgeBatchResponse(results=[batch_item(result) for result in results])
+
+
+def batch_item(result: Union[JudgeResponse, Exception]) -> JudgeBatchItem:
+    if isinstance(result, Exception):
+        return JudgeBatchItem(error=f"Error judging debate: {str(result)}")
+    return JudgeBatchItem(response=result)
+
+
+@app.get("/metrics")
+async def metrics() -> dict:
+    """
+    Report LLM cache, rate limiter, batching, deadline degradation, stage
+    latency and token usage statistics for this process.
+    """
+    return {
+        "batching": judge_batcher.stats() if judge_batcher is not None else None,
+        "degradations": dict(DEGRADATIONS),
+        "llm_cache": RESPONSE_CACHE.stats(),
+        "rate_limiter": RATE_LIMITER.stats(),
+        "stages": STAGE_METRICS.summary(),
+        "token_usage": TOKEN_USAGE.summary(),
+    }
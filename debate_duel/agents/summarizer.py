@@ -0,0 +1,74 @@
+from typing import Optional
+
+from debate_duel.settings.constants import OPENAI_MODEL, OPENAI_ASYNC_CLIENT
+from debate_duel.shared.history import format_round
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.metrics import STAGE_METRICS
+from debate_duel.shared.prompts import PromptBuilder
+from debate_duel.shared.schemas import Turn
+
+
+class SummarizerAgent:
+    def __init__(self):
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("summarizer")
+
+    def fold_round(self, topic: str, summary: Optional[str], turn: Turn, round_index: int) -> str:
+        """
+        Synchronous wrapper around fold_round_async.
+        """
+        return run_sync(self.fold_round_async(topic, summary, turn, round_index))
+
+    async def fold_round_async(self, topic: str, summary: Optional[str], turn: Turn, round_index: int) -> str:
+        """
+        Fold one debate round into the running summary of earlier rounds.
+
+        Args:
+            topic: The debate topic
+            summary: The current running summary, or None if nothing has been summarized yet
+            turn: The round leaving the verbatim memory window
+            round_index: Zero-based index of that round in the debate
+
+        Returns:
+            The updated running summary
+        """
+        prompt = self._build_prompt(topic, summary, turn, round_index)
+
+        with STAGE_METRICS.time("summarize"):
+            response = await create_chat_completion(
+                self.client,
+                cache=self.cache,
+                agent="summarizer",
+                model=OPENAI_MODEL,
+                messages=[
+                    {"role": "system", "content": self._get_system_prompt()},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.2,
+                max_tokens=400
+            )
+
+        return response.choices[0].message.content.strip()
+
+    def _get_system_prompt(self) -> str:
+        """
+        Get the system prompt for the summarizer.
+        """
+        return (
+            "You maintain a running summary of a debate. Given the current summary and the next round, "
+            "produce an updated summary that keeps each side's main claims, key evidence, the rebuttals "
+            "exchanged and the judge's verdicts, while dropping rhetoric and repetition. "
+            "Keep the summary under 300 words no matter how many rounds it covers."
+        )
+
+    def _build_prompt(self, topic: str, summary: Optional[str], turn: Turn, round_index: int) -> str:
+        """
+        Build the prompt for the LLM.
+        """
+        prompt = PromptBuilder(topic)
+        prompt.volatile("Current summary:\n" + (summary or "(none yet)") + "\n\n")
+        prompt.volatile("Next round:\n" + format_round(round_index, turn, "PRO", "CON"))
+        prompt.volatile("Return only the updated summary.")
+
+        return prompt.build()
@@ -1,15 +1,27 @@
-from openai import OpenAI
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from debate_duel.settings.constants import OPENAI_MODEL, OPENAI_CLIENT
+from debate_duel.settings.constants import OPENAI_MODEL, OPENAI_ASYNC_CLIENT
+from debate_duel.shared.deadlines import within_deadline
+from debate_duel.shared.llm import create_chat_completion, stream_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.history import format_history
+from debate_duel.shared.metrics import STAGE_METRICS
+from debate_duel.shared.prompts import PromptBuilder
 from debate_duel.shared.schemas import ArgumentRequest, Turn, Stance
 
 
 class DebateAgent:
     def __init__(self):
-        self.client = OPENAI_CLIENT
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("debater")
     
     def generate_argument(self, request: ArgumentRequest) -> str:
+        """
+        Synchronous wrapper around generate_argument_async.
+        """
+        return run_sync(self.generate_argument_async(request))
+    
+    async def generate_argument_async(self, request: ArgumentRequest) -> str:
         """
         Generate an argument for the given topic based on the debate history.
         
@@ -24,10 +36,57 @@ class DebateAgent:
         history = request.history
         
         # Construct prompt based on stance and history
-        prompt = self._build_prompt(topic, stance, history)
+        prompt = self._build_prompt(
+            topic, stance, history, request.memory_window, request.history_summary, request.debate_id
+        )
+        
+        # Call the OpenAI API, giving up when the debate's deadline passes
+        async with within_deadline():
+            with STAGE_METRICS.time("debate_agent"):
+                response = await create_chat_completion(
+                    self.client,
+                    cache=self.cache,
+                    agent="debater",
+                    model=OPENAI_MODEL,
+                    messages=[
+                        {"role": "system", "content": self._get_system_prompt(stance)},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.7,
+                    max_tokens=1024
+                )
+        
+        return response.choices[0].message.content
+    
+    def prepare_argument(self, request: ArgumentRequest) -> None:
+        """
+        Speculative preparation hook; the single-call agent has no stages that
+        can run before the latest verdict is known, so this does nothing.
+        """
+    
+    async def stream_argument(self, request: ArgumentRequest) -> AsyncIterator[str]:
+        """
+        Generate an argument like generate_argument_async, yielding tokens as
+        the model produces them. Each wait for the next tokens is bounded by
+        the debate's deadline, but not the consumer's handling of a chunk.
         
-        # Call the OpenAI API
-        response = self.client.chat.completions.create(
+        Args:
+            request: The request containing topic, stance, and debate history
+            
+        Yields:
+            Chunks of the generated argument
+        
+        Raises:
+            DeadlineExceeded: If the deadline passes before the argument is complete
+        """
+        stance = request.stance
+        prompt = self._build_prompt(
+            request.topic, stance, request.history, request.memory_window, request.history_summary, request.debate_id
+        )
+        
+        stream = stream_chat_completion(
+            self.client,
+            agent="debater",
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": self._get_system_prompt(stance)},
@@ -36,8 +95,18 @@ class DebateAgent:
             temperature=0.7,
             max_tokens=1024
         )
-        
-        return response.choices[0].message.content
+        with STAGE_METRICS.time("debate_agent"):
+            try:
+                while True:
+                    # The deadline only covers the wait, as a timeout must not span a yield
+                    async with within_deadline():
+                        try:
+                            delta = await anext(stream)
+                        except StopAsyncIteration:
+                            break
+                    yield delta
+            finally:
+                await stream.aclose()
     
     def _get_system_prompt(self, stance: Stance) -> str:
         """
@@ -56,29 +125,29 @@ class DebateAgent:
                 "Address counterarguments from the opposition and highlight flaws in their reasoning."
             )
     
-    def _build_prompt(self, topic: str, stance: Stance, history: List[Turn]) -> str:
+    def _build_prompt(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> str:
         """
         Build the prompt for the LLM based on the debate history.
         """
-        prompt = f"Topic: {topic}\n\n"
+        prompt = PromptBuilder(topic)
         
         if not history:
-            prompt += f"You are arguing {'for' if stance == Stance.PRO else 'against'} this topic. This is the first round of the debate. "
-            prompt += "Make a strong opening argument.\n"
+            prompt.volatile(f"You are arguing {'for' if stance == Stance.PRO else 'against'} this topic. This is the first round of the debate. ")
+            prompt.volatile("Make a strong opening argument.\n")
         else:
-            prompt += "Debate history:\n\n"
-            
-            for i, turn in enumerate(history):
-                prompt += f"Round {i+1}:\n"
-                prompt += f"Pro: {turn.pro_argument}\n\n"
-                prompt += f"Con: {turn.con_argument}\n\n"
-                
-                if turn.judge_decision:
-                    prompt += f"Judge: Winner: {turn.judge_decision.winner}\n"
-                    prompt += f"Justification: {turn.judge_decision.justification}\n\n"
+            prompt.stable("Debate history:\n\n")
+            prompt.stable(format_history(history, memory_window, history_summary, debate_id=debate_id))
             
-            prompt += f"\nYou are arguing {'for' if stance == Stance.PRO else 'against'} this topic. "
-            prompt += "Based on the debate history, provide your next argument. "
-            prompt += "Focus on rebutting your opponent's points and strengthening your position.\n"
+            prompt.volatile(f"\nYou are arguing {'for' if stance == Stance.PRO else 'against'} this topic. ")
+            prompt.volatile("Based on the debate history, provide your next argument. ")
+            prompt.volatile("Focus on rebutting your opponent's points and strengthening your position.\n")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build()
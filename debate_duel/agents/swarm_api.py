@@ -1,8 +1,21 @@
+import json
+from typing import AsyncIterator
+
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from debate_duel.shared.schemas import ArgumentRequest
+from debate_duel.shared.deadlines import DEGRADATIONS, DeadlineExceeded, deadline_middleware
+from debate_duel.shared.llm import RATE_LIMITER
+from debate_duel.shared.llm_cache import RESPONSE_CACHE
+from debate_duel.shared.metrics import STAGE_METRICS, TOKEN_USAGE
+from debate_duel.shared.openings import OpeningPool
+from debate_duel.shared.research_store import RESEARCH_STORE
+from debate_duel.shared.schemas import ArgumentRequest, Stance, WarmupRequest
+from debate_duel.shared.sessions import SESSION_STORE, SessionMiss
+from debate_duel.settings.constants import SWARM_AGENT
 from debate_duel.agents.swarm import DebateAgent
+from debate_duel.agents.team_swarm import TeamSwarmAgent
 
 
 class ArgumentResponse(BaseModel):
@@ -10,19 +23,135 @@ class ArgumentResponse(BaseModel):
 
 
 app = FastAPI()
-swarm_agent = DebateAgent()
+app.middleware("http")(deadline_middleware)
+swarm_agent = TeamSwarmAgent() if SWARM_AGENT == "team" else DebateAgent()
+opening_pool = OpeningPool(swarm_agent.generate_argument_async)
 
 
 @app.post("/generate_argument", response_model=ArgumentResponse)
-async def generate_argument(request: ArgumentRequest) -> ArgumentResponse:
+async def generate_argument(request: ArgumentRequest, stream: bool = False):
     """
     Generate a debate argument based on the provided topic, stance, and history.
     
+    With ?stream=true the argument is streamed as newline-delimited JSON
+    objects, {"delta": "..."} per chunk of tokens, ending with {"done": true}
+    or {"error": "..."}, which carries "deadline": true when the argument
+    could not be finished before the deadline.
+    
+    Requests with a debate_id only carry the turns from history_offset on;
+    the rest comes from this service's session store. If the session is
+    gone the response is a 409 and the caller should resend the full history.
+    
+    With use_opening_pool set, the first argument of a debate is taken from
+    the openings warmed up with /warmup when one is ready.
+    
+    An X-Debate-Deadline header budgets the pipeline's stages: optional ones
+    are skipped or cut short to answer in time, and if even the draft cannot
+    be written in time the response is a 504.
+    
     Returns:
         An ArgumentResponse containing the generated argument.
     """
     try:
-        argument = swarm_agent.generate_argument(request)
+        request = SESSION_STORE.resolve(request)
+    except SessionMiss as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    if request.use_opening_pool and OpeningPool.is_opening(request):
+        opening = opening_pool.draw(request)
+        if opening is not None:
+            if stream:
+                return StreamingResponse(stream_opening(opening), media_type="application/x-ndjson")
+            return ArgumentResponse(content=opening)
+    
+    if stream:
+        return StreamingResponse(stream_argument(request), media_type="application/x-ndjson")
+    
+    try:
+        argument = await swarm_agent.generate_argument_async(request)
         return ArgumentResponse(content=argument)
+    except DeadlineExceeded as e:
+        raise HTTPException(status_code=504, detail=f"Error generating argument: {str(e)}")
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error generating argument: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error generating argument: {str(e)}")
+
+
+@app.post("/prepare_argument", status_code=202)
+async def prepare_argument(request: ArgumentRequest) -> dict:
+    """
+    Start the parts of an upcoming argument that do not depend on the latest
+    verdict (planning and research in the team pipeline) in the background.
+    
+    The latest round in the history may still lack its judge decision. The
+    session is not updated, and a following /generate_argument with the same
+    debate picks the prepared work up.
+    """
+    try:
+        request = SESSION_STORE.resolve(request, record=False)
+    except SessionMiss as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    
+    swarm_agent.prepare_argument(request)
+    return {"status": "accepted"}
+
+
+@app.post("/warmup", status_code=202)
+async def warmup(request: WarmupRequest) -> dict:
+    """
+    Precompute opening arguments for a topic in the background.
+    
+    Keeps request.count openings ready per stance for debates that ask for a
+    pooled opening; each one drawn is replaced with a freshly generated one.
+    
+    Returns:
+        The number of openings scheduled per stance.
+    """
+    stances = [request.stance] if request.stance else list(Stance)
+    scheduled = {
+        stance.value: opening_pool.warm(
+            ArgumentRequest(topic=request.topic, stance=stance, pipeline_mode=request.pipeline_mode),
+            request.count
+        )
+        for stance in stances
+    }
+    return {"status": "accepted", "scheduled": scheduled}
+
+
+async def stream_opening(opening: str) -> AsyncIterator[str]:
+    """Send a pooled opening in the newline-delimited JSON stream format."""
+    yield json.dumps({"delta": opening}) + "\n"
+    yield json.dumps({"done": True}) + "\n"
+
+
+async def stream_argument(request: ArgumentRequest) -> AsyncIterator[str]:
+    """Format the swarm agent's token stream as newline-delimited JSON."""
+    try:
+        async for delta in swarm_agent.stream_argument(request):
+            yield json.dumps({"delta": delta}) + "\n"
+    except DeadlineExceeded as e:
+        yield json.dumps({"error": f"Error generating argument: {str(e)}", "deadline": True}) + "\n"
+        return
+    except Exception as e:
+        yield json.dumps({"error": f"Error generating argument: {str(e)}"}) + "\n"
+        return
+    yield json.dumps({"done": True}) + "\n"
+
+
+@app.get("/metrics")
+async def metrics() -> dict:
+    """
+    Report LLM cache, rate limiter, research cache, opening pool, session,
+    deadline degradation, stage latency and token usage (per agent and per
+    pipeline mode) statistics for this process.
+    """
+    return {
+        "degradations": dict(DEGRADATIONS),
+        "llm_cache": RESPONSE_CACHE.stats(),
+        "rate_limiter": RATE_LIMITER.stats(),
+        "research_cache": RESEARCH_STORE.stats(),
+        "openings": opening_pool.stats(),
+        "sessions": SESSION_STORE.stats(),
+        "stages": STAGE_METRICS.summary(),
+        "token_usage": TOKEN_USAGE.summary(),
+        "token_usage_by_mode": TOKEN_USAGE.scope_summary(),
+    }
@@ -0,0 +1,138 @@
+"""
+Plan-strategist agent that plans and strategizes the argument in a single call
+"""
+import json
+from typing import Dict, List, Any, Optional, Tuple
+from debate_duel.shared.schemas import Stance, Turn
+from debate_duel.shared.history import format_history
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
+from debate_duel.settings.constants import OPENAI_ASYNC_CLIENT, OPENAI_MODEL
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+
+# Keys of the planner's and the strategist's output, as the writer and printer consume them
+PLAN_KEYS = ("overall_approach", "points", "opponent_weaknesses", "anticipated_counterarguments")
+STRATEGY_KEYS = (
+    "key_messaging", "argument_structure", "rhetorical_techniques",
+    "rebuttal_strategies", "evidence_prioritization"
+)
+
+
+class PlanStrategistAgent:
+    """
+    Agent that fuses the planner and strategist stages, producing the plan and
+    the strategy in one structured response to save a round trip per argument.
+    """
+    
+    def __init__(self):
+        """Initialize the plan-strategist agent"""
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("plan_strategist")
+    
+    def create_plan_and_strategy(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Synchronous wrapper around create_plan_and_strategy_async"""
+        return run_sync(
+            self.create_plan_and_strategy_async(topic, stance, history, memory_window, history_summary, debate_id)
+        )
+    
+    async def create_plan_and_strategy_async(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Create the plan and the strategy for the next argument in one call.
+        
+        Unlike the two-stage flow, the strategy is developed before research,
+        so it draws on the debate itself; the writer still receives the research.
+        
+        Args:
+            topic: The debate topic
+            stance: PRO or CON stance
+            history: List of previous debate turns
+            memory_window: Number of recent rounds to include verbatim, or None for all
+            history_summary: Running summary of the rounds before the memory window
+            debate_id: The debate the history belongs to, to reuse its rendered rounds
+            
+        Returns:
+            The plan and the strategy dictionaries, with the same keys as the
+            planner's and the strategist's output
+        """
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="plan_strategist",
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": self._build_prompt(topic, stance, history, memory_window, history_summary, debate_id)}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.6
+        )
+        
+        fused = json.loads(response.choices[0].message.content)
+        plan = {key: fused[key] for key in PLAN_KEYS if key in fused}
+        strategy = {key: fused[key] for key in STRATEGY_KEYS if key in fused}
+        plan.setdefault("points", [])
+        
+        return plan, strategy
+    
+    def _get_system_prompt(self) -> str:
+        """Get the system prompt for the plan-strategist agent"""
+        return clean_prompt("""
+        You are a debate planning and strategy specialist. Your role is to analyze the debate topic
+        and history, identify the key areas the next argument must address, and decide how to argue them.
+        
+        Your response should be a well-structured JSON object containing:
+        1. "overall_approach": A one-sentence summary of the general approach
+        2. "points": A list of 3-5 key points that should be addressed
+        3. "opponent_weaknesses": A list of weaknesses in the opponent's arguments to exploit
+        4. "anticipated_counterarguments": Potential counter-arguments the opponent might make
+        5. "key_messaging": A list of 3-4 key messages to emphasize
+        6. "argument_structure": An outline of how to structure the argument
+        7. "rhetorical_techniques": A list of specific rhetorical techniques to employ
+        8. "rebuttal_strategies": How to address anticipated counterarguments
+        9. "evidence_prioritization": Which evidence should be emphasized most
+        
+        Be strategic and analytical. Focus on the areas that will strengthen your position and
+        weaken the opponent's, and on an approach that will be persuasive in the debate context.
+        """)
+    
+    def _build_prompt(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> str:
+        """Build the prompt for the plan-strategist agent"""
+        prompt = PromptBuilder(topic)
+        
+        if not history:
+            prompt.volatile(f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
+            prompt.volatile("This is the first round of the debate. There is no history yet.\n\n")
+            prompt.volatile("Please create a plan and strategy for an opening argument that establishes a strong position.\n")
+        else:
+            prompt.stable("Debate history:\n\n")
+            prompt.stable(format_history(history, memory_window, history_summary, "PRO", "CON", debate_id=debate_id))
+            
+            prompt.volatile(f"\nStance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
+            prompt.volatile("Please create a plan and strategy for the next argument that addresses the current state of the debate.\n")
+            prompt.volatile("Consider the opponent's arguments, refute their points, and strengthen your position.\n")
+        
+        return prompt.build()
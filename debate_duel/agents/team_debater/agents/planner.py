@@ -1,9 +1,13 @@
 """
 Planner agent that analyzes the debate and identifies key areas to address
 """
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from debate_duel.shared.schemas import Stance, Turn
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+from debate_duel.shared.history import format_history
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
+from debate_duel.settings.constants import OPENAI_ASYNC_CLIENT, OPENAI_MODEL
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
 
 
 class PlannerAgent:
@@ -14,9 +18,30 @@ class PlannerAgent:
     
     def __init__(self):
         """Initialize the planner agent"""
-        self.client = OPENAI_CLIENT
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("planner")
     
-    def create_plan(self, topic: str, stance: Stance, history: List[Turn]) -> Dict[str, Any]:
+    def create_plan(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Synchronous wrapper around create_plan_async"""
+        return run_sync(self.create_plan_async(topic, stance, history, memory_window, history_summary, debate_id))
+    
+    async def create_plan_async(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Create a plan for the debate argument by analyzing the debate history
         and identifying key areas to address.
@@ -25,14 +50,20 @@ class PlannerAgent:
             topic: The debate topic
             stance: PRO or CON stance
             history: List of previous debate turns
+            memory_window: Number of recent rounds to include verbatim, or None for all
+            history_summary: Running summary of the rounds before the memory window
+            debate_id: The debate the history belongs to, to reuse its rendered rounds
             
         Returns:
             A plan dictionary with key areas to address
         """
         system_prompt = self._get_system_prompt()
-        user_prompt = self._build_prompt(topic, stance, history)
+        user_prompt = self._build_prompt(topic, stance, history, memory_window, history_summary, debate_id)
         
-        response = self.client.chat.completions.create(
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="planner",
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -50,7 +81,7 @@ class PlannerAgent:
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the planner agent"""
-        return """
+        return clean_prompt("""
         You are a debate planning specialist. Your role is to analyze the debate topic and history,
         then identify key areas that need to be addressed in the next argument.
         
@@ -62,29 +93,30 @@ class PlannerAgent:
         
         Be strategic and analytical. Focus on identifying the most important areas that will
         strengthen your position and weaken the opponent's position.
-        """
+        """)
     
-    def _build_prompt(self, topic: str, stance: Stance, history: List[Turn]) -> str:
+    def _build_prompt(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        debate_id: Optional[str] = None
+    ) -> str:
         """Build the prompt for the planner agent"""
-        prompt = f"Topic: {topic}\n\n"
-        prompt += f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n"
+        prompt = PromptBuilder(topic)
         
         if not history:
-            prompt += "This is the first round of the debate. There is no history yet.\n\n"
-            prompt += "Please create a strategic plan for an opening argument that establishes a strong position.\n"
+            prompt.volatile(f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
+            prompt.volatile("This is the first round of the debate. There is no history yet.\n\n")
+            prompt.volatile("Please create a strategic plan for an opening argument that establishes a strong position.\n")
         else:
-            prompt += "Debate history:\n\n"
-            
-            for i, turn in enumerate(history):
-                prompt += f"Round {i+1}:\n"
-                prompt += f"PRO: {turn.pro_argument}\n\n"
-                prompt += f"CON: {turn.con_argument}\n\n"
-                
-                if turn.judge_decision:
-                    prompt += f"Judge: Winner: {turn.judge_decision.winner}\n"
-                    prompt += f"Justification: {turn.judge_decision.justification}\n\n"
+            prompt.stable("Debate history:\n\n")
+            prompt.stable(format_history(history, memory_window, history_summary, "PRO", "CON", debate_id=debate_id))
             
-            prompt += "\nPlease create a strategic plan for the next argument that addresses the current state of the debate.\n"
-            prompt += "Consider the opponent's arguments, refute their points, and strengthen your position.\n"
+            prompt.volatile(f"\nStance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
+            prompt.volatile("Please create a strategic plan for the next argument that addresses the current state of the debate.\n")
+            prompt.volatile("Consider the opponent's arguments, refute their points, and strengthen your position.\n")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build()
@@ -1,8 +1,22 @@
 """
 Researcher agent that gathers information on key debate points
 """
+import asyncio
+import logging
 from typing import Dict, List
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+from debate_duel.settings.constants import (
+    OPENAI_ASYNC_CLIENT,
+    OPENAI_MODEL,
+    RESEARCH_MAX_CONCURRENCY,
+)
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
+from debate_duel.shared.research_store import RESEARCH_STORE
+
+logger = logging.getLogger(__name__)
+
+RESEARCH_UNAVAILABLE = "Research unavailable for this point."
 
 
 class ResearcherAgent:
@@ -10,46 +24,89 @@ class ResearcherAgent:
     Agent that researches information on key points for the debate argument.
     """
     
-    def __init__(self):
-        """Initialize the researcher agent"""
-        self.client = OPENAI_CLIENT
+    def __init__(self, max_concurrency: int = RESEARCH_MAX_CONCURRENCY):
+        """
+        Initialize the researcher agent
+        
+        Args:
+            max_concurrency: Maximum number of research calls in flight at once
+        """
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("researcher")
+        self.store = RESEARCH_STORE
+        self.max_concurrency = max(1, max_concurrency)
     
     def research_points(self, topic: str, points: List[str]) -> Dict[str, str]:
+        """Synchronous wrapper around research_points_async"""
+        return run_sync(self.research_points_async(topic, points))
+    
+    async def research_points_async(self, topic: str, points: List[str]) -> Dict[str, str]:
         """
         Research information related to the key points for the debate argument.
         
+        Points are researched concurrently, with at most max_concurrency calls
+        in flight. A failure on one point does not fail the others; the point is
+        kept with a placeholder note instead.
+        
         Args:
             topic: The debate topic
             points: List of key points to research
             
         Returns:
-            Dictionary mapping each point to relevant information
+            Dictionary mapping each point to relevant information, in the order
+            the points were given
         """
         system_prompt = self._get_system_prompt()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        research_results = {}
+        async def research(point: str) -> str:
+            async with semaphore:
+                return await self._research_point(topic, point, system_prompt)
         
-        # Research each point individually
-        for point in points:
-            user_prompt = self._build_prompt(topic, point)
-            
-            response = self.client.chat.completions.create(
-                model=OPENAI_MODEL,
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            research_results[point] = response.choices[0].message.content
+        results = await asyncio.gather(
+            *(research(point) for point in points),
+            return_exceptions=True
+        )
+        
+        research_results = {}
+        for point, result in zip(points, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning("Research failed for point %r: %s", point, result)
+                result = RESEARCH_UNAVAILABLE
+            research_results[point] = result
         
         return research_results
     
+    async def _research_point(self, topic: str, point: str, system_prompt: str) -> str:
+        """Research a single point, reusing stored research on the same or a near-duplicate point"""
+        stored = await self.store.lookup(topic, point)
+        if stored is not None:
+            return stored
+        
+        user_prompt = self._build_prompt(topic, point)
+        
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="researcher",
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.3,
+            max_tokens=500
+        )
+        
+        result = response.choices[0].message.content
+        await self.store.put(topic, point, result)
+        return result
+    
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the researcher agent"""
-        return """
+        return clean_prompt("""
         You are a debate research specialist. Your role is to provide accurate, relevant, and 
         comprehensive information on specific debate points. Focus on facts, statistics, 
         historical examples, and logical principles that can strengthen an argument.
@@ -61,13 +118,13 @@ class ResearcherAgent:
         4. Highlight any nuances or complexities
         
         Be concise but thorough. Your research will be used to build a persuasive debate argument.
-        """
+        """)
     
     def _build_prompt(self, topic: str, point: str) -> str:
         """Build the prompt for researching a specific point"""
-        prompt = f"Topic: {topic}\n\n"
-        prompt += f"Research point: {point}\n\n"
-        prompt += "Please provide relevant information, facts, examples, and logical principles related to this point."
-        prompt += " The information will be used to build a persuasive debate argument."
+        prompt = PromptBuilder(topic)
+        prompt.volatile(f"Research point: {point}\n\n")
+        prompt.volatile("Please provide relevant information, facts, examples, and logical principles related to this point.")
+        prompt.volatile(" The information will be used to build a persuasive debate argument.")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build() 
\ No newline at end of file
@@ -3,7 +3,10 @@ Strategist agent that determines effective arguments and structure
 """
 from typing import Dict, List, Any
 from debate_duel.shared.schemas import Stance, Turn
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+from debate_duel.settings.constants import OPENAI_ASYNC_CLIENT, OPENAI_MODEL
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
 
 
 class StrategistAgent:
@@ -14,7 +17,8 @@ class StrategistAgent:
     
     def __init__(self):
         """Initialize the strategist agent"""
-        self.client = OPENAI_CLIENT
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("strategist")
     
     def develop_strategy(
         self,
@@ -23,6 +27,17 @@ class StrategistAgent:
         history: List[Turn],
         plan: Dict[str, Any],
         research_results: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Synchronous wrapper around develop_strategy_async"""
+        return run_sync(self.develop_strategy_async(topic, stance, history, plan, research_results))
+    
+    async def develop_strategy_async(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        plan: Dict[str, Any],
+        research_results: Dict[str, str]
     ) -> Dict[str, Any]:
         """
         Develop a strategic approach for the debate argument.
@@ -40,7 +55,10 @@ class StrategistAgent:
         system_prompt = self._get_system_prompt()
         user_prompt = self._build_prompt(topic, stance, history, plan, research_results)
         
-        response = self.client.chat.completions.create(
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="strategist",
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -58,7 +76,7 @@ class StrategistAgent:
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the strategist agent"""
-        return """
+        return clean_prompt("""
         You are a debate strategy specialist. Your role is to develop an effective strategic approach
         for a debate argument based on the plan, research, and debate history.
         
@@ -71,7 +89,7 @@ class StrategistAgent:
         
         Be strategic and persuasive. Focus on creating a compelling, well-structured argument
         that will be effective in the debate context.
-        """
+        """)
     
     def _build_prompt(
         self,
@@ -82,31 +100,36 @@ class StrategistAgent:
         research_results: Dict[str, str]
     ) -> str:
         """Build the prompt for the strategist agent"""
-        prompt = f"Topic: {topic}\n\n"
-        prompt += f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n"
+        prompt = PromptBuilder(topic)
+        
+        # Include debate history summary if available
+        if history:
+            prompt.stable("DEBATE HISTORY SUMMARY:\n")
+            prompt.stable("".join(
+                f"Round {i+1} Winner: {turn.judge_decision.winner if turn.judge_decision else 'N/A'}\n"
+                for i, turn in enumerate(history)
+            ))
+            prompt.stable("\n")
+        
+        prompt.volatile(f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
         
         # Include debate plan
-        prompt += "DEBATE PLAN:\n"
+        prompt.volatile("DEBATE PLAN:\n")
         for key, value in plan.items():
             if isinstance(value, list):
-                prompt += f"\n{key.upper()}:\n"
+                prompt.volatile(f"\n{key.upper()}:\n")
                 for i, item in enumerate(value):
-                    prompt += f"  {i+1}. {item}\n"
+                    prompt.volatile(f"  {i+1}. {item}\n")
             else:
-                prompt += f"\n{key.upper()}: {value}\n"
-        
-        # Include research results
-        prompt += "\nRESEARCH RESULTS:\n"
-        for point, info in research_results.items():
-            prompt += f"\n[{point}]\n{info}\n"
+                prompt.volatile(f"\n{key.upper()}: {value}\n")
         
-        # Include debate history summary if available
-        if history:
-            prompt += "\nDEBATE HISTORY SUMMARY:\n"
-            for i, turn in enumerate(history):
-                prompt += f"Round {i+1} Winner: {turn.judge_decision.winner if turn.judge_decision else 'N/A'}\n"
+        # Include research results (none in fast pipeline mode)
+        if research_results:
+            prompt.volatile("\nRESEARCH RESULTS:\n")
+            for point, info in research_results.items():
+                prompt.volatile(f"\n[{point}]\n{info}\n")
         
-        prompt += "\nPlease develop a strategic approach for this debate argument.\n"
-        prompt += "Consider the plan, research, and debate history to create an effective strategy.\n"
+        prompt.volatile("\nPlease develop a strategic approach for this debate argument.\n")
+        prompt.volatile("Consider the plan, research, and debate history to create an effective strategy.\n")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build()
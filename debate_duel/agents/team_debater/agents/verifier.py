@@ -1,9 +1,12 @@
 """
 Verifier agent that checks the debate argument for soundness and identifies weaknesses
 """
-from typing import List
+from typing import AsyncIterator, List
 from debate_duel.shared.schemas import Stance, Turn
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+from debate_duel.settings.constants import OPENAI_ASYNC_CLIENT, OPENAI_MODEL
+from debate_duel.shared.llm import create_chat_completion, stream_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
 
 
 class VerifierAgent:
@@ -14,7 +17,8 @@ class VerifierAgent:
     
     def __init__(self):
         """Initialize the verifier agent"""
-        self.client = OPENAI_CLIENT
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("verifier")
     
     def verify_argument(
         self,
@@ -22,6 +26,16 @@ class VerifierAgent:
         stance: Stance,
         history: List[Turn],
         argument: str
+    ) -> str:
+        """Synchronous wrapper around verify_argument_async"""
+        return run_sync(self.verify_argument_async(topic, stance, history, argument))
+    
+    async def verify_argument_async(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        argument: str
     ) -> str:
         """
         Verify the debate argument and make improvements.
@@ -38,7 +52,10 @@ class VerifierAgent:
         system_prompt = self._get_system_prompt()
         user_prompt = self._build_prompt(topic, stance, history, argument)
         
-        response = self.client.chat.completions.create(
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="verifier",
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -50,9 +67,45 @@ class VerifierAgent:
         
         return response.choices[0].message.content
     
+    async def stream_verify_argument(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        argument: str
+    ) -> AsyncIterator[str]:
+        """
+        Verify and improve the debate argument, yielding the improved argument's
+        tokens as they are produced.
+        
+        Args:
+            topic: The debate topic
+            stance: PRO or CON stance
+            history: List of previous debate turns
+            argument: The draft debate argument
+            
+        Yields:
+            Chunks of the improved debate argument
+        """
+        system_prompt = self._get_system_prompt()
+        user_prompt = self._build_prompt(topic, stance, history, argument)
+        
+        async for delta in stream_chat_completion(
+            self.client,
+            agent="verifier",
+            model=OPENAI_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            temperature=0.4,
+            max_tokens=1500
+        ):
+            yield delta
+    
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the verifier agent"""
-        return """
+        return clean_prompt("""
         You are a debate verification specialist. Your role is to review debate arguments
         for logical soundness, factual accuracy, and persuasive strength, then suggest improvements.
         
@@ -68,7 +121,7 @@ class VerifierAgent:
         original intent and structure.
         
         Return the improved version of the argument.
-        """
+        """)
     
     def _build_prompt(
         self,
@@ -78,23 +131,24 @@ class VerifierAgent:
         argument: str
     ) -> str:
         """Build the prompt for the verifier agent"""
-        prompt = f"Topic: {topic}\n\n"
-        prompt += f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n"
-        
-        prompt += "DRAFT ARGUMENT TO VERIFY:\n\n"
-        prompt += f"{argument}\n\n"
+        prompt = PromptBuilder(topic)
         
         # Include debate context if it's not the first round
         if history:
             opponent_stance = Stance.CON if stance == Stance.PRO else Stance.PRO
-            prompt += f"\nNote: This is round {len(history) + 1} of the debate. "
-            prompt += f"The {opponent_stance.value} side has previously argued:\n\n"
+            prompt.stable(f"Note: This is round {len(history) + 1} of the debate. ")
+            prompt.stable(f"The {opponent_stance.value} side has previously argued:\n\n")
             
             last_turn = history[-1]
             opponent_argument = last_turn.con_argument if stance == Stance.PRO else last_turn.pro_argument
-            prompt += f"{opponent_argument[:300]}...\n\n"
+            prompt.stable(f"{opponent_argument[:300]}...\n\n")
+        
+        prompt.volatile(f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
+        
+        prompt.volatile("DRAFT ARGUMENT TO VERIFY:\n\n")
+        prompt.volatile(f"{argument}\n\n")
         
-        prompt += "Please verify this argument for logical soundness, factual accuracy, and persuasive strength.\n"
-        prompt += "Then, provide an improved version that addresses any weaknesses while maintaining the original intent.\n"
+        prompt.volatile("Please verify this argument for logical soundness, factual accuracy, and persuasive strength.\n")
+        prompt.volatile("Then, provide an improved version that addresses any weaknesses while maintaining the original intent.\n")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build()
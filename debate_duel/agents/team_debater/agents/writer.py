@@ -3,7 +3,10 @@ Writer agent that crafts the final debate argument
 """
 from typing import Dict, List, Any
 from debate_duel.shared.schemas import Stance, Turn
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+from debate_duel.settings.constants import OPENAI_ASYNC_CLIENT, OPENAI_MODEL
+from debate_duel.shared.llm import create_chat_completion, run_sync
+from debate_duel.shared.llm_cache import cache_for
+from debate_duel.shared.prompts import PromptBuilder, clean_prompt
 
 
 class WriterAgent:
@@ -14,7 +17,8 @@ class WriterAgent:
     
     def __init__(self):
         """Initialize the writer agent"""
-        self.client = OPENAI_CLIENT
+        self.client = OPENAI_ASYNC_CLIENT
+        self.cache = cache_for("writer")
     
     def write_argument(
         self,
@@ -24,6 +28,18 @@ class WriterAgent:
         plan: Dict[str, Any],
         research_results: Dict[str, str],
         strategy: Dict[str, Any]
+    ) -> str:
+        """Synchronous wrapper around write_argument_async"""
+        return run_sync(self.write_argument_async(topic, stance, history, plan, research_results, strategy))
+    
+    async def write_argument_async(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        plan: Dict[str, Any],
+        research_results: Dict[str, str],
+        strategy: Dict[str, Any]
     ) -> str:
         """
         Write the final debate argument.
@@ -42,7 +58,10 @@ class WriterAgent:
         system_prompt = self._get_system_prompt()
         user_prompt = self._build_prompt(topic, stance, history, plan, research_results, strategy)
         
-        response = self.client.chat.completions.create(
+        response = await create_chat_completion(
+            self.client,
+            cache=self.cache,
+            agent="writer",
             model=OPENAI_MODEL,
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -56,7 +75,7 @@ class WriterAgent:
     
     def _get_system_prompt(self) -> str:
         """Get the system prompt for the writer agent"""
-        return """
+        return clean_prompt("""
         You are a skilled debate writer. Your role is to craft a persuasive, eloquent, and 
         powerful debate argument based on the provided plan, research, and strategy.
         
@@ -69,7 +88,7 @@ class WriterAgent:
         
         Be articulate, precise, and persuasive. Focus on crafting an argument that will convince
         both the opponent and any judges or audience.
-        """
+        """)
     
     def _build_prompt(
         self,
@@ -81,40 +100,42 @@ class WriterAgent:
         strategy: Dict[str, Any]
     ) -> str:
         """Build the prompt for the writer agent"""
-        prompt = f"Topic: {topic}\n\n"
-        prompt += f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n"
+        prompt = PromptBuilder(topic)
+        
+        # Include brief debate history if available
+        if history:
+            last_turn = history[-1]
+            opponent_argument = last_turn.con_argument if stance == Stance.PRO else last_turn.pro_argument
+            prompt.stable("LAST OPPONENT ARGUMENT:\n")
+            prompt.stable(f"{opponent_argument[:300]}...\n\n")
+        
+        prompt.volatile(f"Stance: {'PRO (supporting)' if stance == Stance.PRO else 'CON (opposing)'}\n\n")
         
         # Include debate plan summary
-        prompt += "DEBATE PLAN:\n"
-        prompt += f"Overall Approach: {plan.get('overall_approach', 'N/A')}\n"
+        prompt.volatile("DEBATE PLAN:\n")
+        prompt.volatile(f"Overall Approach: {plan.get('overall_approach', 'N/A')}\n")
         if 'points' in plan:
-            prompt += "Key Points:\n"
+            prompt.volatile("Key Points:\n")
             for i, point in enumerate(plan['points']):
-                prompt += f"  {i+1}. {point}\n"
+                prompt.volatile(f"  {i+1}. {point}\n")
         
         # Include strategy summary
-        prompt += "\nSTRATEGY:\n"
+        prompt.volatile("\nSTRATEGY:\n")
         if 'key_messaging' in strategy:
-            prompt += "Key Messaging:\n"
+            prompt.volatile("Key Messaging:\n")
             for i, msg in enumerate(strategy['key_messaging']):
-                prompt += f"  {i+1}. {msg}\n"
+                prompt.volatile(f"  {i+1}. {msg}\n")
         
         if 'argument_structure' in strategy:
-            prompt += f"\nArgument Structure: {strategy['argument_structure']}\n"
+            prompt.volatile(f"\nArgument Structure: {strategy['argument_structure']}\n")
         
-        # Include abbreviated research results
-        prompt += "\nRESEARCH (Key Information):\n"
-        for point, info in research_results.items():
-            prompt += f"\n[{point}] - Key insights available to incorporate\n"
-        
-        # Include brief debate history if available
-        if history:
-            last_turn = history[-1]
-            opponent_argument = last_turn.con_argument if stance == Stance.PRO else last_turn.pro_argument
-            prompt += "\nLAST OPPONENT ARGUMENT:\n"
-            prompt += f"{opponent_argument[:300]}...\n"
+        # Include abbreviated research results (none in fast pipeline mode)
+        if research_results:
+            prompt.volatile("\nRESEARCH (Key Information):\n")
+            for point, info in research_results.items():
+                prompt.volatile(f"\n[{point}] - Key insights available to incorporate\n")
         
-        prompt += "\nBased on all the provided information, please write a compelling and persuasive debate argument.\n"
-        prompt += "Focus on implementing the strategic approach while addressing key points with supporting evidence.\n"
+        prompt.volatile("\nBased on all the provided information, please write a compelling and persuasive debate argument.\n")
+        prompt.volatile("Focus on implementing the strategic approach while addressing key points with supporting evidence.\n")
         
-        return prompt 
\ No newline at end of file
+        return prompt.build()
@@ -33,7 +33,7 @@ async def generate_argument(request: ArgumentRequest):
         The generated argument
     """
     try:
-        argument = team_debater.generate_argument(request)
+        argument = await team_debater.generate_argument_async(request)
         return {"argument": argument}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to generate argument: {str(e)}")
@@ -1,41 +1,300 @@
 """
 Manager for the team of debate agents - coordinates the workflow between different agents
 """
-from typing import List, Dict, Any
-from debate_duel.shared.schemas import ArgumentRequest, Turn, Stance
-from debate_duel.settings.constants import OPENAI_CLIENT, OPENAI_MODEL
+import asyncio
+import hashlib
+import json
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
+from debate_duel.settings.constants import DEADLINE_MIN_STAGE_SECONDS, SWARM_FUSED_PLANNING, SWARM_PIPELINE_MODE
+from debate_duel.shared.deadlines import DEGRADATIONS, budget, within_budget, within_deadline
+from debate_duel.shared.schemas import ArgumentRequest, PipelineMode, Turn, Stance
+from debate_duel.shared.llm import run_sync
+from debate_duel.shared.metrics import STAGE_METRICS, usage_scope
 
 from debate_duel.agents.team_debater.agents.planner import PlannerAgent
+from debate_duel.agents.team_debater.agents.plan_strategist import PlanStrategistAgent
 from debate_duel.agents.team_debater.agents.researcher import ResearcherAgent
 from debate_duel.agents.team_debater.agents.strategist import StrategistAgent
 from debate_duel.agents.team_debater.agents.writer import WriterAgent 
 from debate_duel.agents.team_debater.agents.verifier import VerifierAgent
 from debate_duel.agents.team_debater.printer import DebateAgentPrinter
 
+# Number of speculatively prepared plans kept per process
+_MAX_PREPARED = 256
+
+# Relative share of the time left before a deadline that each stage is budgeted
+_STAGE_SHARES = {
+    "plan": 1.0,
+    "plan_strategy": 1.5,
+    "research": 1.5,
+    "strategy": 1.0,
+    "write": 2.0,
+    "verify": 2.0,
+}
+
+
+def planning_history(history: List[Turn]) -> List[Turn]:
+    """
+    The history as speculatively prepared planning and research see it:
+    without the judge's verdict on the latest round, so that those stages can
+    start before the verdict is in. Requests planned on demand keep the verdict.
+    """
+    if history and history[-1].judge_decision is not None:
+        return history[:-1] + [history[-1].model_copy(update={"judge_decision": None})]
+    return history
+
+
+def pipeline_mode(request: ArgumentRequest) -> PipelineMode:
+    """The stages to run for a request: its own mode or the swarm's default."""
+    return request.pipeline_mode or PipelineMode(SWARM_PIPELINE_MODE)
+
+
+def preparation_key(request: ArgumentRequest) -> str:
+    """Identify the inputs of the planning and research stages of a request."""
+    inputs = {
+        "mode": pipeline_mode(request).value,
+        "topic": request.topic,
+        "stance": request.stance.value,
+        "memory_window": request.memory_window,
+        "history_summary": request.history_summary,
+        "history": [turn.model_dump(mode="json") for turn in planning_history(request.history)],
+    }
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def pipeline_stages(mode: PipelineMode, fused_planning: bool) -> List[str]:
+    """The stages a request runs, in order."""
+    stages = ["plan_strategy"] if fused_planning else ["plan"]
+    if mode != PipelineMode.FAST:
+        stages.append("research")
+    if not fused_planning:
+        stages.append("strategy")
+    stages.append("write")
+    if mode == PipelineMode.FULL:
+        stages.append("verify")
+    return stages
+
 
 class DebateAgentManager:
     """Manager that coordinates the workflow between different debate agent specialists"""
     
-    def __init__(self, verbose: bool = False):
+    def __init__(self, verbose: bool = False, fused_planning: bool = SWARM_FUSED_PLANNING):
+        """
+        Args:
+            verbose: Whether to print detailed output during argument generation
+            fused_planning: Plan and strategize in one call instead of two stages
+        """
         self.verbose = verbose
         self.printer = DebateAgentPrinter() if verbose else None
+        self.fused_planning = fused_planning
         
         # Initialize the specialist agents
         self.planner = PlannerAgent()
+        self.plan_strategist = PlanStrategistAgent()
         self.researcher = ResearcherAgent()
         self.strategist = StrategistAgent()
         self.writer = WriterAgent()
         self.verifier = VerifierAgent()
+        
+        # Planning and research started ahead of time by prepare_argument
+        self._prepared: "OrderedDict[str, asyncio.Task]" = OrderedDict()
     
     def generate_argument(self, request: ArgumentRequest) -> str:
+        """Synchronous wrapper around generate_argument_async"""
+        return run_sync(self.generate_argument_async(request))
+    
+    async def generate_argument_async(self, request: ArgumentRequest) -> str:
         """
         Generate a strategic argument by coordinating multiple specialized agents
         
+        The request's pipeline mode selects the stages: fast skips research and
+        verification, balanced skips verification and full runs all of them.
+        Latency is recorded per mode as the "pipeline_<mode>" stage and token
+        usage under the mode's usage scope.
+        
+        Under a deadline, research and verification only run within their
+        share of the time left; when they are skipped or run out of time the
+        argument is written without research, or the draft is returned
+        unverified.
+        
         Args:
             request: The request containing topic, stance, and debate history
             
         Returns:
             Generated argument as a string
+            
+        Raises:
+            DeadlineExceeded: If the deadline passes before the draft is written
+        """
+        mode = pipeline_mode(request)
+        with usage_scope(mode.value), STAGE_METRICS.time(f"pipeline_{mode.value}"):
+            async with within_deadline():
+                argument = await self._draft_argument(request, mode)
+            if mode != PipelineMode.FULL:
+                return argument
+            
+            # Step 5: Verification - Check for soundness and identify weaknesses
+            async def verify() -> str:
+                with STAGE_METRICS.time("verify"):
+                    return await self.verifier.verify_argument_async(
+                        request.topic,
+                        request.stance,
+                        request.history,
+                        argument
+                    )
+            
+            verified_argument = await within_budget("verify", self._stage_budget("verify", mode), verify)
+            if verified_argument is None:
+                # Out of time: the draft stands
+                return argument
+            if self.verbose:
+                self.printer.print_verified(verified_argument)
+            
+            return verified_argument
+    
+    async def stream_argument(self, request: ArgumentRequest) -> AsyncIterator[str]:
+        """
+        Generate a strategic argument like generate_argument_async, streaming the
+        final verification stage's tokens as they are produced. Modes without
+        verification, and requests with too little time left to verify, yield
+        the written argument as a single chunk.
+        
+        Args:
+            request: The request containing topic, stance, and debate history
+            
+        Yields:
+            Chunks of the verified argument
+        """
+        mode = pipeline_mode(request)
+        with usage_scope(mode.value), STAGE_METRICS.time(f"pipeline_{mode.value}"):
+            async with within_deadline():
+                argument = await self._draft_argument(request, mode)
+            if mode != PipelineMode.FULL:
+                yield argument
+                return
+            
+            # Streamed tokens cannot be taken back, so verification either
+            # starts with enough time or not at all
+            verify_budget = self._stage_budget("verify", mode)
+            if verify_budget is not None and verify_budget < DEADLINE_MIN_STAGE_SECONDS:
+                DEGRADATIONS["verify_skipped"] += 1
+                yield argument
+                return
+            
+            # Step 5: Verification, streamed
+            chunks = []
+            with STAGE_METRICS.time("verify"):
+                async for delta in self.verifier.stream_verify_argument(
+                    request.topic,
+                    request.stance,
+                    request.history,
+                    argument
+                ):
+                    chunks.append(delta)
+                    yield delta
+            if self.verbose:
+                self.printer.print_verified("".join(chunks))
+    
+    def prepare_argument(self, request: ArgumentRequest) -> None:
+        """
+        Start the planning and research stages of an upcoming request in the
+        background, typically while the judge is still deciding the latest
+        round (which may then have no verdict yet). A later request with the
+        same inputs to those stages picks the result up instead of re-running them.
+        
+        Args:
+            request: The upcoming request, with or without the latest verdict
+        """
+        key = preparation_key(request)
+        if key in self._prepared:
+            return
+        mode = pipeline_mode(request)
+        # The task copies the current context, and with it the usage scope
+        with usage_scope(mode.value):
+            task = asyncio.create_task(self._plan_and_research(request, mode, speculative=True))
+        # Mark failures as retrieved; an unused preparation is simply dropped
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+        self._prepared[key] = task
+        while len(self._prepared) > _MAX_PREPARED:
+            _, evicted = self._prepared.popitem(last=False)
+            evicted.cancel()
+    
+    def _stage_budget(self, stage: str, mode: PipelineMode) -> Optional[float]:
+        """
+        Seconds of the time left before the deadline granted to a stage, in
+        proportion to its share among itself and the stages after it.
+        """
+        stages = pipeline_stages(mode, self.fused_planning)
+        later = stages[stages.index(stage):]
+        return budget(_STAGE_SHARES[stage], sum(_STAGE_SHARES[name] for name in later))
+    
+    async def _plan_and_research(
+        self,
+        request: ArgumentRequest,
+        mode: PipelineMode,
+        speculative: bool = False
+    ) -> Tuple[Dict[str, Any], Dict[str, str], Optional[Dict[str, Any]]]:
+        """
+        Run the planning and research stages, and with fused planning the
+        strategy stage as part of planning.
+        
+        Args:
+            request: The request containing topic, stance, and debate history
+            mode: The pipeline mode; fast mode skips research
+            speculative: Run ahead of the latest verdict for prepare_argument,
+                planning from the history without it
+            
+        Returns:
+            The plan, the research results (empty in fast mode) and the
+            strategy (None unless planning is fused)
+        """
+        history = planning_history(request.history) if speculative else request.history
+        strategy = None
+        
+        # Step 1: Planning - Identify key areas to address
+        if self.fused_planning:
+            with STAGE_METRICS.time("plan_strategy"):
+                plan, strategy = await self.plan_strategist.create_plan_and_strategy_async(
+                    request.topic,
+                    request.stance,
+                    history,
+                    request.memory_window,
+                    request.history_summary,
+                    request.debate_id
+                )
+        else:
+            with STAGE_METRICS.time("plan"):
+                plan = await self.planner.create_plan_async(
+                    request.topic,
+                    request.stance,
+                    history,
+                    request.memory_window,
+                    request.history_summary,
+                    request.debate_id
+                )
+        
+        if mode == PipelineMode.FAST:
+            return plan, {}, strategy
+        
+        # Step 2: Research - Gather information on key points, if there is time
+        async def research() -> Dict[str, str]:
+            with STAGE_METRICS.time("research"):
+                return await self.researcher.research_points_async(request.topic, plan["points"])
+        
+        research_results = await within_budget("research", self._stage_budget("research", mode), research)
+        return plan, research_results or {}, strategy
+    
+    async def _draft_argument(self, request: ArgumentRequest, mode: PipelineMode) -> str:
+        """
+        Run the planning, research, strategy and writing stages.
+        
+        Args:
+            request: The request containing topic, stance, and debate history
+            mode: The pipeline mode; fast mode skips research
+            
+        Returns:
+            The draft argument to be verified
         """
         topic = request.topic
         stance = request.stance
@@ -47,47 +306,48 @@ class DebateAgentManager:
             if history:
                 self.printer.print_history(history)
         
-        # Step 1: Planning - Identify key areas to address
-        plan = self.planner.create_plan(topic, stance, history)
+        # Steps 1-2: Planning and research, reusing a speculative run if there is one
+        prepared = self._prepared.pop(preparation_key(request), None)
+        planned = None
+        if prepared is not None:
+            try:
+                planned = await prepared
+            except Exception:
+                # A failed speculative run is simply redone
+                pass
+        # A fused strategy prepared before the latest verdict was known is redone with it
+        stale_strategy = planned is not None and bool(history) and history[-1].judge_decision is not None
+        if planned is None:
+            planned = await self._plan_and_research(request, mode)
+        plan, research_results, strategy = planned
         if self.verbose:
             self.printer.print_plan(plan)
-        
-        # Step 2: Research - Gather information on key points
-        research_results = self.researcher.research_points(topic, plan["points"])
-        if self.verbose:
             self.printer.print_research(research_results)
         
-        # Step 3: Strategy - Determine effective arguments and structure
-        strategy = self.strategist.develop_strategy(
-            topic, 
-            stance, 
-            history, 
-            plan, 
-            research_results
-        )
+        # Step 3: Strategy - Determine effective arguments and structure (done already when fused)
+        if strategy is None or stale_strategy:
+            with STAGE_METRICS.time("strategy"):
+                strategy = await self.strategist.develop_strategy_async(
+                    topic, 
+                    stance, 
+                    history, 
+                    plan, 
+                    research_results
+                )
         if self.verbose:
             self.printer.print_strategy(strategy)
         
         # Step 4: Writing - Craft the final argument
-        argument = self.writer.write_argument(
-            topic,
-            stance,
-            history,
-            plan,
-            research_results,
-            strategy
-        )
+        with STAGE_METRICS.time("write"):
+            argument = await self.writer.write_argument_async(
+                topic,
+                stance,
+                history,
+                plan,
+                research_results,
+                strategy
+            )
         if self.verbose:
             self.printer.print_draft(argument)
         
-        # Step 5: Verification - Check for soundness and identify weaknesses
-        verified_argument = self.verifier.verify_argument(
-            topic,
-            stance,
-            history,
-            argument
-        )
-        if self.verbose:
-            self.printer.print_verified(verified_argument)
-        
-        return verified_argument 
\ No newline at end of file
+        return argument
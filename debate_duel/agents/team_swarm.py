@@ -2,7 +2,7 @@
 Team-based swarm agent that implements the same interface as the original SwarmAgent
 but uses a team of specialized agents to generate debate arguments.
 """
-from typing import List
+from typing import AsyncIterator, List
 
 from debate_duel.shared.schemas import ArgumentRequest, Turn, Stance
 from debate_duel.agents.team_debater.manager import DebateAgentManager
@@ -35,6 +35,41 @@ class TeamSwarmAgent:
             Generated argument as a string
         """
         return self.debate_team.generate_argument(request)
+    
+    async def generate_argument_async(self, request: ArgumentRequest) -> str:
+        """
+        Asynchronously generate an argument using the team of specialized agents.
+        
+        Args:
+            request: The request containing topic, stance, and debate history
+            
+        Returns:
+            Generated argument as a string
+        """
+        return await self.debate_team.generate_argument_async(request)
+    
+    def prepare_argument(self, request: ArgumentRequest) -> None:
+        """
+        Start planning and research for an upcoming request in the background.
+        
+        Args:
+            request: The upcoming request, possibly without the latest verdict
+        """
+        self.debate_team.prepare_argument(request)
+    
+    async def stream_argument(self, request: ArgumentRequest) -> AsyncIterator[str]:
+        """
+        Generate an argument using the team of specialized agents, streaming
+        the tokens of the final verification stage.
+        
+        Args:
+            request: The request containing topic, stance, and debate history
+            
+        Yields:
+            Chunks of the generated argument
+        """
+        async for delta in self.debate_team.stream_argument(request):
+            yield delta
 
 
 # For backwards compatibility, also create a class with the same name as the original
@@ -1,15 +1,43 @@
-from fastapi import FastAPI, HTTPException
-from contextlib import asynccontextmanager
+import asyncio
+from typing import AsyncIterator, List, Optional
 
-from debate_duel.shared.schemas import TopicRequest, DebateResult
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from contextlib import asynccontextmanager, suppress
+
+from debate_duel.settings.constants import ARENA_DB
+from debate_duel.shared.deadlines import DEGRADATIONS
+from debate_duel.shared.schemas import (
+    TopicRequest,
+    DebateResult,
+    DebateEvent,
+    DebatePage,
+    LeaderboardEntry,
+    TournamentRequest,
+    WarmupRequest,
+    Winner
+)
 from debate_duel.arena.orchestrator import DebateOrchestrator
+from debate_duel.arena.store import DebateStore
+
+# Seconds between SSE keep-alive comments while waiting for the next event
+SSE_HEARTBEAT_INTERVAL = 15.0
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.state.orchestrator = DebateOrchestrator()
+    app.state.store = DebateStore(ARENA_DB) if ARENA_DB else None
+    app.state.orchestrator = DebateOrchestrator(store=app.state.store)
     yield
     await app.state.orchestrator.close()
+    if app.state.store is not None:
+        await app.state.store.close()
+
+
+def get_store() -> DebateStore:
+    if app.state.store is None:
+        raise HTTPException(status_code=503, detail="Debate store is disabled (ARENA_DB is empty)")
+    return app.state.store
 
 
 app = FastAPI(lifespan=lifespan)
@@ -26,4 +54,146 @@ async def run_debate(topic_request: TopicRequest) -> DebateResult:
     try:
         return await app.state.orchestrator.run_debate(topic_request)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error running debate: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"Error running debate: {str(e)}") 
+
+
+async def sse_events(events: AsyncIterator[DebateEvent]) -> AsyncIterator[str]:
+    """
+    Format debate events as server-sent events, sending keep-alive comments
+    while a slow step is running so proxies do not time the connection out.
+    """
+    iterator = events.__aiter__()
+    next_event = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            done, _ = await asyncio.wait({next_event}, timeout=SSE_HEARTBEAT_INTERVAL)
+            if not done:
+                yield ": keep-alive\n\n"
+                continue
+            try:
+                event = next_event.result()
+            except StopAsyncIteration:
+                break
+            except Exception as e:
+                error = DebateEvent(event="error", error=f"Error running debate: {str(e)}")
+                yield f"event: error\ndata: {error.model_dump_json()}\n\n"
+                break
+            yield f"event: {event.event}\ndata: {event.model_dump_json(exclude_none=True)}\n\n"
+            next_event = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        next_event.cancel()
+        with suppress(BaseException):
+            await next_event
+        await iterator.aclose()
+
+
+@app.post("/debate/stream")
+async def stream_debate(topic_request: TopicRequest) -> StreamingResponse:
+    """
+    Run a debate, streaming its progress as server-sent events.
+    
+    Emits an "argument" event for each side's argument, then "judge" and
+    "elo" events for every turn, and finally a "result" event with the same
+    DebateResult that POST /debate returns (or an "error" event).
+    """
+    return StreamingResponse(
+        sse_events(app.state.orchestrator.stream_debate(topic_request)),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.post("/tournament")
+async def run_tournament(tournament_request: TournamentRequest) -> StreamingResponse:
+    """
+    Run many debates concurrently.
+    
+    Returns:
+        A stream of newline-delimited JSON TournamentEntry objects, one per
+        debate, emitted as each debate finishes.
+    """
+    async def stream():
+        async for entry in app.state.orchestrator.run_tournament(tournament_request):
+            yield entry.model_dump_json() + "\n"
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.post("/warmup", status_code=202)
+async def warmup(warmup_request: WarmupRequest) -> dict:
+    """
+    Have the swarms precompute opening arguments for a topic in the background.
+    
+    Debates requested with use_opening_pool then take their first round from
+    these pools instead of generating it cold.
+    
+    Returns:
+        The number of openings scheduled per stance.
+    """
+    try:
+        scheduled = await app.state.orchestrator.warm_openings(warmup_request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error warming up openings: {str(e)}")
+    return {"status": "accepted", "scheduled": scheduled}
+
+
+@app.get("/debates", response_model=DebatePage)
+async def list_debates(
+    topic: Optional[str] = None,
+    winner: Optional[Winner] = None,
+    since: Optional[float] = None,
+    until: Optional[float] = None,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[int] = None
+) -> DebatePage:
+    """
+    List stored debates, newest first.
+    
+    Filters by exact topic, final winner and a Unix time range. Pages are
+    fetched by passing the previous page's next_cursor as cursor.
+    
+    Returns:
+        A page of debate summaries and the cursor of the next page, if any.
+    """
+    debates = await get_store().list_debates(
+        topic=topic, winner=winner, since=since, until=until, limit=limit, cursor=cursor
+    )
+    next_cursor = debates[-1].cursor if len(debates) == limit else None
+    return DebatePage(debates=debates, next_cursor=next_cursor)
+
+
+@app.get("/debates/{debate_id}", response_model=DebateResult)
+async def get_debate(debate_id: str) -> DebateResult:
+    """
+    Fetch a stored debate with all of its turns.
+    """
+    result = await get_store().get_debate(debate_id)
+    if result is None:
+        raise HTTPException(status_code=404, detail=f"Unknown debate {debate_id}")
+    return result
+
+
+@app.get("/metrics")
+async def metrics() -> dict:
+    """
+    Report the arena's calls to each service (requests, retries, hedged
+    requests and the hedges that answered first, recent latency), debates
+    cut short by their deadline and judge batching statistics.
+    """
+    orchestrator = app.state.orchestrator
+    return {
+        "services": orchestrator.service_stats(),
+        "degradations": dict(DEGRADATIONS),
+        "judge_batching": orchestrator.judge_batcher.stats() if orchestrator.judge_batcher else None,
+    }
+
+
+@app.get("/leaderboard", response_model=List[LeaderboardEntry])
+async def leaderboard(limit: int = Query(50, ge=1, le=1000)) -> List[LeaderboardEntry]:
+    """
+    Rank the swarm configurations by their ELO rating across all debates.
+    
+    Each configuration is rated separately per side, named by SWARM_A_NAME
+    and SWARM_B_NAME.
+    """
+    return app.state.orchestrator.ledger.leaderboard(limit)
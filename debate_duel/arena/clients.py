@@ -0,0 +1,300 @@
+"""
+HTTP clients the arena calls the swarm and judge services with.
+
+Each service gets its own connection pool, so a slow service cannot starve
+the others of connections. Calls that fail to connect or get a 5xx answer
+are retried with jittered exponential backoff, except for a 504, with which
+a service reports that the debate's deadline passed. Calls made against a
+deadline get the time left as their timeout, recomputed for every attempt,
+and are not retried once it has passed. Requests that carry a
+debate's session go to the same replica every turn. Hedgeable calls that
+take longer than the service's recent latency percentile are duplicated to
+the next replica, and the first successful answer is used; a service with a
+single replica is never hedged.
+"""
+import asyncio
+import importlib.util
+import itertools
+import random
+import time
+import zlib
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, List, Optional
+
+import httpx
+
+from debate_duel.settings.constants import (
+    ARENA_HEDGE_MIN_SAMPLES,
+    ARENA_HEDGE_PERCENTILE,
+    ARENA_HEDGE_REQUESTS,
+    ARENA_HTTP2,
+    ARENA_HTTP_CONNECT_TIMEOUT,
+    ARENA_HTTP_KEEPALIVE_EXPIRY,
+    ARENA_HTTP_MAX_CONNECTIONS,
+    ARENA_HTTP_MAX_KEEPALIVE,
+    ARENA_HTTP_RETRIES,
+    ARENA_HTTP_RETRY_BACKOFF,
+    ARENA_HTTP_TIMEOUT,
+)
+from debate_duel.shared.deadlines import DEADLINE_HEADER, DeadlineExceeded
+from debate_duel.shared.metrics import percentile
+
+# httpx speaks HTTP/2 only with the optional h2 package installed
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Failures after which the request is known not to have been processed, or
+# the server dropped a kept-alive connection
+_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+
+def _retryable(response: httpx.Response) -> bool:
+    """Whether an answer is a server error worth retrying; a 504 means the deadline passed."""
+    return response.status_code >= 500 and response.status_code != 504
+
+
+def _deadline_options(deadline: Optional[float], kwargs: dict) -> dict:
+    """
+    The request options of one attempt of a call made against a debate's
+    deadline (a Unix time): the deadline header and a timeout that ends with
+    the deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has already passed
+    """
+    if deadline is None:
+        return kwargs
+    left = deadline - time.time()
+    if left <= 0:
+        raise DeadlineExceeded("The debate's deadline has passed")
+    headers = {**kwargs.get("headers", {}), DEADLINE_HEADER: f"{deadline:.3f}"}
+    return {**kwargs, "headers": headers, "timeout": min(left, ARENA_HTTP_TIMEOUT)}
+
+
+def pooled_client() -> httpx.AsyncClient:
+    """An HTTP client with the arena's timeouts and pool limits."""
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(ARENA_HTTP_TIMEOUT, connect=ARENA_HTTP_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=ARENA_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=ARENA_HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=ARENA_HTTP_KEEPALIVE_EXPIRY
+        ),
+        http2=ARENA_HTTP2 and HTTP2_AVAILABLE
+    )
+
+
+class ServiceClient:
+    """Calls to the replicas of one service, with retries and optional hedging."""
+
+    def __init__(
+        self,
+        urls: List[str],
+        client: Optional[httpx.AsyncClient] = None,
+        retries: int = ARENA_HTTP_RETRIES,
+        backoff: float = ARENA_HTTP_RETRY_BACKOFF,
+        hedge: bool = ARENA_HEDGE_REQUESTS,
+        hedge_percentile: float = ARENA_HEDGE_PERCENTILE,
+        hedge_min_samples: int = ARENA_HEDGE_MIN_SAMPLES
+    ):
+        """
+        Initialize the service client.
+
+        Args:
+            urls: Base URLs of the service's replicas
+            client: Optional HTTP client to use instead of a pool of this service's own
+            retries: Retries of a call that fails to connect or gets a 5xx answer
+            backoff: Upper bound of the first retry's random delay in seconds; doubles per retry
+            hedge: Whether hedgeable calls are duplicated to the next replica when slow
+            hedge_percentile: Percentile of recent latencies after which a call is hedged
+            hedge_min_samples: Latency samples needed before calls are hedged
+        """
+        self.urls = urls
+        self.client = client or pooled_client()
+        self._owns_client = client is None
+        self.retries = retries
+        self.backoff = backoff
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.hedge_min_samples = hedge_min_samples
+        self._latencies: Deque[float] = deque(maxlen=1000)
+        self._next_replica = itertools.count()
+
+        self.requests = 0
+        self.retried = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+
+    def replica(self, affinity: Optional[str] = None, offset: int = 0) -> str:
+        """
+        Base URL of the replica a call goes to: chosen by the affinity key if
+        given (so a debate keeps using the swarm holding its session), round
+        robin otherwise, and shifted by offset for hedged duplicates.
+        """
+        index = zlib.crc32(affinity.encode("utf-8")) if affinity else next(self._next_replica)
+        return self.urls[(index + offset) % len(self.urls)]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds after which a hedgeable call is duplicated, or None to not hedge."""
+        if not self.hedge or len(self.urls) < 2 or len(self._latencies) < self.hedge_min_samples:
+            return None
+        return percentile(sorted(self._latencies), self.hedge_percentile)
+
+    def _backoff(self, attempt: int, deadline: Optional[float] = None) -> float:
+        delay = random.uniform(0, self.backoff * 2 ** attempt)
+        if deadline is not None:
+            # Wake up by the deadline at the latest, for the next attempt to give up
+            delay = min(delay, max(0.0, deadline - time.time()))
+        return delay
+
+    async def _send(self, url: str, deadline: Optional[float] = None, **kwargs: Any) -> httpx.Response:
+        """POST to a URL, retrying connection failures and 5xx answers until the deadline."""
+        for attempt in range(self.retries + 1):
+            try:
+                response = await self.client.post(url, **_deadline_options(deadline, kwargs))
+            except _RETRY_EXCEPTIONS:
+                if attempt == self.retries:
+                    raise
+            else:
+                if not _retryable(response) or attempt == self.retries:
+                    return response
+            self.retried += 1
+            await asyncio.sleep(self._backoff(attempt, deadline))
+
+    async def post(
+        self,
+        path: str,
+        affinity: Optional[str] = None,
+        hedgeable: bool = False,
+        hedge_json: Optional[Any] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        POST to the service.
+
+        Args:
+            path: Path of the endpoint, e.g. "/judge"
+            affinity: Key (such as a debate id) whose calls all go to the same replica
+            hedgeable: Whether a slow call may be duplicated to another replica
+            hedge_json: JSON body for the duplicate instead of the call's own,
+                e.g. one that does not rely on the session the primary holds
+            deadline: Unix time by which the debate has to be finished, if any
+            **kwargs: Arguments for httpx.AsyncClient.post
+
+        Returns:
+            The response of the first attempt that succeeded, or the last answer
+
+        Raises:
+            DeadlineExceeded: If the deadline passes before an attempt is made
+        """
+        self.requests += 1
+        start = time.perf_counter()
+        delay = self.hedge_delay() if hedgeable else None
+        if delay is None:
+            response = await self._send(self.replica(affinity) + path, deadline, **kwargs)
+        else:
+            response = await self._hedged(path, affinity, delay, hedge_json, deadline, **kwargs)
+        if response.is_success:
+            self._latencies.append(time.perf_counter() - start)
+        return response
+
+    async def _hedged(
+        self,
+        path: str,
+        affinity: Optional[str],
+        delay: float,
+        hedge_json: Optional[Any] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Send a call and, if it has not answered within delay seconds or has
+        failed, a duplicate to the next replica (with hedge_json as its body
+        if given); return the first successful answer.
+
+        A client error from the primary (such as a session miss) is returned
+        as is, while one from the duplicate is ignored.
+        """
+        duplicate_kwargs = kwargs if hedge_json is None else {**kwargs, "json": hedge_json}
+        primary = asyncio.create_task(self._send(self.replica(affinity) + path, deadline, **kwargs))
+        tasks = [primary]
+        try:
+            pending = set(tasks)
+            started = time.perf_counter()
+            while pending:
+                timeout = None
+                if len(tasks) == 1:
+                    timeout = max(0.0, delay - (time.perf_counter() - started))
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                answered = [task for task in done if task.exception() is None]
+                for task in answered:
+                    response = task.result()
+                    if response.is_success or (task is primary and response.status_code < 500):
+                        if task is not primary:
+                            self.hedge_wins += 1
+                        return response
+                if len(tasks) == 1:
+                    # The primary is slow or has failed: try the next replica
+                    self.hedged += 1
+                    duplicate = asyncio.create_task(
+                        self._send(self.replica(affinity, 1) + path, deadline, **duplicate_kwargs)
+                    )
+                    tasks.append(duplicate)
+                    pending.add(duplicate)
+            # Neither succeeded; answer as the primary did
+            return primary.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def broadcast(self, path: str, **kwargs: Any) -> List[httpx.Response]:
+        """POST the same call to every replica."""
+        self.requests += len(self.urls)
+        return list(await asyncio.gather(*(self._send(url + path, **kwargs) for url in self.urls)))
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        path: str,
+        affinity: Optional[str] = None,
+        deadline: Optional[float] = None,
+        **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        POST to the service and stream the response, retrying like post until
+        the response starts.
+        """
+        self.requests += 1
+        url = self.replica(affinity) + path
+        for attempt in range(self.retries + 1):
+            streaming = False
+            try:
+                async with self.client.stream("POST", url, **_deadline_options(deadline, kwargs)) as response:
+                    if not _retryable(response) or attempt == self.retries:
+                        streaming = True
+                        yield response
+                        return
+            except _RETRY_EXCEPTIONS:
+                if streaming or attempt == self.retries:
+                    raise
+            self.retried += 1
+            await asyncio.sleep(self._backoff(attempt, deadline))
+
+    def stats(self) -> dict:
+        """Call, retry and hedging counters and recent latency percentiles."""
+        latencies = sorted(self._latencies)
+        return {
+            "replicas": len(self.urls),
+            "requests": self.requests,
+            "retries": self.retried,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+        }
+
+    async def close(self):
+        """Close the HTTP client if this service client created it."""
+        if self._owns_client:
+            await self.client.aclose()
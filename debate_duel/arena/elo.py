@@ -1,14 +1,27 @@
-from debate_duel.settings.constants import DEFAULT_ELO, ELO_K_FACTOR
+from array import array
+
+from debate_duel.settings.constants import DEFAULT_ELO, ELO_K_FACTOR, ELO_TRAJECTORY_LIMIT
 from debate_duel.shared.schemas import Winner
 
 
 class EloEngine:
-    def __init__(self):
+    """
+    Pro and con ratings over the course of a single debate.
+    
+    The trajectory is stored as two integer arrays rather than a dict per
+    turn, and only the initial ratings plus the most recent max_points
+    ratings are kept, so a very long debate stays small in memory.
+    """
+    
+    def __init__(self, max_points: int = ELO_TRAJECTORY_LIMIT):
         self.ratings = {
             "pro": DEFAULT_ELO,
             "con": DEFAULT_ELO
         }
-        self.trajectory = [self.ratings.copy()]
+        self.initial = self.ratings.copy()
+        self.max_points = max(1, max_points)
+        self._pro = array("i")
+        self._con = array("i")
     
     def update(self, winner: Winner) -> dict:
         """
@@ -42,13 +55,21 @@ class EloEngine:
         self.ratings["pro"] = round(rating_a + ELO_K_FACTOR * (outcome_a - expected_a))
         self.ratings["con"] = round(rating_b + ELO_K_FACTOR * (outcome_b - expected_b))
         
-        # Record trajectory
-        self.trajectory.append(self.ratings.copy())
+        # Record trajectory, trimming in blocks so each update is amortized O(1)
+        self._pro.append(self.ratings["pro"])
+        self._con.append(self.ratings["con"])
+        if len(self._pro) >= 2 * self.max_points:
+            del self._pro[:-self.max_points]
+            del self._con[:-self.max_points]
         
         return self.ratings
     
     def get_trajectory(self) -> list:
         """
-        Returns the history of ELO ratings throughout the debate.
+        Returns the history of ELO ratings throughout the debate: the initial
+        ratings followed by the ratings after each of the last max_points turns.
         """
-        return self.trajectory 
\ No newline at end of file
+        start = max(0, len(self._pro) - self.max_points)
+        return [self.initial.copy()] + [
+            {"pro": pro, "con": con} for pro, con in zip(self._pro[start:], self._con[start:])
+        ]
@@ -1,25 +1,88 @@
 import httpx
 import asyncio
-from typing import List
+import contextlib
+import json
+import time
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union
 
-from debate_duel.settings.constants import SERVICE_URLS
+from debate_duel.settings.constants import (
+    SERVICE_REPLICAS,
+    SWARM_NAMES,
+    ARENA_MAX_CONCURRENT_DEBATES,
+    ARENA_DEBATE_DEADLINE,
+    ARENA_JUDGE_BATCH_WINDOW_MS,
+    JUDGE_BATCH_MAX_SIZE
+)
+from debate_duel.shared.batching import MicroBatcher
+from debate_duel.shared.deadlines import DEGRADATIONS, DeadlineExceeded
 from debate_duel.shared.schemas import (
     TopicRequest, 
+    DebateEvent,
+    TournamentRequest,
+    TournamentEntry,
     ArgumentRequest, 
     Turn, 
     JudgeRequest,
     JudgeResponse,
+    JudgeBatchRequest,
+    JudgeBatchResponse,
+    WarmupRequest,
     Stance,
     Winner,
     DebateResult
 )
+from debate_duel.arena.clients import ServiceClient
 from debate_duel.arena.elo import EloEngine
+from debate_duel.arena.ratings import RatingLedger, outcome_score, player_key
+from debate_duel.arena.store import DebateStore
+from debate_duel.agents.summarizer import SummarizerAgent
+
+
+def _is_deadline_error(error: Exception) -> bool:
+    """Whether a failed service call ran out of the debate's time."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code == 504
+    return isinstance(error, (DeadlineExceeded, httpx.TimeoutException, TimeoutError))
+
+
+class SwarmSession:
+    """The arena's view of a debate's sessions on the two swarms."""
+    
+    def __init__(self, use_opening_pool: bool = False, deadline: Optional[float] = None):
+        self.debate_id = uuid.uuid4().hex
+        self.use_opening_pool = use_opening_pool
+        # Unix time by which the debate has to be finished, if any
+        self.deadline = deadline
+        # Number of turns each side's swarm already holds
+        self.synced: Dict[Stance, int] = {Stance.PRO: 0, Stance.CON: 0}
 
 
 class DebateOrchestrator:
-    def __init__(self):
-        self.client = httpx.AsyncClient(timeout=60.0)
-        self.elo_engine = EloEngine()
+    def __init__(self, client: Optional[httpx.AsyncClient] = None, store: Optional[DebateStore] = None):
+        """
+        Args:
+            client: Optional HTTP client for calls to the swarm and judge
+                services; by default each service gets its own connection pool
+            store: Optional store every finished debate is saved to
+        """
+        self.client = client
+        self.services = {
+            service_key: ServiceClient(urls, client=client)
+            for service_key, urls in SERVICE_REPLICAS.items()
+        }
+        self.store = store
+        # Ratings of the swarm configurations across all debates; each debate
+        # keeps its own pro/con EloEngine
+        self.ledger = RatingLedger()
+        self.summarizer = SummarizerAgent()
+        self.debate_slots = asyncio.Semaphore(ARENA_MAX_CONCURRENT_DEBATES)
+        # Groups judge calls from concurrent debates into POST /judge/batch
+        self.judge_batcher = MicroBatcher(
+            self._post_judge_batch,
+            max_batch_size=JUDGE_BATCH_MAX_SIZE,
+            max_wait=ARENA_JUDGE_BATCH_WINDOW_MS / 1000
+        ) if ARENA_JUDGE_BATCH_WINDOW_MS > 0 else None
     
     async def run_debate(self, topic_request: TopicRequest) -> DebateResult:
         """
@@ -31,22 +94,86 @@ class DebateOrchestrator:
         Returns:
             A DebateResult with the full history and ELO trajectory
         """
+        result = None
+        async for event in self.stream_debate(topic_request):
+            if event.event == "result":
+                result = event.result
+        return result
+    
+    async def stream_debate(self, topic_request: TopicRequest) -> AsyncIterator[DebateEvent]:
+        """
+        Run a complete debate, yielding progress events as soon as they are available.
+        
+        Each turn yields an "argument" event per side in the order the swarms
+        finish, then a "judge" event and an "elo" event. The final event is a
+        "result" carrying the full DebateResult. With stream_tokens set, the
+        swarms' tokens are forwarded as "token" events before each argument.
+        
+        With a deadline (deadline_seconds, or ARENA_DEBATE_DEADLINE) every
+        service call carries it and times out with it, and a round that
+        cannot be finished in time ends the debate with the rounds before it.
+        
+        Args:
+            topic_request: The topic and number of turns for the debate
+            
+        Yields:
+            DebateEvents describing the debate's progress
+        """
         topic = topic_request.topic
         num_turns = topic_request.num_turns
+        memory_window = topic_request.memory_window
+        history_summary: Optional[str] = None
         turns: List[Turn] = []
+        time_limit = topic_request.deadline_seconds or ARENA_DEBATE_DEADLINE
+        deadline = time.time() + time_limit if time_limit else None
+        session = SwarmSession(use_opening_pool=topic_request.use_opening_pool, deadline=deadline)
+        elo_engine = EloEngine()
         
         # Record initial ELO
-        initial_elo = self.elo_engine.ratings.copy()
+        initial_elo = elo_engine.ratings.copy()
         
         for turn_idx in range(num_turns):
-            # Get arguments from both swarms
-            pro_argument, con_argument = await asyncio.gather(
-                self._get_argument(topic, Stance.PRO, turns),
-                self._get_argument(topic, Stance.CON, turns)
-            )
+            if deadline is not None and time.time() >= deadline:
+                # Out of time: the debate ends with the rounds played so far
+                DEGRADATIONS["debate_cut_short"] += 1
+                break
             
-            # Get judge's decision
-            judge_response = await self._get_judge_decision(topic, pro_argument, con_argument)
+            try:
+                # Get arguments from both swarms, reporting each as soon as it arrives
+                arguments = {}
+                async for stance, text, complete in self._get_arguments(
+                    topic, turns, memory_window, history_summary, topic_request.stream_tokens, session
+                ):
+                    if complete:
+                        arguments[stance] = text
+                        yield DebateEvent(event="argument", turn=turn_idx + 1, stance=stance, content=text)
+                    else:
+                        yield DebateEvent(event="token", turn=turn_idx + 1, stance=stance, content=text)
+                pro_argument = arguments[Stance.PRO]
+                con_argument = arguments[Stance.CON]
+                
+                # Get judge's decision
+                judge_call = self._get_judge_decision(
+                    topic, pro_argument, con_argument, topic_request.judge_panel_size, deadline
+                )
+                summary_ready = False
+                if topic_request.speculative and turn_idx < num_turns - 1 and memory_window != 0:
+                    # Let the swarms plan the next turn while the judge runs
+                    provisional = turns + [Turn(pro_argument=pro_argument, con_argument=con_argument)]
+                    judge_response, history_summary = await asyncio.gather(
+                        judge_call,
+                        self._prepare_next_turn(topic, provisional, memory_window, history_summary, session)
+                    )
+                    summary_ready = True
+                else:
+                    judge_response = await judge_call
+            except Exception as e:
+                if not (turns and _is_deadline_error(e)):
+                    raise
+                # The round could not be finished in time; it is dropped
+                DEGRADATIONS["debate_cut_short"] += 1
+                break
+            yield DebateEvent(event="judge", turn=turn_idx + 1, judge_decision=judge_response)
             
             # Create turn record
             turn = Turn(
@@ -57,63 +184,397 @@ class DebateOrchestrator:
             turns.append(turn)
             
             # Update ELO ratings
-            self.elo_engine.update(judge_response.winner)
+            ratings = elo_engine.update(judge_response.winner)
+            yield DebateEvent(event="elo", turn=turn_idx + 1, elo=ratings.copy())
+            
+            # Fold the round leaving the memory window into the running summary
+            if (
+                not summary_ready
+                and memory_window is not None
+                and turn_idx < num_turns - 1
+                and len(turns) > memory_window
+            ):
+                evicted_idx = len(turns) - memory_window - 1
+                history_summary = await self.summarizer.fold_round_async(
+                    topic, history_summary, turns[evicted_idx], evicted_idx
+                )
         
         # Determine final winner based on final ELO scores
-        if self.elo_engine.ratings["pro"] > self.elo_engine.ratings["con"]:
+        if elo_engine.ratings["pro"] > elo_engine.ratings["con"]:
             final_winner = Winner.PRO
-        elif self.elo_engine.ratings["con"] > self.elo_engine.ratings["pro"]:
+        elif elo_engine.ratings["con"] > elo_engine.ratings["pro"]:
             final_winner = Winner.CON
         else:
             final_winner = Winner.TIE
         
         # Create final result
         result = DebateResult(
+            debate_id=session.debate_id,
             topic=topic,
             turns=turns,
             final_winner=final_winner,
             initial_elo=initial_elo,
-            final_elo=self.elo_engine.ratings,
-            elo_trajectory=self.elo_engine.get_trajectory()
+            final_elo=elo_engine.ratings.copy(),
+            elo_trajectory=elo_engine.get_trajectory()
         )
         
-        return result
+        # Applied in one call so concurrent debates never see half of another's rounds
+        self.ledger.apply(self._ledger_matches(turns))
+        if self.store is not None:
+            self.store.save(result)
+        
+        yield DebateEvent(event="result", result=result)
+    
+    async def _prepare_next_turn(
+        self,
+        topic: str,
+        provisional: List[Turn],
+        memory_window: Optional[int],
+        history_summary: Optional[str],
+        session: SwarmSession
+    ) -> Optional[str]:
+        """
+        Ask both swarms to start preparing the next turn from a history whose
+        latest round has no verdict yet.
+        
+        The round leaving the memory window (which already has its verdict) is
+        folded into the summary first, so the swarms prepare with the same
+        summary the next turn will use. Failed preparations are ignored; the
+        swarm then does the work when the next turn is requested.
+        
+        Returns:
+            The summary to use for the next turn
+        """
+        if memory_window is not None and len(provisional) > memory_window:
+            evicted_idx = len(provisional) - memory_window - 1
+            history_summary = await self.summarizer.fold_round_async(
+                topic, history_summary, provisional[evicted_idx], evicted_idx
+            )
+        
+        await asyncio.gather(
+            *(
+                self._prepare_argument(topic, stance, provisional, memory_window, history_summary, session)
+                for stance in (Stance.PRO, Stance.CON)
+            ),
+            return_exceptions=True
+        )
+        return history_summary
+    
+    def _ledger_matches(self, turns: List[Turn]) -> List[Tuple[str, str, float]]:
+        """The judged rounds of a debate as rating ledger matches."""
+        pro_player = player_key(SWARM_NAMES["swarm_a"], Stance.PRO)
+        con_player = player_key(SWARM_NAMES["swarm_b"], Stance.CON)
+        return [
+            (pro_player, con_player, outcome_score(turn.judge_decision.winner))
+            for turn in turns
+            if turn.judge_decision is not None
+        ]
+    
+    async def _get_arguments(
+        self,
+        topic: str,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        stream_tokens: bool = False,
+        session: Optional[SwarmSession] = None
+    ) -> AsyncIterator[Tuple[Stance, str, bool]]:
+        """
+        Request arguments from both swarms concurrently.
+        
+        Yields (stance, text, complete) tuples: with stream_tokens, partial
+        (stance, delta, False) tuples as tokens arrive, and for each side a final
+        (stance, argument, True) tuple, in the order the sides complete.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def produce(stance: Stance) -> None:
+            try:
+                if stream_tokens:
+                    chunks = []
+                    async for delta in self._stream_argument(
+                        topic, stance, history, memory_window, history_summary, session
+                    ):
+                        chunks.append(delta)
+                        queue.put_nowait((stance, delta, False))
+                    argument = "".join(chunks)
+                else:
+                    argument = await self._get_argument(
+                        topic, stance, history, memory_window, history_summary, session
+                    )
+            except Exception as e:
+                queue.put_nowait((stance, e, True))
+                return
+            queue.put_nowait((stance, argument, True))
+        
+        tasks = [asyncio.create_task(produce(stance)) for stance in (Stance.PRO, Stance.CON)]
+        try:
+            remaining = len(tasks)
+            while remaining:
+                stance, text, complete = await queue.get()
+                if isinstance(text, Exception):
+                    raise text
+                if complete:
+                    remaining -= 1
+                yield stance, text, complete
+        finally:
+            for task in tasks:
+                task.cancel()
     
-    async def _get_argument(self, topic: str, stance: Stance, history: List[Turn]) -> str:
+    async def run_tournament(self, tournament_request: TournamentRequest) -> AsyncIterator[TournamentEntry]:
         """
-        Request an argument from a swarm agent.
+        Run many debates concurrently, yielding each result as soon as it finishes.
+        
+        Debates share the arena-wide concurrency limit, and the request may
+        tighten it further with max_concurrency. A failed debate is reported
+        as an entry with an error instead of aborting the tournament.
+        
+        Args:
+            tournament_request: The debates to run and an optional concurrency cap
+            
+        Yields:
+            A TournamentEntry per debate, in completion order
         """
-        service_key = "swarm_a" if stance == Stance.PRO else "swarm_b"
-        url = f"{SERVICE_URLS[service_key]}/generate_argument"
+        limit = tournament_request.max_concurrency
+        request_slots = asyncio.Semaphore(limit) if limit else contextlib.nullcontext()
         
-        request = ArgumentRequest(
+        async def run_one(index: int, topic_request: TopicRequest) -> TournamentEntry:
+            entry = TournamentEntry(index=index, topic=topic_request.topic)
+            try:
+                async with request_slots, self.debate_slots:
+                    entry.result = await self.run_debate(topic_request)
+            except Exception as e:
+                entry.error = str(e)
+            return entry
+        
+        tasks = [
+            asyncio.create_task(run_one(index, topic_request))
+            for index, topic_request in enumerate(tournament_request.debates)
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Stop outstanding debates if the consumer goes away early
+            for task in tasks:
+                task.cancel()
+    
+    def _argument_request(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int],
+        history_summary: Optional[str],
+        session: Optional[SwarmSession],
+        full_history: bool
+    ) -> ArgumentRequest:
+        """
+        Build an argument request, carrying only the turns the swarm's session
+        lacks unless full_history is set.
+        """
+        offset = 0 if session is None or full_history else session.synced[stance]
+        return ArgumentRequest(
             topic=topic,
             stance=stance,
-            history=history
+            history=history[offset:],
+            memory_window=memory_window,
+            history_summary=history_summary,
+            debate_id=session.debate_id if session else None,
+            history_offset=offset,
+            use_opening_pool=session is not None and session.use_opening_pool and not history
         )
+    
+    async def _get_argument(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        session: Optional[SwarmSession] = None
+    ) -> str:
+        """
+        Request an argument from a swarm agent, resending the full history if
+        the swarm no longer holds the debate's session.
+        """
+        service = self.services["swarm_a" if stance == Stance.PRO else "swarm_b"]
         
-        response = await self.client.post(url, json=request.model_dump())
-        response.raise_for_status()
+        for full_history in (False, True):
+            request = self._argument_request(
+                topic, stance, history, memory_window, history_summary, session, full_history
+            )
+            # A hedged duplicate goes to a replica without the session, so it
+            # carries the full history instead
+            hedge_json = None
+            if session is not None and service.hedge_delay() is not None:
+                hedge_json = self._argument_request(
+                    topic, stance, history, memory_window, history_summary, None, True
+                ).model_dump()
+            response = await service.post(
+                "/generate_argument",
+                affinity=request.debate_id,
+                hedgeable=True,
+                hedge_json=hedge_json,
+                json=request.model_dump(),
+                deadline=session.deadline if session else None
+            )
+            if response.status_code == 409 and not full_history:
+                continue
+            response.raise_for_status()
+            break
         
+        if session is not None:
+            session.synced[stance] = len(history)
         return response.json()["content"]
     
-    async def _get_judge_decision(self, topic: str, pro_argument: str, con_argument: str) -> JudgeResponse:
+    async def _stream_argument(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int] = None,
+        history_summary: Optional[str] = None,
+        session: Optional[SwarmSession] = None
+    ) -> AsyncIterator[str]:
+        """
+        Request an argument from a swarm agent in streaming mode, yielding
+        token chunks as they arrive.
+        """
+        service = self.services["swarm_a" if stance == Stance.PRO else "swarm_b"]
+        
+        for full_history in (False, True):
+            request = self._argument_request(
+                topic, stance, history, memory_window, history_summary, session, full_history
+            )
+            async with service.stream(
+                "/generate_argument",
+                affinity=request.debate_id,
+                params={"stream": "true"},
+                json=request.model_dump(),
+                deadline=session.deadline if session else None
+            ) as response:
+                if response.status_code == 409 and not full_history:
+                    continue
+                response.raise_for_status()
+                if session is not None:
+                    session.synced[stance] = len(history)
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    message = json.loads(line)
+                    if "error" in message:
+                        if message.get("deadline"):
+                            raise DeadlineExceeded(message["error"])
+                        raise RuntimeError(message["error"])
+                    if "delta" in message:
+                        yield message["delta"]
+                return
+    
+    async def _prepare_argument(
+        self,
+        topic: str,
+        stance: Stance,
+        history: List[Turn],
+        memory_window: Optional[int],
+        history_summary: Optional[str],
+        session: SwarmSession
+    ) -> None:
+        """
+        Ask a swarm agent to prepare its next argument speculatively.
+        """
+        service = self.services["swarm_a" if stance == Stance.PRO else "swarm_b"]
+        
+        for full_history in (False, True):
+            request = self._argument_request(
+                topic, stance, history, memory_window, history_summary, session, full_history
+            )
+            response = await service.post(
+                "/prepare_argument",
+                affinity=request.debate_id,
+                json=request.model_dump(),
+                deadline=session.deadline
+            )
+            if response.status_code == 409 and not full_history:
+                continue
+            response.raise_for_status()
+            return
+    
+    async def warm_openings(self, warmup_request: WarmupRequest) -> Dict[str, int]:
         """
-        Request a judgment from the judge agent.
+        Ask each swarm to precompute opening arguments for its side of a topic.
+        
+        Args:
+            warmup_request: The topic, the number of openings per side and
+                optionally the only side to warm up
+            
+        Returns:
+            The number of openings each side's swarm scheduled
         """
-        url = f"{SERVICE_URLS['judge']}/judge"
+        stances = [warmup_request.stance] if warmup_request.stance else [Stance.PRO, Stance.CON]
         
+        async def warm(stance: Stance) -> int:
+            service_key = "swarm_a" if stance == Stance.PRO else "swarm_b"
+            request = warmup_request.model_copy(update={"stance": stance})
+            # Every replica keeps its own pool
+            responses = await self.services[service_key].broadcast("/warmup", json=request.model_dump())
+            for response in responses:
+                response.raise_for_status()
+            return sum(response.json()["scheduled"][stance.value] for response in responses)
+        
+        scheduled = await asyncio.gather(*(warm(stance) for stance in stances))
+        return {stance.value: count for stance, count in zip(stances, scheduled)}
+    
+    async def _get_judge_decision(
+        self,
+        topic: str,
+        pro_argument: str,
+        con_argument: str,
+        panel_size: Optional[int] = None,
+        deadline: Optional[float] = None
+    ) -> JudgeResponse:
+        """
+        Request a judgment from the judge agent, within the debate's deadline if it has one.
+        """
         request = JudgeRequest(
             topic=topic,
             pro_argument=pro_argument,
-            con_argument=con_argument
+            con_argument=con_argument,
+            panel_size=panel_size
         )
         
-        response = await self.client.post(url, json=request.model_dump())
+        if self.judge_batcher is not None:
+            # Batches mix debates, so only the wait is bounded by this one's deadline
+            time_left = deadline - time.time() if deadline is not None else None
+            return await asyncio.wait_for(self.judge_batcher.submit(request), timeout=time_left)
+        
+        response = await self.services["judge"].post(
+            "/judge", hedgeable=True, json=request.model_dump(), deadline=deadline
+        )
         response.raise_for_status()
         
         return JudgeResponse(**response.json())
     
+    async def _post_judge_batch(self, requests: List[JudgeRequest]) -> List[Union[JudgeResponse, Exception]]:
+        """
+        Judge a batch of rounds with a single call to the judge agent.
+        """
+        batch = JudgeBatchRequest(requests=requests)
+        response = await self.services["judge"].post("/judge/batch", json=batch.model_dump())
+        response.raise_for_status()
+        
+        return [
+            item.response if item.response is not None else RuntimeError(item.error)
+            for item in JudgeBatchResponse(**response.json()).results
+        ]
+    
+    def service_stats(self) -> Dict[str, dict]:
+        """Call, retry and hedging statistics per service."""
+        return {service_key: service.stats() for service_key, service in self.services.items()}
+    
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose() 
\ No newline at end of file
+        """Close the HTTP clients."""
+        for service in self.services.values():
+            await service.close()
+        if self.client is not None:
+            await self.client.aclose() 
\ No newline at end of file
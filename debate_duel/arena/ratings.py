@@ -0,0 +1,155 @@
+"""
+ELO ratings for any number of players across debates.
+
+Players are arbitrary identities, normally a swarm configuration and the side
+it argued ("team-4o-mini@pro"). Ratings, games played and results are NumPy
+arrays indexed by player, so a batch of match outcomes is applied in one
+vectorized pass instead of a Python loop per match.
+"""
+import threading
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from debate_duel.settings.constants import DEFAULT_ELO, ELO_K_FACTOR
+from debate_duel.shared.schemas import LeaderboardEntry, Stance, Winner
+
+
+def player_key(agent: str, stance: Stance) -> str:
+    """Ledger identity of an agent arguing one side."""
+    return f"{agent}@{stance.value}"
+
+
+def outcome_score(winner: Winner) -> float:
+    """Score of the pro side for a round outcome: 1 win, 0.5 tie, 0 loss."""
+    if winner == Winner.PRO:
+        return 1.0
+    if winner == Winner.CON:
+        return 0.0
+    return 0.5
+
+
+class RatingLedger:
+    """
+    ELO ratings and records for a growing set of players.
+
+    Safe to share between concurrent debates: each batch is applied under a
+    lock, so readers see either all of a batch or none of it.
+    """
+
+    def __init__(self, initial_rating: float = DEFAULT_ELO, k_factor: float = ELO_K_FACTOR, capacity: int = 64):
+        """
+        Initialize an empty ledger.
+
+        Args:
+            initial_rating: Rating of a player in their first match
+            k_factor: ELO K-factor
+            capacity: Initial size of the player arrays (they grow as needed)
+        """
+        self.initial_rating = initial_rating
+        self.k_factor = k_factor
+        self._lock = threading.Lock()
+        self._index: Dict[str, int] = {}
+        self._names: List[str] = []
+        capacity = max(1, capacity)
+        self._ratings = np.full(capacity, initial_rating, dtype=np.float64)
+        self._games = np.zeros(capacity, dtype=np.int64)
+        self._wins = np.zeros(capacity, dtype=np.int64)
+        self._draws = np.zeros(capacity, dtype=np.int64)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+    def _grow(self, size: int) -> None:
+        capacity = len(self._ratings)
+        while capacity < size:
+            capacity *= 2
+        extra = capacity - len(self._ratings)
+        if extra:
+            self._ratings = np.concatenate([self._ratings, np.full(extra, self.initial_rating, dtype=np.float64)])
+            self._games = np.concatenate([self._games, np.zeros(extra, dtype=np.int64)])
+            self._wins = np.concatenate([self._wins, np.zeros(extra, dtype=np.int64)])
+            self._draws = np.concatenate([self._draws, np.zeros(extra, dtype=np.int64)])
+
+    def player_id(self, name: str) -> int:
+        """Array index of a player, registering them on first use."""
+        with self._lock:
+            return self._player_id(name)
+
+    def _player_id(self, name: str) -> int:
+        index = self._index.get(name)
+        if index is None:
+            index = len(self._names)
+            self._grow(index + 1)
+            self._index[name] = index
+            self._names.append(name)
+        return index
+
+    def rating(self, name: str) -> float:
+        """Current rating of a player (the initial rating if unknown)."""
+        with self._lock:
+            index = self._index.get(name)
+            return float(self._ratings[index]) if index is not None else self.initial_rating
+
+    def apply(self, matches: Sequence[Tuple[str, str, float]]) -> None:
+        """
+        Apply a batch of match outcomes.
+
+        Every match in the batch is scored against the ratings from before the
+        batch, as in a rating period, so the result does not depend on the
+        order of matches within it.
+
+        Args:
+            matches: (player_a, player_b, score_a) tuples, where score_a is 1 for
+                a win by player_a, 0.5 for a tie and 0 for a loss
+        """
+        if not matches:
+            return
+        scores = np.fromiter((score for _, _, score in matches), dtype=np.float64, count=len(matches))
+        with self._lock:
+            players_a = np.fromiter((self._player_id(a) for a, _, _ in matches), dtype=np.int64, count=len(matches))
+            players_b = np.fromiter((self._player_id(b) for _, b, _ in matches), dtype=np.int64, count=len(matches))
+            self._apply_arrays(players_a, players_b, scores)
+
+    def apply_arrays(self, players_a: np.ndarray, players_b: np.ndarray, scores: np.ndarray) -> None:
+        """Vectorized core of apply, taking player indices from player_id."""
+        with self._lock:
+            self._apply_arrays(players_a, players_b, scores)
+
+    def _apply_arrays(self, players_a: np.ndarray, players_b: np.ndarray, scores: np.ndarray) -> None:
+        expected = 1.0 / (1.0 + 10.0 ** ((self._ratings[players_b] - self._ratings[players_a]) / 400.0))
+        delta = self.k_factor * (scores - expected)
+        np.add.at(self._ratings, players_a, delta)
+        np.add.at(self._ratings, players_b, -delta)
+
+        np.add.at(self._games, players_a, 1)
+        np.add.at(self._games, players_b, 1)
+        np.add.at(self._wins, players_a, scores == 1.0)
+        np.add.at(self._wins, players_b, scores == 0.0)
+        draws = scores == 0.5
+        np.add.at(self._draws, players_a, draws)
+        np.add.at(self._draws, players_b, draws)
+
+    def leaderboard(self, limit: int = 50) -> List[LeaderboardEntry]:
+        """The highest-rated players, best first."""
+        with self._lock:
+            count = len(self._names)
+            order = np.argsort(-self._ratings[:count], kind="stable")[:limit]
+            rows = [
+                (self._names[index], float(self._ratings[index]), int(self._games[index]),
+                 int(self._wins[index]), int(self._draws[index]))
+                for index in order
+            ]
+        return [
+            LeaderboardEntry(
+                rank=rank,
+                player=name,
+                rating=round(rating, 1),
+                games=games,
+                wins=wins,
+                draws=draws,
+                losses=games - wins - draws
+            )
+            for rank, (name, rating, games, wins, draws) in enumerate(rows, start=1)
+        ]
@@ -0,0 +1,339 @@
+"""
+Persistent store of finished debates.
+
+Results are queued by the arena and written in batches by a background task,
+so persisting never holds up a debate. Each debate is one row in `debates`
+plus one row per round in `turns` (both arguments and the judge's decision).
+The database runs in WAL mode, so reads from GET /debates do not wait on writes.
+"""
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Iterator, List, Optional
+
+from debate_duel.settings.constants import ARENA_DB_BATCH_SIZE, ARENA_DB_FLUSH_INTERVAL
+from debate_duel.shared.schemas import DebateResult, DebateSummary, JudgeResponse, Turn, Winner
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS debates ("
+    "id INTEGER PRIMARY KEY AUTOINCREMENT, "
+    "debate_id TEXT NOT NULL UNIQUE, "
+    "topic TEXT NOT NULL, "
+    "num_turns INTEGER NOT NULL, "
+    "final_winner TEXT NOT NULL, "
+    "initial_elo TEXT NOT NULL, "
+    "final_elo TEXT NOT NULL, "
+    "elo_trajectory TEXT NOT NULL, "
+    "created REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS turns ("
+    "debate_id TEXT NOT NULL, "
+    "turn_index INTEGER NOT NULL, "
+    "pro_argument TEXT NOT NULL, "
+    "con_argument TEXT NOT NULL, "
+    "winner TEXT, "
+    "justification TEXT, "
+    "confidence REAL, "
+    "votes TEXT, "
+    "PRIMARY KEY (debate_id, turn_index))",
+    "CREATE INDEX IF NOT EXISTS debates_topic ON debates (topic)",
+    "CREATE INDEX IF NOT EXISTS debates_winner ON debates (final_winner)",
+    "CREATE INDEX IF NOT EXISTS debates_created ON debates (created)",
+)
+
+
+# Columns added to turns after its first version, created on older databases
+_TURN_COLUMNS = {"confidence": "REAL", "votes": "TEXT"}
+
+_TURN_FIELDS = "pro_argument, con_argument, winner, justification, confidence, votes"
+
+
+def _build_turn(
+    pro_argument: str,
+    con_argument: str,
+    winner: Optional[str],
+    justification: Optional[str],
+    confidence: Optional[float],
+    votes: Optional[str]
+) -> Turn:
+    decision = None
+    if winner:
+        decision = JudgeResponse(
+            winner=winner,
+            justification=justification,
+            confidence=confidence,
+            votes=json.loads(votes) if votes else None
+        )
+    return Turn(pro_argument=pro_argument, con_argument=con_argument, judge_decision=decision)
+
+
+class DebateStore:
+    """SQLite-backed debate history with batched background writes."""
+
+    def __init__(
+        self,
+        db_path: str,
+        batch_size: int = ARENA_DB_BATCH_SIZE,
+        flush_interval: float = ARENA_DB_FLUSH_INTERVAL
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite database file
+            batch_size: Maximum number of debates written per transaction
+            flush_interval: Seconds to wait for more debates before writing a batch
+        """
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        # Separate connections so readers never queue behind a write batch
+        self._writer = sqlite3.connect(db_path, check_same_thread=False)
+        self._writer.execute("PRAGMA journal_mode=WAL")
+        self._writer.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._writer.execute(statement)
+        existing = {row[1] for row in self._writer.execute("PRAGMA table_info(turns)")}
+        for column, column_type in _TURN_COLUMNS.items():
+            if column not in existing:
+                self._writer.execute(f"ALTER TABLE turns ADD COLUMN {column} {column_type}")
+        self._writer.commit()
+        self._reader = sqlite3.connect(db_path, check_same_thread=False)
+        self._read_lock = threading.Lock()
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def save(self, result: DebateResult) -> None:
+        """Queue a finished debate for writing; returns immediately."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._write_loop())
+        self._queue.put_nowait((result, time.time()))
+
+    async def _write_loop(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            if self.flush_interval > 0:
+                await asyncio.sleep(self.flush_interval)
+
+            batch = [item]
+            stop = False
+            while len(batch) < self.batch_size and not self._queue.empty():
+                item = self._queue.get_nowait()
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+
+            try:
+                await asyncio.to_thread(self._write_batch, batch)
+            except Exception:
+                logger.exception("Failed to store %d debates", len(batch))
+            if stop:
+                return
+
+    def _write_batch(self, batch) -> None:
+        debates = []
+        turns = []
+        for result, created in batch:
+            debates.append((
+                result.debate_id,
+                result.topic,
+                len(result.turns),
+                result.final_winner.value,
+                json.dumps(result.initial_elo),
+                json.dumps(result.final_elo),
+                json.dumps(result.elo_trajectory),
+                created,
+            ))
+            for index, turn in enumerate(result.turns):
+                decision = turn.judge_decision
+                turns.append((
+                    result.debate_id,
+                    index,
+                    turn.pro_argument,
+                    turn.con_argument,
+                    decision.winner.value if decision else None,
+                    decision.justification if decision else None,
+                    decision.confidence if decision else None,
+                    json.dumps(decision.votes) if decision and decision.votes else None,
+                ))
+
+        with self._writer:
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO debates (debate_id, topic, num_turns, final_winner, "
+                "initial_elo, final_elo, elo_trajectory, created) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                debates
+            )
+            self._writer.executemany(
+                "INSERT OR IGNORE INTO turns (debate_id, turn_index, pro_argument, con_argument, "
+                "winner, justification, confidence, votes) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                turns
+            )
+
+    def _query(self, sql: str, params=()) -> list:
+        with self._read_lock:
+            return self._reader.execute(sql, params).fetchall()
+
+    async def list_debates(
+        self,
+        topic: Optional[str] = None,
+        winner: Optional[Winner] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        limit: int = 50,
+        cursor: Optional[int] = None
+    ) -> List[DebateSummary]:
+        """
+        List stored debates, newest first.
+
+        Args:
+            topic: Only debates on exactly this topic
+            winner: Only debates with this final winner
+            since: Only debates stored at or after this Unix time
+            until: Only debates stored before this Unix time
+            limit: Maximum number of debates returned
+            cursor: Only debates older than this cursor (from a previous page)
+
+        Returns:
+            Debate summaries, each carrying the cursor for the next page
+        """
+        clauses = []
+        params: list = []
+        if topic is not None:
+            clauses.append("topic = ?")
+            params.append(topic)
+        if winner is not None:
+            clauses.append("final_winner = ?")
+            params.append(winner.value)
+        if since is not None:
+            clauses.append("created >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("created < ?")
+            params.append(until)
+        if cursor is not None:
+            clauses.append("id < ?")
+            params.append(cursor)
+
+        where = f"WHERE {' AND '.join(clauses)} " if clauses else ""
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT id, debate_id, topic, num_turns, final_winner, final_elo, created "
+            f"FROM debates {where}ORDER BY id DESC LIMIT ?",
+            (*params, limit)
+        )
+        return [
+            DebateSummary(
+                cursor=row[0],
+                debate_id=row[1],
+                topic=row[2],
+                num_turns=row[3],
+                final_winner=row[4],
+                final_elo=json.loads(row[5]),
+                created=row[6]
+            )
+            for row in rows
+        ]
+
+    async def get_debate(self, debate_id: str) -> Optional[DebateResult]:
+        """Load a stored debate with all of its turns, or None if unknown."""
+        rows = await asyncio.to_thread(
+            self._query,
+            "SELECT topic, final_winner, initial_elo, final_elo, elo_trajectory "
+            "FROM debates WHERE debate_id = ?",
+            (debate_id,)
+        )
+        if not rows:
+            return None
+        topic, final_winner, initial_elo, final_elo, elo_trajectory = rows[0]
+
+        turn_rows = await asyncio.to_thread(
+            self._query,
+            f"SELECT {_TURN_FIELDS} "
+            "FROM turns WHERE debate_id = ? ORDER BY turn_index",
+            (debate_id,)
+        )
+        turns = [_build_turn(*row) for row in turn_rows]
+        return DebateResult(
+            debate_id=debate_id,
+            topic=topic,
+            turns=turns,
+            final_winner=final_winner,
+            initial_elo=json.loads(initial_elo),
+            final_elo=json.loads(final_elo),
+            elo_trajectory=json.loads(elo_trajectory)
+        )
+
+    async def close(self) -> None:
+        """Write everything still queued, then close the database."""
+        if self._task is not None:
+            self._queue.put_nowait(None)
+            await self._task
+            self._task = None
+        self._writer.close()
+        self._reader.close()
+
+
+def iter_debates(
+    db_path: str,
+    min_turns: int = 0,
+    exclude_ties: bool = False,
+    page_size: int = 500
+) -> Iterator[DebateResult]:
+    """
+    Read stored debates oldest first, a page at a time, so memory use stays
+    constant however large the database is.
+
+    Args:
+        db_path: SQLite database file written by the arena
+        min_turns: Skip debates with fewer rounds than this
+        exclude_ties: Skip debates whose final winner is a tie
+        page_size: Number of debates loaded per query
+
+    Yields:
+        Stored debates as DebateResults
+    """
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        sql = (
+            "SELECT id, debate_id, topic, final_winner, initial_elo, final_elo, elo_trajectory "
+            "FROM debates WHERE id > ? AND num_turns >= ? AND final_winner != ? ORDER BY id LIMIT ?"
+        )
+        # No stored debate has an empty winner, so this excludes nothing
+        skip_winner = Winner.TIE.value if exclude_ties else ""
+        last_id = 0
+        while True:
+            rows = conn.execute(sql, (last_id, min_turns, skip_winner, page_size)).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+
+            debate_ids = [row[1] for row in rows]
+            turns = {debate_id: [] for debate_id in debate_ids}
+            placeholders = ", ".join("?" * len(debate_ids))
+            for debate_id, *turn in conn.execute(
+                f"SELECT debate_id, {_TURN_FIELDS} FROM turns "
+                f"WHERE debate_id IN ({placeholders}) ORDER BY debate_id, turn_index",
+                debate_ids
+            ):
+                turns[debate_id].append(_build_turn(*turn))
+
+            for _, debate_id, topic, final_winner, initial_elo, final_elo, elo_trajectory in rows:
+                yield DebateResult(
+                    debate_id=debate_id,
+                    topic=topic,
+                    turns=turns[debate_id],
+                    final_winner=final_winner,
+                    initial_elo=json.loads(initial_elo),
+                    final_elo=json.loads(final_elo),
+                    elo_trajectory=json.loads(elo_trajectory)
+                )
+    finally:
+        conn.close()
@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, Optional, TextIO
+
+from debate_duel.arena.store import iter_debates
+from debate_duel.export.records import preference_pairs, sft_records
+
+
+class ShardedWriter:
+    """Writes JSONL records to numbered files of at most shard_size records each."""
+    
+    def __init__(self, directory: str, prefix: str, shard_size: int):
+        self.directory = directory
+        self.prefix = prefix
+        self.shard_size = max(1, shard_size)
+        self.count = 0
+        self._file: Optional[TextIO] = None
+    
+    def write(self, record: Dict[str, Any]) -> None:
+        if self.count % self.shard_size == 0:
+            self.close()
+            path = os.path.join(self.directory, f"{self.prefix}-{self.count // self.shard_size:05d}.jsonl")
+            self._file = open(path, "w", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.count += 1
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def main():
+    """
+    Export stored debates as JSONL preference pairs and SFT records.
+    
+    Debates are streamed from the arena's database, so memory use does not
+    grow with the size of the export.
+    """
+    parser = argparse.ArgumentParser(description="Export stored debates as fine-tuning datasets")
+    parser.add_argument("--db", default=os.environ.get("ARENA_DB", "debates.db"),
+                        help="Debate database written by the arena")
+    parser.add_argument("--output-dir", required=True,
+                        help="Directory the JSONL shards are written to")
+    parser.add_argument("--format", choices=["pairs", "sft", "both"], default="both",
+                        help="Records to export")
+    parser.add_argument("--shard-size", type=int, default=100000,
+                        help="Maximum records per output file")
+    parser.add_argument("--min-turns", type=int, default=1,
+                        help="Skip debates with fewer rounds")
+    parser.add_argument("--exclude-ties", action="store_true",
+                        help="Skip debates whose final winner is a tie")
+    parser.add_argument("--history-window", type=int,
+                        help="Previous rounds included in each prompt (default: all)")
+    parser.add_argument("--sft-all", action="store_true",
+                        help="Include losing arguments in the SFT records, not only round winners")
+    args = parser.parse_args()
+    
+    if not os.path.exists(args.db):
+        parser.error(f"Database not found: {args.db}")
+    os.makedirs(args.output_dir, exist_ok=True)
+    
+    writers = {}
+    if args.format in ("pairs", "both"):
+        writers["pairs"] = ShardedWriter(args.output_dir, "pairs", args.shard_size)
+    if args.format in ("sft", "both"):
+        writers["sft"] = ShardedWriter(args.output_dir, "sft", args.shard_size)
+    
+    debates = 0
+    try:
+        for result in iter_debates(args.db, min_turns=args.min_turns, exclude_ties=args.exclude_ties):
+            debates += 1
+            if "pairs" in writers:
+                for record in preference_pairs(result, args.history_window):
+                    writers["pairs"].write(record)
+            if "sft" in writers:
+                for record in sft_records(result, args.history_window, winners_only=not args.sft_all):
+                    writers["sft"].write(record)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    
+    counts = ", ".join(f"{writer.count} {name} records" for name, writer in writers.items())
+    print(f"Exported {debates} debates: {counts} to {args.output_dir}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
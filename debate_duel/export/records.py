@@ -0,0 +1,103 @@
+"""
+Training records built from stored debates.
+
+Every judged round yields a preference pair (the winning argument as chosen,
+the losing one as rejected) and SFT records pairing a debater prompt with the
+argument written for it. All builders are generators over a single debate, so
+an export streams through the database one debate at a time.
+"""
+from typing import Any, Dict, Iterator, Optional
+
+from debate_duel.shared.history import format_history
+from debate_duel.shared.schemas import DebateResult, Stance, Winner
+
+
+def round_context(result: DebateResult, turn_index: int, history_window: Optional[int] = None) -> str:
+    """
+    The topic and the rounds before turn_index, as the debaters saw them.
+
+    Args:
+        result: The debate
+        turn_index: Zero-based index of the round being argued
+        history_window: Number of previous rounds to include, or None for all
+    """
+    context = f"Topic: {result.topic}\n\n"
+    history = result.turns[:turn_index]
+    if history:
+        context += "Debate so far:\n" + format_history(history, history_window, pro_label="PRO", con_label="CON")
+    return context
+
+
+def argument_prompt(result: DebateResult, turn_index: int, history_window: Optional[int] = None) -> str:
+    """Stance-neutral prompt for round turn_index, used for preference pairs."""
+    return (
+        round_context(result, turn_index, history_window)
+        + f"Write the most persuasive argument for round {turn_index + 1}."
+    )
+
+
+def stance_prompt(
+    result: DebateResult,
+    turn_index: int,
+    stance: Stance,
+    history_window: Optional[int] = None
+) -> str:
+    """Prompt asking for the given side's argument in round turn_index."""
+    return (
+        round_context(result, turn_index, history_window)
+        + f"Write the {stance.value.upper()} side's argument for round {turn_index + 1}."
+    )
+
+
+def preference_pairs(result: DebateResult, history_window: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    One chosen/rejected pair per round the judge decided; tied rounds are skipped.
+    """
+    for index, turn in enumerate(result.turns):
+        decision = turn.judge_decision
+        if decision is None or decision.winner == Winner.TIE:
+            continue
+        arguments = {Stance.PRO: turn.pro_argument, Stance.CON: turn.con_argument}
+        chosen = Stance(decision.winner.value)
+        rejected = Stance.CON if chosen == Stance.PRO else Stance.PRO
+        yield {
+            "debate_id": result.debate_id,
+            "turn": index + 1,
+            "topic": result.topic,
+            "prompt": argument_prompt(result, index, history_window),
+            "chosen": arguments[chosen],
+            "rejected": arguments[rejected],
+            "chosen_stance": chosen.value,
+            "rejected_stance": rejected.value,
+            "justification": decision.justification,
+            "confidence": decision.confidence,
+        }
+
+
+def sft_records(
+    result: DebateResult,
+    history_window: Optional[int] = None,
+    winners_only: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Chat-format SFT records, one per argument.
+
+    Args:
+        result: The debate
+        history_window: Number of previous rounds in each prompt, or None for all
+        winners_only: Only include arguments that won their round
+    """
+    for index, turn in enumerate(result.turns):
+        decision = turn.judge_decision
+        for stance, argument in ((Stance.PRO, turn.pro_argument), (Stance.CON, turn.con_argument)):
+            if winners_only and (decision is None or decision.winner.value != stance.value):
+                continue
+            yield {
+                "debate_id": result.debate_id,
+                "turn": index + 1,
+                "stance": stance.value,
+                "messages": [
+                    {"role": "user", "content": stance_prompt(result, index, stance, history_window)},
+                    {"role": "assistant", "content": argument},
+                ],
+            }
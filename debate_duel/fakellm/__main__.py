@@ -0,0 +1,48 @@
+import argparse
+import os
+
+import uvicorn
+
+from debate_duel.fakellm.profiles import LATENCY_PROFILES
+
+
+def main():
+    """
+    Run the stand-in LLM server.
+    
+    Point the agents at it with FAKE_LLM_URL=http://localhost:8010/v1.
+    """
+    parser = argparse.ArgumentParser(description="Run an OpenAI-compatible stand-in LLM server")
+    parser.add_argument("--profile", choices=sorted(LATENCY_PROFILES), default=os.environ.get("FAKE_LLM_PROFILE", "fast"),
+                        help="Latency profile")
+    parser.add_argument("--completion-tokens", type=int, default=int(os.environ.get("FAKE_LLM_COMPLETION_TOKENS", "300")),
+                        help="Mean completion length in tokens")
+    parser.add_argument("--error-rate", type=float, default=float(os.environ.get("FAKE_LLM_ERROR_RATE", "0")),
+                        help="Fraction of requests answered with a 500")
+    parser.add_argument("--rate-limit-rate", type=float, default=float(os.environ.get("FAKE_LLM_RATE_LIMIT_RATE", "0")),
+                        help="Fraction of requests answered with a 429")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Random seed for reproducible content and latency")
+    args = parser.parse_args()
+    
+    # The app reads its settings from the environment when it is imported
+    os.environ["FAKE_LLM_PROFILE"] = args.profile
+    os.environ["FAKE_LLM_COMPLETION_TOKENS"] = str(args.completion_tokens)
+    os.environ["FAKE_LLM_ERROR_RATE"] = str(args.error_rate)
+    os.environ["FAKE_LLM_RATE_LIMIT_RATE"] = str(args.rate_limit_rate)
+    if args.seed is not None:
+        os.environ["FAKE_LLM_SEED"] = str(args.seed)
+    
+    port = int(os.environ.get("PORT", "8010"))
+    host = os.environ.get("HOST", "0.0.0.0")
+    
+    uvicorn.run(
+        "debate_duel.fakellm.api:app",
+        host=host,
+        port=port,
+        log_level="info"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+"""
+OpenAI-compatible stand-in chat completion server.
+
+Serves POST /v1/chat/completions with canned but well-formed content: JSON
+objects with the planner and strategist keys for json_object calls, the
+"Winner:/Justification:" format for judge prompts (or a verdict per round for
+combined judging), and filler prose for
+everything else. Latency, completion length and error rates come from
+FakeLLMConfig so the arena, swarm and judge stack can be load-tested
+without calling a real provider.
+"""
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, ConfigDict
+
+from debate_duel.fakellm.profiles import FakeLLMConfig
+
+
+class ChatCompletionRequest(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    model: str
+    messages: List[Dict[str, Any]]
+    temperature: Optional[float] = None
+    max_tokens: Optional[int] = None
+    response_format: Optional[Dict[str, Any]] = None
+    stream: bool = False
+    stream_options: Optional[Dict[str, Any]] = None
+
+
+app = FastAPI(title="Fake LLM")
+config = FakeLLMConfig.from_env()
+rng = random.Random(config.seed)
+
+_WORDS = (
+    "evidence policy society outcome benefit risk argument position public research "
+    "cost impact principle example history trust innovation regulation access fairness "
+    "community market safety economic long-term data clearly therefore moreover"
+).split()
+
+_PLANNER_KEYS = ("overall_approach", "points", "opponent_weaknesses", "anticipated_counterarguments")
+_STRATEGIST_KEYS = (
+    "key_messaging", "argument_structure", "rhetorical_techniques",
+    "rebuttal_strategies", "evidence_prioritization"
+)
+_LIST_KEYS = {
+    "points", "opponent_weaknesses", "anticipated_counterarguments",
+    "key_messaging", "rhetorical_techniques"
+}
+
+
+# Simulated provider prompt caching: prefixes of at least ~1024 tokens are
+# cached in ~128-token increments, as OpenAI does
+_PREFIX_MIN_CHARS = 4096
+_PREFIX_STEP_CHARS = 512
+_MAX_PREFIXES = 100000
+prefix_cache: "OrderedDict[str, None]" = OrderedDict()
+
+
+def cached_prompt_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Tokens of the longest previously seen prompt prefix; records the new prefixes."""
+    text = "".join(f"{message.get('role')}:{message.get('content') or ''}\n" for message in messages)
+    hasher = hashlib.sha256()
+    position = 0
+    cached_chars = 0
+    for boundary in range(_PREFIX_MIN_CHARS, len(text) + 1, _PREFIX_STEP_CHARS):
+        hasher.update(text[position:boundary].encode("utf-8"))
+        position = boundary
+        digest = hasher.copy().hexdigest()
+        if digest in prefix_cache:
+            prefix_cache.move_to_end(digest)
+            cached_chars = boundary
+        else:
+            prefix_cache[digest] = None
+    while len(prefix_cache) > _MAX_PREFIXES:
+        prefix_cache.popitem(last=False)
+    return cached_chars // 4
+
+
+def count_tokens(text: str) -> int:
+    """Approximate token count at four characters per token."""
+    return max(1, len(text) // 4)
+
+
+def sentence(min_words: int = 8, max_words: int = 16) -> str:
+    words = [rng.choice(_WORDS) for _ in range(rng.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def prose(tokens: int) -> str:
+    """Filler text of roughly the given number of tokens."""
+    sentences = []
+    while count_tokens(" ".join(sentences)) < tokens:
+        sentences.append(sentence())
+    return " ".join(sentences)
+
+
+def verdicts_content(user_prompt: str) -> str:
+    """One judge verdict per "### Round N" section of a combined judging prompt."""
+    rounds = len(re.findall(r"^### Round \d+", user_prompt, flags=re.MULTILINE)) or 1
+    verdicts = [
+        {
+            "round": index + 1,
+            "winner": rng.choices(["pro", "con", "tie"], weights=[0.45, 0.45, 0.1])[0],
+            "justification": sentence(),
+        }
+        for index in range(rounds)
+    ]
+    return json.dumps({"verdicts": verdicts})
+
+
+def json_content(system_prompt: str) -> str:
+    """A JSON object with the keys the calling agent asks for in its system prompt."""
+    if "overall_approach" in system_prompt and "key_messaging" in system_prompt:
+        keys = _PLANNER_KEYS + _STRATEGIST_KEYS
+    elif "overall_approach" in system_prompt:
+        keys = _PLANNER_KEYS
+    elif "key_messaging" in system_prompt:
+        keys = _STRATEGIST_KEYS
+    else:
+        keys = tuple(dict.fromkeys(re.findall(r'"([a-z_]+)"', system_prompt))) or ("result",)
+
+    content = {}
+    for key in keys:
+        if key in _LIST_KEYS:
+            content[key] = [sentence() for _ in range(rng.randint(3, 5) if key == "points" else 3)]
+        else:
+            content[key] = sentence()
+    return json.dumps(content)
+
+
+def judge_content(tokens: int) -> str:
+    winner = rng.choices(["pro", "con", "tie"], weights=[0.45, 0.45, 0.1])[0]
+    return f"Winner: {winner}\nJustification: {prose(tokens)}"
+
+
+def build_content(request: ChatCompletionRequest, tokens: int) -> str:
+    system_prompt = " ".join(
+        str(message.get("content") or "") for message in request.messages if message.get("role") == "system"
+    )
+    user_prompt = " ".join(
+        str(message.get("content") or "") for message in request.messages if message.get("role") != "system"
+    )
+
+    if (request.response_format or {}).get("type") == "json_object":
+        if '"verdicts"' in system_prompt:
+            return verdicts_content(user_prompt)
+        return json_content(system_prompt)
+    if "Winner: [pro|con|tie]" in user_prompt:
+        return judge_content(tokens)
+    return prose(tokens)
+
+
+def rate_limit_headers() -> Dict[str, str]:
+    return {
+        "x-ratelimit-limit-requests": "10000",
+        "x-ratelimit-remaining-requests": "9999",
+        "x-ratelimit-limit-tokens": "10000000",
+        "x-ratelimit-remaining-tokens": "9999000",
+    }
+
+
+def error_response(status_code: int, message: str, error_type: str, headers: Dict[str, str]) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": None}},
+        headers=headers
+    )
+
+
+async def simulate_latency(completion_tokens: int) -> None:
+    profile = config.profile
+    delay = completion_tokens * profile.per_token
+    if profile.first_token_median > 0:
+        delay += rng.lognormvariate(0.0, profile.first_token_sigma) * profile.first_token_median
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+async def stream_chunks(
+    request: ChatCompletionRequest,
+    content: str,
+    usage: Dict[str, Any]
+) -> AsyncIterator[str]:
+    """Emit content word by word as chat.completion.chunk server-sent events."""
+    profile = config.profile
+    completion_id = f"chatcmpl-fake-{uuid.uuid4().hex}"
+    created = int(time.time())
+
+    def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None, chunk_usage=None) -> str:
+        body = {
+            "id": completion_id,
+            "object": "chat.completion.chunk",
+            "created": created,
+            "model": request.model,
+            "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason, "logprobs": None}]
+            if delta is not None else [],
+            "usage": chunk_usage,
+        }
+        return f"data: {json.dumps(body)}\n\n"
+
+    if profile.first_token_median > 0:
+        await asyncio.sleep(rng.lognormvariate(0.0, profile.first_token_sigma) * profile.first_token_median)
+
+    yield chunk({"role": "assistant", "content": ""})
+    words = re.findall(r"\S+\s*", content)
+    for word in words:
+        if profile.per_token > 0:
+            await asyncio.sleep(count_tokens(word) * profile.per_token)
+        yield chunk({"content": word})
+    yield chunk({}, finish_reason="stop")
+    if (request.stream_options or {}).get("include_usage"):
+        yield chunk(None, chunk_usage=usage)
+    yield "data: [DONE]\n\n"
+
+
+@app.get("/")
+async def health_check():
+    """Health check endpoint"""
+    return {"status": "healthy", "profile": config.profile.name}
+
+
+@app.post("/v1/chat/completions")
+async def chat_completions(request: ChatCompletionRequest):
+    """
+    Return a chat completion in the OpenAI response format, after the
+    configured latency, or an injected 429/500 error.
+    """
+    headers = rate_limit_headers()
+    roll = rng.random()
+    if roll < config.rate_limit_rate:
+        headers.update({"x-ratelimit-remaining-requests": "0", "retry-after": "1"})
+        return error_response(429, "Rate limit reached (injected by fake LLM)", "requests", headers)
+    if roll < config.rate_limit_rate + config.error_rate:
+        return error_response(500, "Internal server error (injected by fake LLM)", "server_error", headers)
+
+    target_tokens = max(1, int(rng.gauss(config.completion_tokens, config.completion_tokens * 0.2)))
+    if request.max_tokens:
+        target_tokens = min(target_tokens, request.max_tokens)
+
+    content = build_content(request, target_tokens)
+    prompt_tokens = sum(count_tokens(str(message.get("content") or "")) for message in request.messages)
+    completion_tokens = count_tokens(content)
+    usage = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+        "prompt_tokens_details": {"cached_tokens": min(prompt_tokens, cached_prompt_tokens(request.messages))},
+    }
+
+    if request.stream:
+        return StreamingResponse(
+            stream_chunks(request, content, usage),
+            media_type="text/event-stream",
+            headers=headers
+        )
+
+    await simulate_latency(completion_tokens)
+
+    body = {
+        "id": f"chatcmpl-fake-{uuid.uuid4().hex}",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": request.model,
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+                "logprobs": None,
+            }
+        ],
+        "usage": usage,
+    }
+    return JSONResponse(content=body, headers=headers)
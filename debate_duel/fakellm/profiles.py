@@ -0,0 +1,52 @@
+"""
+Latency profiles and settings for the stand-in LLM server.
+"""
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """
+    Latency model for one completion: a lognormal time to first token plus a
+    fixed time per generated token.
+    """
+    name: str
+    first_token_median: float
+    first_token_sigma: float
+    per_token: float
+
+
+LATENCY_PROFILES = {
+    "instant": LatencyProfile("instant", 0.0, 0.0, 0.0),
+    "fast": LatencyProfile("fast", 0.05, 0.3, 0.0005),
+    "realistic": LatencyProfile("realistic", 0.4, 0.5, 0.01),
+    "slow": LatencyProfile("slow", 1.5, 0.6, 0.03),
+}
+
+
+@dataclass(frozen=True)
+class FakeLLMConfig:
+    """Behaviour of the stand-in server, read from FAKE_LLM_* environment variables."""
+    profile: LatencyProfile
+    completion_tokens: int
+    error_rate: float
+    rate_limit_rate: float
+    seed: Optional[int]
+
+    @classmethod
+    def from_env(cls) -> "FakeLLMConfig":
+        profile_name = os.getenv("FAKE_LLM_PROFILE", "fast")
+        if profile_name not in LATENCY_PROFILES:
+            raise ValueError(
+                f"Unknown latency profile {profile_name!r}; expected one of {sorted(LATENCY_PROFILES)}"
+            )
+        seed = os.getenv("FAKE_LLM_SEED")
+        return cls(
+            profile=LATENCY_PROFILES[profile_name],
+            completion_tokens=int(os.getenv("FAKE_LLM_COMPLETION_TOKENS", "300")),
+            error_rate=float(os.getenv("FAKE_LLM_ERROR_RATE", "0")),
+            rate_limit_rate=float(os.getenv("FAKE_LLM_RATE_LIMIT_RATE", "0")),
+            seed=int(seed) if seed else None,
+        )
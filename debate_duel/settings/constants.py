@@ -1,16 +1,153 @@
 import os 
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
+
+# Set FAKE_LLM_URL (e.g. http://localhost:8010/v1) to point every agent at the
+# local stand-in server started with `python -m debate_duel.fakellm`
+FAKE_LLM_URL = os.getenv("FAKE_LLM_URL")
+OPENAI_BASE_URL = FAKE_LLM_URL or os.getenv("OPENAI_BASE_URL")
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY") or ("fake" if FAKE_LLM_URL else None)
 
 OPENAI_MODEL = "gpt-4o-mini"
 OPENAI_CLIENT = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY")
+    api_key=OPENAI_API_KEY,
+    base_url=OPENAI_BASE_URL
+)
+# The shared rate limiter owns 429 backoff, so the SDK must not retry on its own
+# while the limiter slot is held
+OPENAI_ASYNC_CLIENT = AsyncOpenAI(
+    api_key=OPENAI_API_KEY,
+    base_url=OPENAI_BASE_URL,
+    max_retries=0
 )
 
+# Shared LLM rate limits; set LLM_RATE_LIMIT_DB to share them between processes
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "500"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "200000"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "32"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "5"))
+LLM_RATE_LIMIT_DB = os.getenv("LLM_RATE_LIMIT_DB")
+
+# Connection errors, timeouts and 5xx answers are retried with jittered
+# exponential backoff starting at LLM_RETRY_BACKOFF seconds
+LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", "0.5"))
+
+# LLM response cache: agents that reuse responses, memory tier size and
+# optional SQLite file for the persistent tier. The judge is left out by
+# default, as cached verdicts would make panel judges replay the same vote
+LLM_CACHE_AGENTS = {
+    name.strip() for name in os.getenv("LLM_CACHE_AGENTS", "researcher").split(",") if name.strip()
+}
+LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "1024"))
+LLM_CACHE_DB = os.getenv("LLM_CACHE_DB")
+
+# Agent behind the swarm services' /generate_argument: "single" (DebateAgent)
+# or "team" (the team_debater pipeline)
+SWARM_AGENT = os.getenv("SWARM_AGENT", "single")
+
+# Default stages of the team pipeline: "fast" (plan, strategy, write),
+# "balanced" (adds research) or "full" (adds research and verification)
+SWARM_PIPELINE_MODE = os.getenv("SWARM_PIPELINE_MODE", "full")
+
+# Judges voting on each round (1 is a single judge) and the temperature the
+# panel judges sample at; the panel stops as soon as the outcome is decided
+JUDGE_PANEL_SIZE = int(os.getenv("JUDGE_PANEL_SIZE", "1"))
+JUDGE_PANEL_TEMPERATURE = float(os.getenv("JUDGE_PANEL_TEMPERATURE", "0.7"))
+
+# Micro-batching of /judge requests on the judge service: window in
+# milliseconds (0 disables it), maximum batch size, and whether a batch is
+# judged with concurrent calls ("concurrent") or one multi-verdict call ("combined")
+JUDGE_BATCH_WINDOW_MS = float(os.getenv("JUDGE_BATCH_WINDOW_MS", "0"))
+JUDGE_BATCH_MAX_SIZE = int(os.getenv("JUDGE_BATCH_MAX_SIZE", "16"))
+JUDGE_BATCH_MODE = os.getenv("JUDGE_BATCH_MODE", "concurrent")
+
+# Produce the team pipeline's plan and strategy in one fused LLM call
+# instead of separate planner and strategist stages
+SWARM_FUSED_PLANNING = os.getenv("SWARM_FUSED_PLANNING", "false").lower() in ("1", "true", "yes")
+
+# Maximum number of concurrent research calls per argument
+RESEARCH_MAX_CONCURRENCY = int(os.getenv("RESEARCH_MAX_CONCURRENCY", "5"))
+
+# Research reuse across stances, rounds and (with RESEARCH_CACHE_DB set to a
+# shared SQLite file) swarm processes: maximum entries (0 disables it), TTL in
+# seconds and the similarity at which a rephrased point counts as the same
+RESEARCH_CACHE_DB = os.getenv("RESEARCH_CACHE_DB")
+RESEARCH_CACHE_SIZE = int(os.getenv("RESEARCH_CACHE_SIZE", "10000"))
+RESEARCH_CACHE_TTL = float(os.getenv("RESEARCH_CACHE_TTL", "86400"))
+RESEARCH_CACHE_THRESHOLD = float(os.getenv("RESEARCH_CACHE_THRESHOLD", "0.7"))
+
+# Debate sessions kept by each swarm service, and seconds of inactivity
+# before one is dropped (the arena then resends the full history)
+SWARM_MAX_SESSIONS = int(os.getenv("SWARM_MAX_SESSIONS", "10000"))
+SWARM_SESSION_TTL = float(os.getenv("SWARM_SESSION_TTL", "3600"))
+
+# Opening-argument pools kept by each swarm service (one per topic, stance and
+# pipeline mode) and openings generated at once while warming them up
+SWARM_OPENING_MAX_TOPICS = int(os.getenv("SWARM_OPENING_MAX_TOPICS", "1000"))
+SWARM_OPENING_WARMUP_CONCURRENCY = int(os.getenv("SWARM_OPENING_WARMUP_CONCURRENCY", "4"))
+
+# Maximum number of debates the arena runs at once across all tournaments
+ARENA_MAX_CONCURRENT_DEBATES = int(os.getenv("ARENA_MAX_CONCURRENT_DEBATES", "16"))
+
+# Window in milliseconds within which the arena groups judge calls from
+# concurrent debates into one POST /judge/batch (0 sends each on its own)
+ARENA_JUDGE_BATCH_WINDOW_MS = float(os.getenv("ARENA_JUDGE_BATCH_WINDOW_MS", "0"))
+
+# Seconds a debate may take when its request sets no deadline (0 for none).
+# The deadline travels with every service call; stages with less than
+# DEADLINE_MIN_STAGE_SECONDS budgeted are skipped where they are optional, and
+# DEADLINE_MARGIN_SECONDS is kept in reserve for returning the answer
+ARENA_DEBATE_DEADLINE = float(os.getenv("ARENA_DEBATE_DEADLINE", "0"))
+DEADLINE_MIN_STAGE_SECONDS = float(os.getenv("DEADLINE_MIN_STAGE_SECONDS", "2"))
+DEADLINE_MARGIN_SECONDS = float(os.getenv("DEADLINE_MARGIN_SECONDS", "0.5"))
+
+# Connection pool of each service client in the arena: request and connect
+# timeouts in seconds, pool limits and how long idle connections are kept.
+# HTTP/2 is negotiated with replicas that offer it when the h2 package is installed
+ARENA_HTTP_TIMEOUT = float(os.getenv("ARENA_HTTP_TIMEOUT", "60"))
+ARENA_HTTP_CONNECT_TIMEOUT = float(os.getenv("ARENA_HTTP_CONNECT_TIMEOUT", "5"))
+ARENA_HTTP_MAX_CONNECTIONS = int(os.getenv("ARENA_HTTP_MAX_CONNECTIONS", "100"))
+ARENA_HTTP_MAX_KEEPALIVE = int(os.getenv("ARENA_HTTP_MAX_KEEPALIVE", "50"))
+ARENA_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("ARENA_HTTP_KEEPALIVE_EXPIRY", "30"))
+ARENA_HTTP2 = os.getenv("ARENA_HTTP2", "true").lower() in ("1", "true", "yes")
+
+# Retries of service calls that fail to connect or get a 5xx answer, with
+# jittered exponential backoff starting at ARENA_HTTP_RETRY_BACKOFF seconds
+ARENA_HTTP_RETRIES = int(os.getenv("ARENA_HTTP_RETRIES", "2"))
+ARENA_HTTP_RETRY_BACKOFF = float(os.getenv("ARENA_HTTP_RETRY_BACKOFF", "0.25"))
+
+# Hedged argument and judge requests: once a call has taken longer than this
+# percentile of the service's recent latencies, send a duplicate to the next
+# replica and use whichever answers first (off by default, as it costs LLM calls)
+ARENA_HEDGE_REQUESTS = os.getenv("ARENA_HEDGE_REQUESTS", "false").lower() in ("1", "true", "yes")
+ARENA_HEDGE_PERCENTILE = float(os.getenv("ARENA_HEDGE_PERCENTILE", "95"))
+ARENA_HEDGE_MIN_SAMPLES = int(os.getenv("ARENA_HEDGE_MIN_SAMPLES", "20"))
+
+# SQLite file the arena stores finished debates in (empty disables the store),
+# and how debates are batched into write transactions
+ARENA_DB = os.getenv("ARENA_DB", "debates.db")
+ARENA_DB_BATCH_SIZE = int(os.getenv("ARENA_DB_BATCH_SIZE", "64"))
+ARENA_DB_FLUSH_INTERVAL = float(os.getenv("ARENA_DB_FLUSH_INTERVAL", "0.1"))
+
 DEFAULT_ELO = 1200
 ELO_K_FACTOR = 32
+# Turns of ELO trajectory kept per debate (after the initial ratings)
+ELO_TRAJECTORY_LIMIT = int(os.getenv("ELO_TRAJECTORY_LIMIT", "1000"))
+
+# Names the arena's rating ledger knows each swarm's configuration by
+SWARM_NAMES = {
+    "swarm_a": os.getenv("SWARM_A_NAME", "swarm_a"),
+    "swarm_b": os.getenv("SWARM_B_NAME", "swarm_b"),
+}
 
 SERVICE_URLS = {
     "swarm_a": "http://swarm-a:8000",
     "swarm_b": "http://swarm-b:8000",
     "judge": "http://judge-agent:8000",
 }
+
+# Replicas of each service (comma-separated URLs in SWARM_A_URLS, SWARM_B_URLS
+# and JUDGE_URLS); without them the service's SERVICE_URLS entry is used
+SERVICE_REPLICAS = {
+    key: [replica.strip() for replica in os.getenv(f"{key.upper()}_URLS", "").split(",") if replica.strip()] or [url]
+    for key, url in SERVICE_URLS.items()
+}
@@ -0,0 +1,86 @@
+"""
+Micro-batching of concurrent requests.
+
+Callers submit single items and await their own result; items arriving
+within a short window (or until the batch is full) are handed to the handler
+together, trading a few milliseconds of latency for fewer round trips.
+"""
+import asyncio
+from typing import Awaitable, Callable, Generic, List, Optional, Sequence, Set, Tuple, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class MicroBatcher(Generic[T, R]):
+    """Collects submitted items into batches for a batch handler."""
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[Sequence[Union[R, BaseException]]]],
+        max_batch_size: int = 16,
+        max_wait: float = 0.01
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            handler: Coroutine taking a batch of items and returning one result
+                or exception per item, in order
+            max_batch_size: Flush as soon as this many items are waiting
+            max_wait: Seconds the first item of a batch waits for more to arrive
+        """
+        self.handler = handler
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._running: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: T) -> R:
+        """Add an item to the next batch and wait for its result."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.max_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.create_task(self._run(batch))
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = await self.handler([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            # The submitter may have been cancelled in the meantime
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def stats(self) -> dict:
+        """Number of batches and items handled and the mean batch size."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": self.items / self.batches if self.batches else 0.0,
+        }
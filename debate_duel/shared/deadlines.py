@@ -0,0 +1,134 @@
+"""
+End-to-end deadlines for debates.
+
+The arena gives a debate a deadline and sends it with every call to the swarm
+and judge services as an absolute Unix time in the X-Debate-Deadline header.
+The services keep it in a context variable for the duration of the request,
+so that stages can be budgeted against it and the work degraded (skipping
+optional stages, cutting a judge panel short) instead of running on after
+the arena has stopped waiting.
+"""
+import asyncio
+import time
+from collections import Counter
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Awaitable, Callable, Iterator, Optional, TypeVar
+
+from debate_duel.settings.constants import DEADLINE_MARGIN_SECONDS, DEADLINE_MIN_STAGE_SECONDS
+
+T = TypeVar("T")
+
+DEADLINE_HEADER = "X-Debate-Deadline"
+
+# Absolute Unix time by which the current request must be answered
+DEADLINE: ContextVar[Optional[float]] = ContextVar("deadline", default=None)
+
+# How often work was degraded or abandoned to meet a deadline, per kind
+DEGRADATIONS: Counter = Counter()
+
+
+class DeadlineExceeded(Exception):
+    """The deadline passed before the work could be finished."""
+
+
+def parse_deadline(value: Optional[str]) -> Optional[float]:
+    """The deadline in a header value, or None if it is missing or malformed."""
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[float]) -> Iterator[None]:
+    """Make deadline the current deadline inside the block."""
+    token = DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        DEADLINE.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left until the current deadline (negative once passed), or None without one."""
+    deadline = DEADLINE.get()
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def budget(share: float, total_shares: float) -> Optional[float]:
+    """
+    Seconds granted to a stage that is share of the total_shares of the work
+    still to do, keeping DEADLINE_MARGIN_SECONDS in reserve, or None without
+    a deadline.
+    """
+    left = remaining()
+    if left is None:
+        return None
+    return max(0.0, left - DEADLINE_MARGIN_SECONDS) * share / total_shares
+
+
+async def within_budget(
+    stage: str,
+    seconds: Optional[float],
+    work: Callable[[], Awaitable[T]],
+    min_seconds: float = DEADLINE_MIN_STAGE_SECONDS
+) -> Optional[T]:
+    """
+    Run an optional stage within its time budget.
+
+    Args:
+        stage: Name the stage's degradations are counted under
+        seconds: The stage's budget, or None for no limit
+        work: Coroutine function running the stage
+        min_seconds: Budget below which the stage is not started at all
+
+    Returns:
+        The stage's result, or None if it was skipped or ran out of time
+    """
+    if seconds is not None and seconds < min_seconds:
+        DEGRADATIONS[f"{stage}_skipped"] += 1
+        return None
+    timeout = asyncio.timeout(seconds)
+    try:
+        async with timeout:
+            return await work()
+    except TimeoutError:
+        if not timeout.expired():
+            raise
+        DEGRADATIONS[f"{stage}_timed_out"] += 1
+        return None
+
+
+@asynccontextmanager
+async def within_deadline() -> AsyncIterator[None]:
+    """
+    Run the block against the current deadline.
+
+    Raises:
+        DeadlineExceeded: If the deadline has passed or passes while the block runs
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        DEGRADATIONS["deadline_exceeded"] += 1
+        raise DeadlineExceeded("The deadline has passed")
+    timeout = asyncio.timeout(left)
+    try:
+        async with timeout:
+            yield
+    except TimeoutError as e:
+        if not timeout.expired():
+            raise
+        DEGRADATIONS["deadline_exceeded"] += 1
+        raise DeadlineExceeded("The deadline passed before the work was finished") from e
+
+
+async def deadline_middleware(request, call_next):
+    """
+    HTTP middleware that makes the request's X-Debate-Deadline header the
+    current deadline while the request is handled.
+    """
+    with deadline_scope(parse_deadline(request.headers.get(DEADLINE_HEADER))):
+        return await call_next(request)
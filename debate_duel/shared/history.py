@@ -0,0 +1,152 @@
+"""
+Rendering of debate history for prompts, with optional rolling memory.
+
+Rendered rounds are kept per debate in a DebateTranscript, so each call only
+renders rounds it has not seen before instead of re-concatenating the whole
+history.
+"""
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from debate_duel.shared.schemas import Turn
+
+# Number of debates whose rendered transcripts are kept per process
+_MAX_TRANSCRIPTS = 256
+
+
+def recent_rounds(history: List[Turn], memory_window: Optional[int]) -> int:
+    """Index of the first round kept verbatim under the given memory window."""
+    if memory_window is None:
+        return 0
+    return max(0, len(history) - memory_window)
+
+
+def format_round(index: int, turn: Turn, pro_label: str = "Pro", con_label: str = "Con") -> str:
+    """Render one round (numbered from zero) with both arguments and the judge decision."""
+    text = f"Round {index + 1}:\n"
+    text += f"{pro_label}: {turn.pro_argument}\n\n"
+    text += f"{con_label}: {turn.con_argument}\n\n"
+    if turn.judge_decision:
+        text += f"Judge: Winner: {turn.judge_decision.winner}\n"
+        text += f"Justification: {turn.judge_decision.justification}\n\n"
+    return text
+
+
+class DebateTranscript:
+    """
+    Rendered rounds of one debate, extended a round at a time.
+    
+    A debate's history only grows, except that the latest round may gain or
+    lose the judge's verdict, so only that round is compared and re-rendered;
+    earlier rounds are taken as final.
+    """
+    
+    def __init__(self, pro_label: str, con_label: str):
+        self.pro_label = pro_label
+        self.con_label = con_label
+        self.lock = threading.Lock()
+        self.last: Optional[Turn] = None
+        self.text = ""
+        # Offset of each rendered round in text
+        self.offsets: List[int] = []
+    
+    def _truncate(self, rounds: int) -> None:
+        if rounds < len(self.offsets):
+            self.text = self.text[:self.offsets[rounds]]
+            del self.offsets[rounds:]
+            self.last = None
+    
+    def _append(self, index: int, turn: Turn) -> None:
+        self.offsets.append(len(self.text))
+        self.text += format_round(index, turn, self.pro_label, self.con_label)
+        self.last = turn
+    
+    def sync(self, history: List[Turn]) -> None:
+        """Render the rounds of history past the cached ones, redoing the latest if it changed."""
+        self._truncate(len(history))
+        rendered = len(self.offsets)
+        if rendered and history[rendered - 1] is not self.last and history[rendered - 1] != self.last:
+            self._truncate(rendered - 1)
+            rendered -= 1
+        for i in range(rendered, len(history)):
+            self._append(i, history[i])
+    
+    def render(self, start: int = 0) -> str:
+        """The rendered rounds from index start onwards."""
+        if start >= len(self.offsets):
+            return ""
+        return self.text[self.offsets[start]:]
+
+
+_transcripts: "OrderedDict[str, DebateTranscript]" = OrderedDict()
+_transcripts_lock = threading.Lock()
+
+
+def render_rounds(
+    debate_id: str,
+    history: List[Turn],
+    start: int = 0,
+    pro_label: str = "Pro",
+    con_label: str = "Con"
+) -> str:
+    """
+    Render history[start:] using the cached transcript for this debate.
+    
+    Transcripts are keyed by debate id and labels, so concurrent debates on
+    the same topic keep separate transcripts.
+    """
+    key = f"{debate_id}:{pro_label}:{con_label}"
+    with _transcripts_lock:
+        transcript = _transcripts.get(key)
+        if transcript is None:
+            transcript = DebateTranscript(pro_label, con_label)
+            _transcripts[key] = transcript
+            while len(_transcripts) > _MAX_TRANSCRIPTS:
+                _transcripts.popitem(last=False)
+        else:
+            _transcripts.move_to_end(key)
+    with transcript.lock:
+        transcript.sync(history)
+        return transcript.render(start)
+
+
+def format_history(
+    history: List[Turn],
+    memory_window: Optional[int] = None,
+    history_summary: Optional[str] = None,
+    pro_label: str = "Pro",
+    con_label: str = "Con",
+    debate_id: Optional[str] = None
+) -> str:
+    """
+    Render the debate history for a prompt.
+    
+    With a memory window, only the last memory_window rounds are rendered in
+    full and earlier rounds are represented by history_summary, so the size of
+    the history stays bounded however long the debate runs.
+    
+    Args:
+        history: All previous debate turns
+        memory_window: Number of recent rounds to keep verbatim, or None for all
+        history_summary: Running summary of the rounds before the window
+        pro_label: Label for pro arguments
+        con_label: Label for con arguments
+        debate_id: The debate the history belongs to; when given, rendered
+            rounds are reused across calls
+        
+    Returns:
+        The rendered history
+    """
+    first_recent = recent_rounds(history, memory_window)
+    text = ""
+    if first_recent:
+        if history_summary:
+            text += f"Summary of rounds 1-{first_recent}:\n{history_summary}\n\n"
+        else:
+            text += f"(Rounds 1-{first_recent} omitted.)\n\n"
+    if debate_id is not None:
+        return text + render_rounds(debate_id, history, first_recent, pro_label, con_label)
+    return text + "".join(
+        format_round(i, history[i], pro_label, con_label) for i in range(first_recent, len(history))
+    )
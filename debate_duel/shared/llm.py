@@ -0,0 +1,184 @@
+"""
+Single entry point for chat completion calls made by the agents.
+"""
+import asyncio
+import random
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Coroutine, Dict, List, Optional, TypeVar
+
+import openai
+from openai.types.chat import ChatCompletion
+
+from debate_duel.settings.constants import LLM_MAX_RETRIES, LLM_RETRY_BACKOFF, OPENAI_API_KEY, OPENAI_BASE_URL
+from debate_duel.shared.llm_cache import ResponseCache, cache_key
+from debate_duel.shared.metrics import TOKEN_USAGE
+from debate_duel.shared.rate_limiter import RateLimiter
+
+# Process-wide limiter shared by every agent
+RATE_LIMITER = RateLimiter()
+
+# Completion budget assumed when a call does not set max_tokens
+_DEFAULT_COMPLETION_TOKENS = 1024
+
+# Failures worth another attempt besides 429s; the SDK's own retries are off
+_TRANSIENT_ERRORS = (openai.APIConnectionError, openai.APITimeoutError, openai.InternalServerError)
+
+# Client that replaces the agents' shared one while run_sync drives a private loop
+_LOOP_CLIENT: ContextVar[Optional[openai.AsyncOpenAI]] = ContextVar("llm_loop_client", default=None)
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run an agent coroutine to completion from synchronous code.
+
+    The shared async client's connection pool belongs to the event loop that
+    first used it, so driving it from a new loop fails with "Event loop is
+    closed". The coroutine instead gets its own client, closed before the
+    loop it was created on.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    async def main() -> T:
+        async with openai.AsyncOpenAI(api_key=OPENAI_API_KEY, base_url=OPENAI_BASE_URL, max_retries=0) as client:
+            _LOOP_CLIENT.set(client)
+            return await coro
+
+    return asyncio.run(main())
+
+
+def _backoff(attempt: int) -> float:
+    return random.uniform(0, LLM_RETRY_BACKOFF * 2 ** attempt)
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int = _DEFAULT_COMPLETION_TOKENS) -> int:
+    """
+    Roughly estimate the tokens a call will use: about four characters per
+    prompt token plus the completion budget.
+    """
+    prompt_chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return prompt_chars // 4 + max_tokens
+
+
+async def create_chat_completion(
+    client: openai.AsyncOpenAI,
+    cache: Optional[ResponseCache] = None,
+    agent: str = "unknown",
+    **kwargs: Any
+) -> ChatCompletion:
+    """
+    Create a chat completion through the shared rate limiter.
+
+    Takes the same keyword arguments as client.chat.completions.create. The
+    call waits for request and token budget, feeds the response's rate-limit
+    headers back into the limiter, and on a 429 backs off and retries instead
+    of failing. Connection errors, timeouts and 5xx answers are retried with
+    jittered exponential backoff. When a cache is given, an identical earlier
+    request is answered from it without calling the API.
+
+    Args:
+        client: The async OpenAI client to call
+        cache: Optional response cache to consult and fill
+        agent: Name of the calling agent, used to attribute token usage
+        **kwargs: Arguments for chat.completions.create
+
+    Returns:
+        The parsed ChatCompletion
+    """
+    client = _LOOP_CLIENT.get() or client
+    key = None
+    if cache is not None:
+        key = cache_key(kwargs)
+        cached = await cache.get(key)
+        if cached is not None:
+            return cached
+
+    estimated = estimate_tokens(kwargs.get("messages", []), kwargs.get("max_tokens") or _DEFAULT_COMPLETION_TOKENS)
+
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        try:
+            async with RATE_LIMITER.limit(estimated):
+                raw = await client.chat.completions.with_raw_response.create(**kwargs)
+        except openai.RateLimitError as e:
+            if attempt == LLM_MAX_RETRIES:
+                raise
+            delay = RATE_LIMITER.on_rate_limited(e.response.headers)
+            await asyncio.sleep(delay * (1 + random.random()))
+            continue
+        except _TRANSIENT_ERRORS:
+            if attempt == LLM_MAX_RETRIES:
+                raise
+            await asyncio.sleep(_backoff(attempt))
+            continue
+
+        await RATE_LIMITER.update_from_headers(raw.headers)
+        completion = raw.parse()
+        if completion.usage is not None:
+            await RATE_LIMITER.record_usage(estimated, completion.usage.total_tokens)
+            TOKEN_USAGE.record(agent, completion.usage)
+        if cache is not None:
+            await cache.put(key, completion)
+        return completion
+
+
+async def stream_chat_completion(
+    client: openai.AsyncOpenAI,
+    agent: str = "unknown",
+    **kwargs: Any
+) -> AsyncIterator[str]:
+    """
+    Stream a chat completion through the shared rate limiter, yielding content
+    deltas as they arrive.
+
+    Rate limiting and retries match create_chat_completion, except that a
+    stream that has already yielded content is not retried; the concurrency
+    slot is held until the stream ends. Streamed calls bypass the response
+    cache.
+
+    Args:
+        client: The async OpenAI client to call
+        agent: Name of the calling agent, used to attribute token usage
+        **kwargs: Arguments for chat.completions.create (without stream)
+
+    Yields:
+        Content deltas of the completion
+    """
+    client = _LOOP_CLIENT.get() or client
+    estimated = estimate_tokens(kwargs.get("messages", []), kwargs.get("max_tokens") or _DEFAULT_COMPLETION_TOKENS)
+
+    for attempt in range(LLM_MAX_RETRIES + 1):
+        yielded = False
+        async with RATE_LIMITER.limit(estimated):
+            try:
+                stream = await client.chat.completions.create(
+                    stream=True,
+                    stream_options={"include_usage": True},
+                    **kwargs
+                )
+                await RATE_LIMITER.update_from_headers(stream.response.headers)
+                try:
+                    async for chunk in stream:
+                        if chunk.usage is not None:
+                            await RATE_LIMITER.record_usage(estimated, chunk.usage.total_tokens)
+                            TOKEN_USAGE.record(agent, chunk.usage)
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            yielded = True
+                            yield chunk.choices[0].delta.content
+                finally:
+                    await stream.close()
+                return
+            except openai.RateLimitError as e:
+                if yielded or attempt == LLM_MAX_RETRIES:
+                    raise
+                delay = RATE_LIMITER.on_rate_limited(e.response.headers) * (1 + random.random())
+            except _TRANSIENT_ERRORS:
+                # Content already passed on cannot be taken back
+                if yielded or attempt == LLM_MAX_RETRIES:
+                    raise
+                delay = _backoff(attempt)
+        await asyncio.sleep(delay)
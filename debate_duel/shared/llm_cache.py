@@ -0,0 +1,122 @@
+"""
+Content-addressed cache for chat completion responses.
+
+Responses are keyed by a hash of the full request (model, messages,
+temperature, response_format, ...). A bounded in-memory LRU tier sits in
+front of an optional persistent SQLite tier. Caching is opt-in per agent,
+since reusing responses only makes sense for low-temperature calls.
+"""
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from openai.types.chat import ChatCompletion
+
+from debate_duel.settings.constants import LLM_CACHE_AGENTS, LLM_CACHE_DB, LLM_CACHE_SIZE
+
+
+def cache_key(request: Dict[str, Any]) -> str:
+    """Hash a chat completion request into a stable cache key."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU, then SQLite) cache of chat completion responses."""
+
+    def __init__(self, max_entries: int = LLM_CACHE_SIZE, db_path: Optional[str] = LLM_CACHE_DB):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of responses held in memory
+            db_path: Optional SQLite file for the persistent tier
+        """
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self._db_lock = threading.Lock()
+        self._conn = None
+        if db_path:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _remember(self, key: str, value: str) -> None:
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _read_disk(self, key: str) -> Optional[str]:
+        with self._db_lock:
+            row = self._conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _write_disk(self, key: str, value: str) -> None:
+        with self._db_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created) VALUES (?, ?, ?)",
+                (key, value, time.time())
+            )
+            self._conn.commit()
+
+    async def get(self, key: str) -> Optional[ChatCompletion]:
+        """Look a response up in memory, then on disk."""
+        value = self._memory.get(key)
+        if value is not None:
+            self._memory.move_to_end(key)
+            self.memory_hits += 1
+            return ChatCompletion.model_validate_json(value)
+
+        if self._conn is not None:
+            value = await asyncio.to_thread(self._read_disk, key)
+            if value is not None:
+                self._remember(key, value)
+                self.disk_hits += 1
+                return ChatCompletion.model_validate_json(value)
+
+        self.misses += 1
+        return None
+
+    async def put(self, key: str, completion: ChatCompletion) -> None:
+        """Store a response in both tiers."""
+        value = completion.model_dump_json()
+        self._remember(key, value)
+        if self._conn is not None:
+            await asyncio.to_thread(self._write_disk, key, value)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the current memory tier size."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+
+# Process-wide cache shared by every agent that opts in
+RESPONSE_CACHE = ResponseCache()
+
+
+def cache_for(agent_name: str) -> Optional[ResponseCache]:
+    """
+    Return the shared response cache if caching is enabled for the given agent
+    (see LLM_CACHE_AGENTS), otherwise None.
+    """
+    return RESPONSE_CACHE if agent_name in LLM_CACHE_AGENTS else None
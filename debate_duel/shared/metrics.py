@@ -0,0 +1,134 @@
+"""
+In-process latency metrics for pipeline stages.
+"""
+import math
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+# Label, such as the pipeline mode, that token usage recorded in the current
+# context (and in tasks started from it) is also attributed to
+USAGE_SCOPE: ContextVar[Optional[str]] = ContextVar("usage_scope", default=None)
+
+
+@contextmanager
+def usage_scope(scope: str) -> Iterator[None]:
+    """Attribute token usage recorded inside the block to the given scope."""
+    token = USAGE_SCOPE.set(scope)
+    try:
+        yield
+    finally:
+        USAGE_SCOPE.reset(token)
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class StageMetrics:
+    """
+    Keeps the most recent latency samples per stage and summarises them as
+    percentiles.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.max_samples = max_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.max_samples))
+        self._counts: Dict[str, int] = defaultdict(int)
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record one latency sample for a stage."""
+        self._samples[stage].append(seconds)
+        self._counts[stage] += 1
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        """Time the enclosed block as one sample of the given stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - start)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Count, mean and p50/p95/p99 in seconds for every stage."""
+        summary = {}
+        for stage, samples in self._samples.items():
+            values = sorted(samples)
+            summary[stage] = {
+                "count": self._counts[stage],
+                "mean": sum(values) / len(values) if values else 0.0,
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "p99": percentile(values, 99),
+            }
+        return summary
+
+    def reset(self) -> None:
+        """Drop all samples and counters."""
+        self._samples.clear()
+        self._counts.clear()
+
+
+class TokenUsage:
+    """
+    Prompt, cached-prompt and completion token totals per agent, to track how
+    often provider-side prompt caching hits, and per usage scope.
+    """
+
+    def __init__(self):
+        self._totals: Dict[str, Dict[str, int]] = defaultdict(self._empty)
+        self._scopes: Dict[str, Dict[str, int]] = defaultdict(self._empty)
+
+    @staticmethod
+    def _empty() -> Dict[str, int]:
+        return {"calls": 0, "prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0}
+
+    def record(self, agent: str, usage: Any) -> None:
+        """Add the usage block of one completion response."""
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        scope = USAGE_SCOPE.get()
+        for totals in (self._totals[agent], self._scopes[scope] if scope else None):
+            if totals is None:
+                continue
+            totals["calls"] += 1
+            totals["prompt_tokens"] += usage.prompt_tokens or 0
+            totals["cached_tokens"] += getattr(details, "cached_tokens", None) or 0
+            totals["completion_tokens"] += usage.completion_tokens or 0
+
+    @staticmethod
+    def _summarize(totals_by_key: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, float]]:
+        summary = {}
+        for key, totals in totals_by_key.items():
+            prompt_tokens = totals["prompt_tokens"]
+            summary[key] = {
+                **totals,
+                "cached_ratio": totals["cached_tokens"] / prompt_tokens if prompt_tokens else 0.0,
+            }
+        return summary
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Totals per agent with the fraction of prompt tokens served from cache."""
+        return self._summarize(self._totals)
+
+    def scope_summary(self) -> Dict[str, Dict[str, float]]:
+        """Totals per usage scope, in the same form as summary."""
+        return self._summarize(self._scopes)
+
+    def reset(self) -> None:
+        """Drop all totals."""
+        self._totals.clear()
+        self._scopes.clear()
+
+
+# Process-wide stage metrics and token usage
+STAGE_METRICS = StageMetrics()
+TOKEN_USAGE = TokenUsage()
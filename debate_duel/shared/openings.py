@@ -0,0 +1,159 @@
+"""
+Pool of precomputed opening arguments held by a swarm service.
+
+The first round of a debate depends only on the topic and the stance, so
+for repeated or scheduled topics the openings can be generated ahead of
+time. A warm-up fills the pool for a (topic, stance) with several
+independently generated openings; a debate that asks for a pooled opening
+draws one at random and the pool generates a replacement in the
+background, so consecutive debates on a topic do not share the same
+opening.
+"""
+import asyncio
+import contextvars
+import logging
+import random
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from debate_duel.settings.constants import SWARM_OPENING_MAX_TOPICS, SWARM_OPENING_WARMUP_CONCURRENCY
+from debate_duel.shared.schemas import ArgumentRequest
+
+logger = logging.getLogger(__name__)
+
+OpeningKey = Tuple[str, str]
+
+
+class OpeningPool:
+    """
+    Precomputed opening arguments per topic and stance.
+
+    Debates do not pick a pipeline mode, so pools are not keyed by one; the
+    mode of the latest warm-up is what the pool's openings are generated with.
+    """
+
+    def __init__(
+        self,
+        generate: Callable[[ArgumentRequest], Awaitable[str]],
+        max_topics: int = SWARM_OPENING_MAX_TOPICS,
+        max_concurrency: int = SWARM_OPENING_WARMUP_CONCURRENCY
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            generate: Coroutine function producing an argument for a request
+            max_topics: Maximum number of (topic, stance) pools kept
+            max_concurrency: Maximum number of openings generated at once
+        """
+        self.generate = generate
+        self.max_topics = max(1, max_topics)
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        # Openings ready to use and the size each pool is kept topped up to
+        self._openings: "OrderedDict[OpeningKey, list[str]]" = OrderedDict()
+        self._targets: Dict[OpeningKey, int] = {}
+        # Request each pool's openings are generated from
+        self._requests: Dict[OpeningKey, ArgumentRequest] = {}
+        self._pending: Dict[OpeningKey, int] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self.failures = 0
+
+    @staticmethod
+    def _key(request: ArgumentRequest) -> OpeningKey:
+        return " ".join(request.topic.lower().split()), request.stance.value
+
+    @staticmethod
+    def is_opening(request: ArgumentRequest) -> bool:
+        """Whether a (resolved) request asks for the first argument of a debate."""
+        return not request.history and not request.history_summary
+
+    def warm(self, request: ArgumentRequest, count: int) -> int:
+        """
+        Keep count openings pooled for the request's topic and stance,
+        generating the missing ones in the background with its pipeline mode.
+
+        Args:
+            request: An opening request (its history is ignored)
+            count: Number of openings to keep ready
+
+        Returns:
+            The number of openings scheduled for generation
+        """
+        key = self._key(request)
+        self._targets[key] = count
+        self._requests[key] = ArgumentRequest(
+            topic=request.topic, stance=request.stance, pipeline_mode=request.pipeline_mode
+        )
+        self._openings.setdefault(key, [])
+        self._openings.move_to_end(key)
+        self._evict()
+        return self._top_up(key)
+
+    def draw(self, request: ArgumentRequest) -> Optional[str]:
+        """
+        Take a random pooled opening for the request and schedule its replacement.
+
+        Returns:
+            The opening, or None if none is ready
+        """
+        key = self._key(request)
+        openings = self._openings.get(key)
+        if not openings:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._openings.move_to_end(key)
+        opening = openings.pop(random.randrange(len(openings)))
+        self._top_up(key)
+        return opening
+
+    def _top_up(self, key: OpeningKey) -> int:
+        missing = self._targets.get(key, 0) - len(self._openings.get(key, ())) - self._pending.get(key, 0)
+        opening_request = self._requests.get(key)
+        for _ in range(max(0, missing)):
+            self._pending[key] = self._pending.get(key, 0) + 1
+            # Replacements outlive the request that triggered them, so they do not
+            # inherit its context (its deadline and usage scope)
+            task = asyncio.create_task(self._generate(key, opening_request), context=contextvars.Context())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return max(0, missing)
+
+    async def _generate(self, key: OpeningKey, request: ArgumentRequest) -> None:
+        try:
+            async with self._slots:
+                opening = await self.generate(request)
+        except Exception:
+            self.failures += 1
+            logger.warning("Failed to generate an opening for %r", request.topic, exc_info=True)
+            return
+        finally:
+            self._pending[key] -= 1
+            if not self._pending[key]:
+                del self._pending[key]
+        # The pool may have been evicted while the opening was generated
+        if key in self._openings:
+            self._openings[key].append(opening)
+            self.generated += 1
+
+    def _evict(self) -> None:
+        while len(self._openings) > self.max_topics:
+            key, _ = self._openings.popitem(last=False)
+            self._targets.pop(key, None)
+            self._requests.pop(key, None)
+
+    def stats(self) -> dict:
+        """Draw hits and misses, generation counters and pool sizes."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "generated": self.generated,
+            "failures": self.failures,
+            "pending": sum(self._pending.values()),
+            "pools": len(self._openings),
+            "ready": sum(len(openings) for openings in self._openings.values()),
+        }
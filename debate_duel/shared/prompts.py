@@ -0,0 +1,43 @@
+"""
+Prompt assembly that keeps the stable part of every prompt as a fixed prefix.
+
+Providers cache prompts by exact prefix, so content is laid out from most to
+least stable: the system prompt, then the topic and the frozen debate history,
+then material that changes on every call (stance, plan, drafts, ...).
+"""
+import inspect
+from typing import List
+
+
+def clean_prompt(text: str) -> str:
+    """Normalize an indented triple-quoted prompt so its bytes never vary."""
+    return inspect.cleandoc(text)
+
+
+class PromptBuilder:
+    """
+    Collects prompt sections into a stable prefix and a volatile suffix.
+
+    Stable sections are always emitted before volatile ones, whatever order
+    they were added in.
+    """
+
+    def __init__(self, topic: str):
+        self._stable: List[str] = [f"Topic: {topic}\n\n"]
+        self._volatile: List[str] = []
+
+    def stable(self, text: str) -> "PromptBuilder":
+        """Add content that is identical across calls for the same debate, e.g. history."""
+        if text:
+            self._stable.append(text)
+        return self
+
+    def volatile(self, text: str) -> "PromptBuilder":
+        """Add content that changes from call to call, e.g. stance, plan or draft."""
+        if text:
+            self._volatile.append(text)
+        return self
+
+    def build(self) -> str:
+        """Join the stable prefix and the volatile suffix into the prompt."""
+        return "".join(self._stable) + "".join(self._volatile)
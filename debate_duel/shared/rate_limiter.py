@@ -0,0 +1,338 @@
+"""
+Adaptive rate limiting for LLM calls.
+
+A RateLimiter combines a requests-per-minute and a tokens-per-minute token
+bucket with an adaptive concurrency limit. Buckets live in memory by default,
+or in a SQLite file so several processes on one host share a single budget.
+The limits are refined from the provider's rate-limit response headers, and
+concurrency is halved whenever the provider answers with a 429.
+"""
+import asyncio
+import re
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Mapping, Optional
+
+from debate_duel.settings.constants import (
+    LLM_REQUESTS_PER_MINUTE,
+    LLM_TOKENS_PER_MINUTE,
+    LLM_MAX_CONCURRENCY,
+    LLM_RATE_LIMIT_DB,
+)
+
+class TokenBucket:
+    """In-process token bucket refilled continuously at capacity per minute."""
+
+    io_bound = False
+
+    def __init__(self, capacity: float):
+        self._lock = threading.Lock()
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second."""
+        return self.capacity / 60.0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Take amount tokens if available.
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds to wait before retrying
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            self._refill()
+            if self.tokens >= amount:
+                self.tokens -= amount
+                return 0.0
+            return (amount - self.tokens) / self.rate
+
+    def adjust(self, delta: float) -> None:
+        """Add (or with a negative delta, remove) tokens, e.g. to correct an estimate."""
+        with self._lock:
+            self._refill()
+            self.tokens = min(self.capacity, self.tokens + delta)
+
+    def configure(self, capacity: Optional[float] = None, remaining: Optional[float] = None) -> None:
+        """Update the per-minute capacity and/or cap the available tokens at remaining."""
+        with self._lock:
+            self._refill()
+            if capacity:
+                self.capacity = float(capacity)
+                self.tokens = min(self.tokens, self.capacity)
+            if remaining is not None:
+                self.tokens = min(self.tokens, float(remaining))
+
+
+class SqliteTokenBucket:
+    """Token bucket stored in a SQLite file so that several processes share it."""
+
+    io_bound = True
+
+    def __init__(self, path: str, name: str, capacity: float):
+        self.name = name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "name TEXT PRIMARY KEY, capacity REAL, tokens REAL, updated REAL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO buckets (name, capacity, tokens, updated) VALUES (?, ?, ?, ?)",
+            (name, float(capacity), float(capacity), time.time())
+        )
+
+    def _transaction(self, update) -> float:
+        """Run update(capacity, tokens) -> (capacity, tokens, result) atomically across processes."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                capacity, tokens, updated = self._conn.execute(
+                    "SELECT capacity, tokens, updated FROM buckets WHERE name = ?", (self.name,)
+                ).fetchone()
+                now = time.time()
+                tokens = min(capacity, tokens + (now - updated) * capacity / 60.0)
+                capacity, tokens, result = update(capacity, tokens)
+                self._conn.execute(
+                    "UPDATE buckets SET capacity = ?, tokens = ?, updated = ? WHERE name = ?",
+                    (capacity, tokens, now, self.name)
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return result
+
+    def try_acquire(self, amount: float) -> float:
+        """
+        Take amount tokens if available.
+
+        Returns:
+            0 if the tokens were taken, otherwise the seconds to wait before retrying
+        """
+        def update(capacity, tokens):
+            needed = min(amount, capacity)
+            if tokens >= needed:
+                return capacity, tokens - needed, 0.0
+            return capacity, tokens, (needed - tokens) / (capacity / 60.0)
+
+        return self._transaction(update)
+
+    def adjust(self, delta: float) -> None:
+        """Add (or with a negative delta, remove) tokens, e.g. to correct an estimate."""
+        self._transaction(lambda capacity, tokens: (capacity, min(capacity, tokens + delta), None))
+
+    def configure(self, capacity: Optional[float] = None, remaining: Optional[float] = None) -> None:
+        """Update the per-minute capacity and/or cap the available tokens at remaining."""
+        def update(current_capacity, tokens):
+            new_capacity = float(capacity) if capacity else current_capacity
+            tokens = min(tokens, new_capacity)
+            if remaining is not None:
+                tokens = min(tokens, float(remaining))
+            return new_capacity, tokens, None
+
+        self._transaction(update)
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+def _parse_reset(value: str) -> Optional[float]:
+    """Parse a reset duration header such as '1s', '6m0s' or '250ms' into seconds."""
+    total = 0.0
+    matched = False
+    for amount, unit in re.findall(r"([\d.]+)(ms|s|m|h)", value):
+        matched = True
+        total += float(amount) * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+    return total if matched else None
+
+
+class RateLimiter:
+    """
+    Requests-per-minute and tokens-per-minute limiter with adaptive concurrency.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int = LLM_REQUESTS_PER_MINUTE,
+        tokens_per_minute: int = LLM_TOKENS_PER_MINUTE,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        db_path: Optional[str] = LLM_RATE_LIMIT_DB
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            requests_per_minute: Initial request budget per minute
+            tokens_per_minute: Initial token budget per minute
+            max_concurrency: Upper bound on concurrent calls
+            db_path: Optional SQLite file to share the budget between processes
+        """
+        if db_path:
+            self.requests = SqliteTokenBucket(db_path, "requests", requests_per_minute)
+            self.tokens = SqliteTokenBucket(db_path, "tokens", tokens_per_minute)
+        else:
+            self.requests = TokenBucket(requests_per_minute)
+            self.tokens = TokenBucket(tokens_per_minute)
+
+        self.max_concurrency = max(1, max_concurrency)
+        self.concurrency_limit = float(self.max_concurrency)
+        self.in_flight = 0
+        self._lock = threading.Lock()
+        # Callers waiting for a concurrency slot, in arrival order
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.throttled = 0
+
+    async def _acquire_from(self, bucket, amount: float) -> None:
+        while True:
+            if bucket.io_bound:
+                wait = await asyncio.to_thread(bucket.try_acquire, amount)
+            else:
+                wait = bucket.try_acquire(amount)
+            if wait <= 0:
+                return
+            await asyncio.sleep(wait)
+
+    def _dispatch(self) -> None:
+        """Hand free concurrency slots to waiters in arrival order; call with _lock held."""
+        while self._waiters and self.in_flight < int(self.concurrency_limit):
+            waiter = self._waiters.popleft()
+            self.in_flight += 1
+            waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+
+    def _release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self._dispatch()
+
+    async def _enter(self) -> None:
+        with self._lock:
+            if not self._waiters and self.in_flight < int(self.concurrency_limit):
+                self.in_flight += 1
+                return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                    raise
+            # The slot was handed over just before the cancellation; pass it on
+            self._release()
+            raise
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int) -> AsyncIterator[None]:
+        """
+        Wait for a concurrency slot and for request and token budget, then
+        hold the slot for the duration of the block. Waiters are woken in
+        arrival order whenever a slot is released or the limit grows.
+
+        Args:
+            estimated_tokens: Estimated prompt plus completion tokens for the call
+        """
+        await self._enter()
+        try:
+            await self._acquire_from(self.requests, 1)
+            await self._acquire_from(self.tokens, estimated_tokens)
+            yield
+        finally:
+            self._release()
+
+    async def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the actual usage of a call is known."""
+        delta = estimated_tokens - actual_tokens
+        if not delta:
+            return
+        if self.tokens.io_bound:
+            await asyncio.to_thread(self.tokens.adjust, delta)
+        else:
+            self.tokens.adjust(delta)
+
+    async def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """
+        Refine the buckets from x-ratelimit-* response headers and grow the
+        concurrency limit while the provider reports spare capacity.
+        """
+        def as_float(key: str) -> Optional[float]:
+            value = headers.get(key)
+            try:
+                return float(value) if value is not None else None
+            except ValueError:
+                return None
+
+        limit_requests = as_float("x-ratelimit-limit-requests")
+        remaining_requests = as_float("x-ratelimit-remaining-requests")
+        limit_tokens = as_float("x-ratelimit-limit-tokens")
+        remaining_tokens = as_float("x-ratelimit-remaining-tokens")
+
+        for bucket, capacity, remaining in (
+            (self.requests, limit_requests, remaining_requests),
+            (self.tokens, limit_tokens, remaining_tokens),
+        ):
+            if capacity is None and remaining is None:
+                continue
+            if bucket.io_bound:
+                await asyncio.to_thread(bucket.configure, capacity, remaining)
+            else:
+                bucket.configure(capacity, remaining)
+
+        # Additive increase while more than a tenth of the request budget is left
+        if not limit_requests or remaining_requests is None or remaining_requests > 0.1 * limit_requests:
+            with self._lock:
+                self.concurrency_limit = min(
+                    self.max_concurrency,
+                    self.concurrency_limit + 1 / max(1.0, self.concurrency_limit)
+                )
+                self._dispatch()
+
+    def on_rate_limited(self, headers: Optional[Mapping[str, str]] = None) -> float:
+        """
+        Halve the concurrency limit after a 429.
+
+        Returns:
+            Seconds to wait before retrying, taken from the response headers when present
+        """
+        with self._lock:
+            self.concurrency_limit = max(1.0, self.concurrency_limit / 2)
+            self.throttled += 1
+
+        headers = headers or {}
+        retry_after = headers.get("retry-after")
+        if retry_after:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+        resets = [
+            _parse_reset(headers[key])
+            for key in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens")
+            if headers.get(key)
+        ]
+        resets = [reset for reset in resets if reset is not None]
+        return max(resets) if resets else 1.0
+
+    def stats(self) -> dict:
+        """Current concurrency state and number of 429s seen."""
+        return {
+            "concurrency_limit": int(self.concurrency_limit),
+            "in_flight": self.in_flight,
+            "throttled": self.throttled,
+        }
@@ -0,0 +1,230 @@
+"""
+Research results shared between swarm processes, with near-duplicate matching.
+
+Research depends only on the topic and the point being researched, not on the
+stance, so both swarms and every round of a debate can reuse it. Points are
+matched first exactly (after normalization) and then approximately: each point
+gets a MinHash signature over character shingles, indexed with LSH bands, and a
+stored point whose estimated Jaccard similarity reaches the threshold is reused.
+Entries expire after a TTL and the least recently used ones are evicted beyond
+the size limit. Point RESEARCH_CACHE_DB at a shared file to share it between
+processes; otherwise it lives in memory for the current process.
+"""
+import asyncio
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from debate_duel.settings.constants import (
+    RESEARCH_CACHE_DB,
+    RESEARCH_CACHE_SIZE,
+    RESEARCH_CACHE_THRESHOLD,
+    RESEARCH_CACHE_TTL,
+)
+
+SHINGLE_SIZE = 4
+NUM_BANDS = 16
+BAND_ROWS = 4
+NUM_PERM = NUM_BANDS * BAND_ROWS
+
+# Universal hash parameters; seeded so signatures agree across processes
+_PRIME = (1 << 31) - 1
+_random = np.random.RandomState(20240601)
+_A = _random.randint(1, _PRIME, size=NUM_PERM).astype(np.uint64)
+_B = _random.randint(0, _PRIME, size=NUM_PERM).astype(np.uint64)
+
+# Eviction runs once every this many writes
+_EVICT_EVERY = 64
+
+
+def normalize(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace."""
+    return " ".join(re.sub(r"[^\w\s]", " ", text.lower()).split())
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """Overlapping character n-grams of normalized text."""
+    if len(text) <= size:
+        return [text]
+    return [text[i:i + size] for i in range(len(text) - size + 1)]
+
+
+def minhash(text: str) -> np.ndarray:
+    """MinHash signature of normalized text."""
+    grams = set(shingles(text))
+    hashes = np.fromiter(
+        (int.from_bytes(hashlib.blake2b(gram.encode("utf-8"), digest_size=4).digest(), "big") & _PRIME
+         for gram in grams),
+        dtype=np.uint64,
+        count=len(grams)
+    )
+    return ((np.outer(_A, hashes) + _B[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+def band_buckets(signature: np.ndarray) -> List[Tuple[int, bytes]]:
+    """LSH bucket of each band of a signature."""
+    return [
+        (band, signature[band * BAND_ROWS:(band + 1) * BAND_ROWS].tobytes())
+        for band in range(NUM_BANDS)
+    ]
+
+
+class ResearchStore:
+    """SQLite-backed research results keyed by topic and point."""
+
+    def __init__(
+        self,
+        db_path: Optional[str] = RESEARCH_CACHE_DB,
+        max_entries: int = RESEARCH_CACHE_SIZE,
+        ttl: float = RESEARCH_CACHE_TTL,
+        threshold: float = RESEARCH_CACHE_THRESHOLD
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: SQLite file shared between processes, or None for a private in-memory store
+            max_entries: Maximum number of research results kept (0 disables the store)
+            ttl: Seconds a research result stays valid
+            threshold: Minimum estimated similarity for a near-duplicate point to match
+        """
+        self.enabled = max_entries > 0
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.threshold = threshold
+        self._lock = threading.Lock()
+        self._writes = 0
+
+        self._conn = sqlite3.connect(db_path or ":memory:", check_same_thread=False, timeout=30)
+        if db_path:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS research ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, key TEXT NOT NULL UNIQUE, topic TEXT NOT NULL, "
+            "point TEXT NOT NULL, signature BLOB NOT NULL, result TEXT NOT NULL, "
+            "created REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS research_bands ("
+            "topic TEXT NOT NULL, band INTEGER NOT NULL, bucket BLOB NOT NULL, entry_id INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS research_last_used ON research (last_used)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS research_bands_lookup ON research_bands (topic, band, bucket)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS research_bands_entry ON research_bands (entry_id)")
+        self._conn.commit()
+
+        self.exact_hits = 0
+        self.near_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _key(topic: str, point: str) -> str:
+        return hashlib.sha256(f"{topic}\n{point}".encode("utf-8")).hexdigest()
+
+    def _touch(self, entry_id: int, now: float) -> None:
+        self._conn.execute("UPDATE research SET last_used = ? WHERE id = ?", (now, entry_id))
+        self._conn.commit()
+
+    def _lookup(self, topic: str, point: str) -> Optional[str]:
+        topic, point = normalize(topic), normalize(point)
+        now = time.time()
+        oldest = now - self.ttl
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, result FROM research WHERE key = ? AND created >= ?",
+                (self._key(topic, point), oldest)
+            ).fetchone()
+            if row:
+                self._touch(row[0], now)
+                self.exact_hits += 1
+                return row[1]
+
+            signature = minhash(point)
+            candidates = set()
+            for band, bucket in band_buckets(signature):
+                candidates.update(entry_id for (entry_id,) in self._conn.execute(
+                    "SELECT entry_id FROM research_bands WHERE topic = ? AND band = ? AND bucket = ?",
+                    (topic, band, bucket)
+                ))
+
+            best = None
+            if candidates:
+                placeholders = ", ".join("?" * len(candidates))
+                for entry_id, stored, result in self._conn.execute(
+                    f"SELECT id, signature, result FROM research WHERE id IN ({placeholders}) AND created >= ?",
+                    (*candidates, oldest)
+                ):
+                    similarity = float(np.mean(signature == np.frombuffer(stored, dtype=np.uint32)))
+                    if similarity >= self.threshold and (best is None or similarity > best[0]):
+                        best = (similarity, entry_id, result)
+
+            if best is None:
+                self.misses += 1
+                return None
+            self._touch(best[1], now)
+            self.near_hits += 1
+            return best[2]
+
+    def _put(self, topic: str, point: str, result: str) -> None:
+        topic, point = normalize(topic), normalize(point)
+        key = self._key(topic, point)
+        now = time.time()
+        with self._lock, self._conn:
+            updated = self._conn.execute(
+                "UPDATE research SET result = ?, created = ?, last_used = ? WHERE key = ?",
+                (result, now, now, key)
+            ).rowcount
+            if not updated:
+                signature = minhash(point)
+                entry_id = self._conn.execute(
+                    "INSERT INTO research (key, topic, point, signature, result, created, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, topic, point, signature.tobytes(), result, now, now)
+                ).lastrowid
+                self._conn.executemany(
+                    "INSERT INTO research_bands (topic, band, bucket, entry_id) VALUES (?, ?, ?, ?)",
+                    [(topic, band, bucket, entry_id) for band, bucket in band_buckets(signature)]
+                )
+
+            self._writes += 1
+            if self._writes % _EVICT_EVERY == 0:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries and the least recently used ones beyond max_entries."""
+        self._conn.execute(
+            "DELETE FROM research WHERE created < ? OR id IN ("
+            "SELECT id FROM research ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (now - self.ttl, self.max_entries)
+        )
+        self._conn.execute("DELETE FROM research_bands WHERE entry_id NOT IN (SELECT id FROM research)")
+
+    async def lookup(self, topic: str, point: str) -> Optional[str]:
+        """Research stored for this point, or for a near-duplicate of it, on the same topic."""
+        if not self.enabled:
+            return None
+        return await asyncio.to_thread(self._lookup, topic, point)
+
+    async def put(self, topic: str, point: str, result: str) -> None:
+        """Store the research for a point."""
+        if self.enabled:
+            await asyncio.to_thread(self._put, topic, point, result)
+
+    def stats(self) -> dict:
+        """Exact and near-duplicate hits and misses."""
+        lookups = self.exact_hits + self.near_hits + self.misses
+        return {
+            "exact_hits": self.exact_hits,
+            "near_hits": self.near_hits,
+            "misses": self.misses,
+            "hit_rate": (self.exact_hits + self.near_hits) / lookups if lookups else 0.0,
+        }
+
+
+# Process-wide research store
+RESEARCH_STORE = ResearchStore()
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class Stance(str, Enum):
@@ -8,6 +8,15 @@ class Stance(str, Enum):
     CON = "con"
 
 
+class PipelineMode(str, Enum):
+    # Plan, strategy and writing only
+    FAST = "fast"
+    # Adds research
+    BALANCED = "balanced"
+    # Adds research and verification
+    FULL = "full"
+
+
 class Winner(str, Enum):
     PRO = "pro"
     CON = "con"
@@ -17,23 +26,78 @@ class Winner(str, Enum):
 class TopicRequest(BaseModel):
     topic: str
     num_turns: int = 3
+    # Keep this many recent rounds verbatim in prompts and fold older rounds
+    # into a running summary; None keeps the full history
+    memory_window: Optional[int] = Field(default=None, ge=0)
+    # Forward argument tokens as "token" events on the streaming endpoint
+    stream_tokens: bool = False
+    # Judges voting on each round; None uses the judge service's default
+    judge_panel_size: Optional[int] = Field(default=None, ge=1)
+    # Start the next turn's planning and research while the judge is running
+    speculative: bool = False
+    # Draw the opening arguments from the swarms' warmed-up pools when available
+    use_opening_pool: bool = False
+    # Seconds the whole debate may take (None uses ARENA_DEBATE_DEADLINE); the
+    # services cut optional stages to meet it, and rounds that still cannot
+    # be finished in time are dropped
+    deadline_seconds: Optional[float] = Field(default=None, gt=0)
 
 
 class ArgumentRequest(BaseModel):
     topic: str
     stance: Stance
     history: List["Turn"] = []
+    memory_window: Optional[int] = Field(default=None, ge=0)
+    # Summary of the rounds before the memory window
+    history_summary: Optional[str] = None
+    # Session the swarm keeps the history in between turns; history then holds
+    # only the turns from history_offset on
+    debate_id: Optional[str] = None
+    history_offset: int = Field(default=0, ge=0)
+    # Stages the team pipeline runs; None uses the swarm's SWARM_PIPELINE_MODE
+    pipeline_mode: Optional[PipelineMode] = None
+    # For the first argument of a debate, use a pooled opening if one is ready
+    use_opening_pool: bool = False
+
+
+class WarmupRequest(BaseModel):
+    topic: str
+    # Openings to keep ready per stance
+    count: int = Field(default=4, ge=0, le=64)
+    # Only this stance; None warms up both
+    stance: Optional[Stance] = None
+    pipeline_mode: Optional[PipelineMode] = None
 
 
 class JudgeRequest(BaseModel):
     topic: str
     pro_argument: str
     con_argument: str
+    # Judges on the panel; None uses the judge service's JUDGE_PANEL_SIZE
+    panel_size: Optional[int] = Field(default=None, ge=1)
 
 
 class JudgeResponse(BaseModel):
     winner: Winner
     justification: str
+    # Share of the panel's votes cast for the winner, and the vote count per
+    # outcome; None for a single judge
+    confidence: Optional[float] = None
+    votes: Optional[dict] = None
+
+
+class JudgeBatchRequest(BaseModel):
+    requests: List[JudgeRequest]
+
+
+class JudgeBatchItem(BaseModel):
+    # Exactly one of response and error is set
+    response: Optional[JudgeResponse] = None
+    error: Optional[str] = None
+
+
+class JudgeBatchResponse(BaseModel):
+    results: List[JudgeBatchItem]
 
 
 class Turn(BaseModel):
@@ -43,6 +107,7 @@ class Turn(BaseModel):
 
 
 class DebateResult(BaseModel):
+    debate_id: Optional[str] = None
     topic: str
     turns: List[Turn]
     final_winner: Winner
@@ -51,5 +116,58 @@ class DebateResult(BaseModel):
     elo_trajectory: List[dict]
 
 
+class DebateSummary(BaseModel):
+    # Pass as ?cursor= to list the debates after this one
+    cursor: int
+    debate_id: str
+    topic: str
+    num_turns: int
+    final_winner: Winner
+    final_elo: dict
+    # Unix time the debate was stored
+    created: float
+
+
+class DebatePage(BaseModel):
+    debates: List[DebateSummary]
+    next_cursor: Optional[int] = None
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    # Agent identity and side, e.g. "swarm_a@pro"
+    player: str
+    rating: float
+    games: int
+    wins: int
+    draws: int
+    losses: int
+
+
+class DebateEvent(BaseModel):
+    # One of: token, argument, judge, elo, result, error
+    event: str
+    turn: Optional[int] = None
+    stance: Optional[Stance] = None
+    content: Optional[str] = None
+    judge_decision: Optional[JudgeResponse] = None
+    elo: Optional[dict] = None
+    result: Optional[DebateResult] = None
+    error: Optional[str] = None
+
+
+class TournamentRequest(BaseModel):
+    debates: List[TopicRequest]
+    # Debates of this tournament run at once; None leaves only the arena-wide limit
+    max_concurrency: Optional[int] = Field(default=None, ge=1)
+
+
+class TournamentEntry(BaseModel):
+    index: int
+    topic: str
+    result: Optional[DebateResult] = None
+    error: Optional[str] = None
+
+
 # Resolve forward references
 ArgumentRequest.model_rebuild() 
\ No newline at end of file
@@ -0,0 +1,108 @@
+"""
+Per-debate history held by the swarm services between turns.
+
+With a session the arena only sends the turns a swarm has not seen yet
+instead of re-posting the whole debate every turn. Sessions are bounded in
+number and expire after a period of inactivity; when one has been evicted
+the swarm answers 409 and the arena falls back to sending the full history.
+"""
+import time
+from collections import OrderedDict
+from typing import List, Optional
+
+from debate_duel.settings.constants import SWARM_MAX_SESSIONS, SWARM_SESSION_TTL
+from debate_duel.shared.schemas import ArgumentRequest, Turn
+
+
+class SessionMiss(Exception):
+    """The request continues a session this process no longer holds."""
+
+
+class SessionStore:
+    """LRU store of debate histories with an idle timeout."""
+
+    def __init__(self, max_sessions: int = SWARM_MAX_SESSIONS, ttl: float = SWARM_SESSION_TTL):
+        """
+        Initialize the store.
+
+        Args:
+            max_sessions: Maximum number of sessions kept
+            ttl: Seconds of inactivity after which a session is dropped
+        """
+        self.max_sessions = max(1, max_sessions)
+        self.ttl = ttl
+        self._sessions: "OrderedDict[str, tuple[float, List[Turn]]]" = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _evict(self, now: float) -> None:
+        # Entries are ordered by last use, so expired ones sit at the front
+        while self._sessions:
+            key, (expires, _) = next(iter(self._sessions.items()))
+            if expires > now and len(self._sessions) <= self.max_sessions:
+                break
+            del self._sessions[key]
+
+    def get(self, key: str) -> Optional[List[Turn]]:
+        """Return the history of a live session, or None."""
+        now = time.monotonic()
+        self._evict(now)
+        entry = self._sessions.get(key)
+        if entry is None:
+            return None
+        self._sessions.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, history: List[Turn]) -> None:
+        """Store the history of a session and refresh its timeout."""
+        now = time.monotonic()
+        self._sessions[key] = (now + self.ttl, history)
+        self._sessions.move_to_end(key)
+        self._evict(now)
+
+    def resolve(self, request: ArgumentRequest, record: bool = True) -> ArgumentRequest:
+        """
+        Expand a delta request into one carrying the full history and record it.
+
+        Args:
+            request: An argument request, possibly holding only the turns from
+                history_offset on
+            record: Store the expanded history as the session's new state; off
+                for speculative requests whose latest round is still provisional
+
+        Returns:
+            The request with the complete history
+
+        Raises:
+            SessionMiss: If the session is unknown or out of step with the offset
+        """
+        if request.debate_id is None:
+            return request
+
+        key = f"{request.debate_id}:{request.stance.value}"
+        if request.history_offset == 0:
+            history = list(request.history)
+        else:
+            stored = self.get(key)
+            if stored is None or len(stored) != request.history_offset:
+                self.misses += 1
+                raise SessionMiss(f"No session for debate {request.debate_id} at turn {request.history_offset}")
+            self.hits += 1
+            history = stored + request.history
+
+        if record:
+            self.put(key, history)
+        return request.model_copy(update={"history": history, "history_offset": 0})
+
+    def stats(self) -> dict:
+        """Hit/miss counters and the number of live sessions."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "sessions": len(self._sessions),
+        }
+
+
+# Process-wide session store of a swarm service
+SESSION_STORE = SessionStore()
@@ -6,16 +6,17 @@ import asyncio
 import json
 import httpx
 import argparse
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 
-async def run_debate(topic: str, num_turns: int) -> Dict[str, Any]:
+async def run_debate(topic: str, num_turns: int, memory_window: Optional[int] = None) -> Dict[str, Any]:
     """
     Run a debate using the Debate Duel API.
     
     Args:
         topic: The debate topic
         num_turns: Number of debate turns
+        memory_window: Recent rounds kept verbatim in prompts (older ones are summarized)
         
     Returns:
         The full debate result
@@ -24,7 +25,8 @@ async def run_debate(topic: str, num_turns: int) -> Dict[str, Any]:
         url = "http://localhost:8000/debate"
         payload = {
             "topic": topic,
-            "num_turns": num_turns
+            "num_turns": num_turns,
+            "memory_window": memory_window
         }
         
         response = await client.post(url, json=payload)
@@ -33,6 +35,57 @@ async def run_debate(topic: str, num_turns: int) -> Dict[str, Any]:
         return response.json()
 
 
+async def stream_debate(
+    topic: str,
+    num_turns: int,
+    memory_window: Optional[int] = None,
+    tokens: bool = False
+) -> Dict[str, Any]:
+    """
+    Run a debate using the streaming endpoint, printing progress as it happens.
+    
+    Args:
+        topic: The debate topic
+        num_turns: Number of debate turns
+        memory_window: Recent rounds kept verbatim in prompts (older ones are summarized)
+        tokens: Print argument tokens as the swarms produce them
+        
+    Returns:
+        The full debate result
+    """
+    async with httpx.AsyncClient(timeout=httpx.Timeout(60.0, read=None)) as client:
+        url = "http://localhost:8000/debate/stream"
+        payload = {
+            "topic": topic,
+            "num_turns": num_turns,
+            "memory_window": memory_window,
+            "stream_tokens": tokens
+        }
+        
+        async with client.stream("POST", url, json=payload) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data: "):
+                    continue
+                event = json.loads(line[len("data: "):])
+                
+                if event["event"] == "token":
+                    print(event["content"], end="", flush=True)
+                elif event["event"] == "argument":
+                    print(f"[round {event['turn']}] {event['stance'].upper()} argument received "
+                          f"({len(event['content'])} chars)")
+                elif event["event"] == "judge":
+                    print(f"[round {event['turn']}] judge: {event['judge_decision']['winner'].upper()}")
+                elif event["event"] == "elo":
+                    print(f"[round {event['turn']}] ELO - Pro: {event['elo']['pro']}, Con: {event['elo']['con']}")
+                elif event["event"] == "result":
+                    return event["result"]
+                elif event["event"] == "error":
+                    raise RuntimeError(event["error"])
+    
+    raise RuntimeError("Stream ended without a result")
+
+
 def display_debate(result: Dict[str, Any]) -> None:
     """
     Display the debate results in a readable format.
@@ -81,6 +134,12 @@ async def main() -> None:
                       help="The debate topic")
     parser.add_argument("--turns", type=int, default=2,
                       help="Number of debate turns")
+    parser.add_argument("--memory-window", type=int,
+                      help="Recent rounds kept verbatim in prompts; older rounds are summarized (optional)")
+    parser.add_argument("--stream", action="store_true",
+                      help="Stream progress from the arena while the debate runs")
+    parser.add_argument("--tokens", action="store_true",
+                      help="With --stream, print argument tokens as they are generated")
     parser.add_argument("--output", type=str, 
                       help="Output file to save the JSON results (optional)")
     
@@ -90,7 +149,10 @@ async def main() -> None:
     print(f"Number of turns: {args.turns}")
     print("This may take a few minutes depending on the response time of the LLM...\n")
     
-    result = await run_debate(args.topic, args.turns)
+    if args.stream:
+        result = await stream_debate(args.topic, args.turns, args.memory_window, args.tokens)
+    else:
+        result = await run_debate(args.topic, args.turns, args.memory_window)
     
     # Save to file if specified
     if args.output:
@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+"""
+Example tournament client for the Debate Duel API.
+"""
+import asyncio
+import json
+import httpx
+import argparse
+from typing import List, Optional
+
+
+async def run_tournament(
+    topics: List[str],
+    num_turns: int,
+    max_concurrency: Optional[int] = None,
+    output: Optional[str] = None,
+    url: str = "http://localhost:8000/tournament",
+    use_opening_pool: bool = False
+) -> None:
+    """
+    Run a tournament using the Debate Duel API, printing each debate as it finishes.
+
+    Args:
+        topics: The debate topics
+        num_turns: Number of turns for every debate
+        max_concurrency: Optional cap on debates run at once for this tournament
+        output: Optional JSONL file to append each finished debate to
+        url: The arena tournament endpoint
+        use_opening_pool: Take the opening round from the swarms' warmed-up pools
+    """
+    payload = {
+        "debates": [
+            {"topic": topic, "num_turns": num_turns, "use_opening_pool": use_opening_pool}
+            for topic in topics
+        ],
+        "max_concurrency": max_concurrency
+    }
+
+    out_file = open(output, "a") if output else None
+    finished = 0
+    try:
+        async with httpx.AsyncClient(timeout=None) as client:
+            async with client.stream("POST", url, json=payload) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line:
+                        continue
+                    entry = json.loads(line)
+                    finished += 1
+
+                    if entry.get("error"):
+                        status = f"ERROR: {entry['error']}"
+                    else:
+                        status = f"winner: {entry['result']['final_winner'].upper()}"
+                    print(f"[{finished}/{len(topics)}] {entry['topic']} - {status}")
+
+                    if out_file:
+                        out_file.write(line + "\n")
+                        out_file.flush()
+    finally:
+        if out_file:
+            out_file.close()
+
+
+def load_topics(topics: List[str], topics_file: Optional[str]) -> List[str]:
+    """
+    Combine topics given on the command line with those in a file (one per line).
+    """
+    all_topics = list(topics)
+    if topics_file:
+        with open(topics_file) as f:
+            all_topics.extend(line.strip() for line in f if line.strip())
+    return all_topics
+
+
+async def main() -> None:
+    """Main function to parse arguments and run the tournament."""
+    parser = argparse.ArgumentParser(description="Run a tournament of debates using the Debate Duel API")
+    parser.add_argument("--topic", type=str, action="append", default=[],
+                      help="A debate topic (may be given multiple times)")
+    parser.add_argument("--topics-file", type=str,
+                      help="File with one debate topic per line")
+    parser.add_argument("--turns", type=int, default=2,
+                      help="Number of turns per debate")
+    parser.add_argument("--max-concurrency", type=int,
+                      help="Maximum number of debates to run at once (optional)")
+    parser.add_argument("--output", type=str,
+                      help="JSONL file to append finished debates to (optional)")
+    parser.add_argument("--url", type=str, default="http://localhost:8000/tournament",
+                      help="Arena tournament endpoint")
+    parser.add_argument("--opening-pool", action="store_true",
+                      help="Use openings precomputed with examples.warmup when available")
+
+    args = parser.parse_args()
+
+    topics = load_topics(args.topic, args.topics_file)
+    if not topics:
+        parser.error("provide at least one --topic or a --topics-file")
+
+    print(f"Running tournament with {len(topics)} debates of {args.turns} turns each\n")
+
+    await run_tournament(topics, args.turns, args.max_concurrency, args.output, args.url, args.opening_pool)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
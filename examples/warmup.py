@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+"""
+Example warm-up client for the Debate Duel API.
+"""
+import asyncio
+import httpx
+import argparse
+from typing import List, Optional
+
+from examples.tournament import load_topics
+
+
+async def warm_up(
+    topics: List[str],
+    count: int,
+    pipeline_mode: Optional[str] = None,
+    url: str = "http://localhost:8000/warmup"
+) -> None:
+    """
+    Ask the arena to precompute opening arguments for each topic.
+
+    Args:
+        topics: The debate topics
+        count: Openings to keep ready per topic and stance
+        pipeline_mode: Optional team pipeline mode the openings are generated with
+        url: The arena warm-up endpoint
+    """
+    async with httpx.AsyncClient(timeout=60.0) as client:
+        for topic in topics:
+            payload = {"topic": topic, "count": count, "pipeline_mode": pipeline_mode}
+            response = await client.post(url, json=payload)
+            response.raise_for_status()
+            scheduled = response.json()["scheduled"]
+            print(f"{topic} - scheduled " + ", ".join(f"{n} {stance.upper()}" for stance, n in scheduled.items()))
+
+
+async def main() -> None:
+    """Main function to parse arguments and warm up the opening pools."""
+    parser = argparse.ArgumentParser(description="Precompute opening arguments using the Debate Duel API")
+    parser.add_argument("--topic", type=str, action="append", default=[],
+                      help="A debate topic (may be given multiple times)")
+    parser.add_argument("--topics-file", type=str,
+                      help="File with one debate topic per line")
+    parser.add_argument("--count", type=int, default=4,
+                      help="Openings to keep ready per topic and stance")
+    parser.add_argument("--pipeline-mode", choices=["fast", "balanced", "full"],
+                      help="Team pipeline mode to generate the openings with (optional)")
+    parser.add_argument("--url", type=str, default="http://localhost:8000/warmup",
+                      help="Arena warm-up endpoint")
+
+    args = parser.parse_args()
+
+    topics = load_topics(args.topic, args.topics_file)
+    if not topics:
+        parser.error("provide at least one --topic or a --topics-file")
+
+    await warm_up(topics, args.count, args.pipeline_mode, args.url)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,4 @@
+import os
+
+# The settings module builds the OpenAI clients at import time
+os.environ.setdefault("OPENAI_API_KEY", "test")
@@ -0,0 +1,14 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from debate_duel.arena.api import app
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_tournament_rejects_non_positive_max_concurrency(max_concurrency):
+    client = TestClient(app)
+    response = client.post(
+        "/tournament",
+        json={"debates": [{"topic": "Cats are better than dogs"}], "max_concurrency": max_concurrency}
+    )
+    assert response.status_code == 422
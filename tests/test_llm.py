@@ -0,0 +1,79 @@
+import asyncio
+import json
+
+import httpx
+import openai
+
+from debate_duel.shared import llm
+
+COMPLETION = {
+    "id": "chatcmpl-test",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "gpt-4o-mini",
+    "choices": [
+        {"index": 0, "message": {"role": "assistant", "content": "Hello"}, "finish_reason": "stop"}
+    ],
+    "usage": {"prompt_tokens": 5, "completion_tokens": 1, "total_tokens": 6},
+}
+
+
+def stream_body() -> str:
+    chunks = [
+        {"choices": [{"index": 0, "delta": {"content": "Hel"}, "finish_reason": None}]},
+        {"choices": [{"index": 0, "delta": {"content": "lo"}, "finish_reason": "stop"}]},
+    ]
+    lines = [
+        "data: " + json.dumps({"id": "chatcmpl-test", "object": "chat.completion.chunk", "created": 0,
+                               "model": "gpt-4o-mini", **chunk})
+        for chunk in chunks
+    ]
+    return "\n\n".join(lines + ["data: [DONE]"]) + "\n\n"
+
+
+def flaky_client(ok_response) -> tuple:
+    """A client whose first call gets a 500 and later calls ok_response()."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(500, json={"error": {"message": "boom", "type": "server_error"}})
+        return ok_response()
+
+    client = openai.AsyncOpenAI(
+        api_key="test",
+        base_url="http://llm.test/v1",
+        max_retries=0,
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    return client, calls
+
+
+def test_create_chat_completion_retries_server_error(monkeypatch):
+    monkeypatch.setattr(llm, "LLM_RETRY_BACKOFF", 0.0)
+    client, calls = flaky_client(lambda: httpx.Response(200, json=COMPLETION))
+
+    completion = asyncio.run(llm.create_chat_completion(
+        client, model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}]
+    ))
+
+    assert completion.choices[0].message.content == "Hello"
+    assert len(calls) == 2
+
+
+def test_stream_chat_completion_retries_server_error(monkeypatch):
+    monkeypatch.setattr(llm, "LLM_RETRY_BACKOFF", 0.0)
+    client, calls = flaky_client(
+        lambda: httpx.Response(200, text=stream_body(), headers={"content-type": "text/event-stream"})
+    )
+
+    async def collect():
+        return [
+            delta async for delta in llm.stream_chat_completion(
+                client, model="gpt-4o-mini", messages=[{"role": "user", "content": "Hi"}]
+            )
+        ]
+
+    assert "".join(asyncio.run(collect())) == "Hello"
+    assert len(calls) == 2
@@ -0,0 +1,51 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from debate_duel.arena.orchestrator import DebateOrchestrator
+from debate_duel.shared.schemas import TopicRequest
+
+JUDGE_RESPONSE = {"winner": "pro", "justification": "Stronger evidence"}
+
+
+def swarm_client(stream: bool) -> httpx.AsyncClient:
+    """Services whose swarms answer the first turn and run out of time on the second."""
+    arguments = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/judge":
+            return httpx.Response(200, json=JUDGE_RESPONSE)
+        body = json.loads(request.content)
+        turn = arguments[body["stance"]] = arguments.get(body["stance"], 0) + 1
+        if stream:
+            if turn == 1:
+                lines = [{"delta": f"{body['stance']} opening"}, {"done": True}]
+            else:
+                lines = [{"error": "Error generating argument: The deadline has passed", "deadline": True}]
+            return httpx.Response(200, text="".join(json.dumps(line) + "\n" for line in lines))
+        if turn == 1:
+            return httpx.Response(200, json={"content": f"{body['stance']} opening"})
+        return httpx.Response(504, json={"detail": "Error generating argument: The deadline has passed"})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize("stream_tokens", [False, True])
+def test_debate_out_of_time_keeps_finished_rounds(stream_tokens):
+    async def run():
+        client = swarm_client(stream_tokens)
+        try:
+            orchestrator = DebateOrchestrator(client=client)
+            return await orchestrator.run_debate(
+                TopicRequest(topic="Cats are better than dogs", num_turns=3,
+                             stream_tokens=stream_tokens, deadline_seconds=60)
+            )
+        finally:
+            await client.aclose()
+
+    result = asyncio.run(run())
+
+    assert len(result.turns) == 1
+    assert result.turns[0].pro_argument == "pro opening"
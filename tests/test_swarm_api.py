@@ -0,0 +1,38 @@
+import asyncio
+import json
+import time
+
+import pytest
+
+from debate_duel.agents import swarm_api
+from debate_duel.agents.swarm import DebateAgent
+from debate_duel.shared.deadlines import DeadlineExceeded, deadline_scope
+from debate_duel.shared.schemas import ArgumentRequest, Stance
+
+
+def test_stream_reports_deadline_distinctly(monkeypatch):
+    async def out_of_time(request):
+        yield "Partial"
+        raise DeadlineExceeded("The deadline passed before the work was finished")
+
+    monkeypatch.setattr(swarm_api.swarm_agent, "stream_argument", out_of_time)
+
+    async def collect():
+        request = ArgumentRequest(topic="Cats are better than dogs", stance=Stance.PRO)
+        return [json.loads(line) async for line in swarm_api.stream_argument(request)]
+
+    lines = asyncio.run(collect())
+
+    assert lines[0] == {"delta": "Partial"}
+    assert lines[-1]["deadline"] is True
+    assert "error" in lines[-1]
+
+
+def test_debate_agent_stream_gives_up_after_deadline():
+    async def collect():
+        request = ArgumentRequest(topic="Cats are better than dogs", stance=Stance.PRO)
+        with deadline_scope(time.time() - 1):
+            return [delta async for delta in DebateAgent().stream_argument(request)]
+
+    with pytest.raises(DeadlineExceeded):
+        asyncio.run(collect())